@@ -0,0 +1,678 @@
+#!/usr/bin/env python3
+# scripts/fake_volumio.py
+"""
+Stand-in Volumio server for integration runs and load benchmarks.
+
+Serves the parts of Volumio that Quadify talks to:
+  * socket.io: getState, browseLibrary, replaceAndPlay, addToQueue,
+    play/pause/toggle/stop/next/prev/seek, setRandom/setRepeat, volume,
+    playPlaylist -> pushState / pushTrack / pushBrowseLibrary
+  * REST: /api/v1/browse, /api/v1/getState, /api/v1/commands,
+    /api/v1/replaceAndPlay, /api/v1/addToQueue
+
+The music library is synthetic and deterministic (--seed). Player state can be
+pushed at a fixed rate, tracks can auto-advance, and latency / disconnects can
+be injected to exercise reconnect and back-pressure paths.
+
+Needs aiohttp and the same python-socketio release as requirements.txt (so the
+socket.io protocol version matches the client).
+
+Examples:
+  python scripts/fake_volumio.py --port 3000 --albums 20000
+  python scripts/fake_volumio.py --state-rate 50 --latency-ms 40 --jitter-ms 20
+  python scripts/fake_volumio.py --disconnect-every 30 --outage 5
+
+Point Quadify at it with `volumio: {host, port}` in config.yaml and
+`display: device: dummy` to run without a panel; see scripts/volumio_bench.py.
+"""
+
+import argparse
+import asyncio
+import logging
+import random
+import time
+from urllib.parse import quote, unquote
+
+import socketio
+from aiohttp import web
+
+logger = logging.getLogger("FakeVolumio")
+
+LIBRARY_ROOT = "music-library/FAKE"
+
+
+# ----------------------------------------------------------------------
+#   Synthetic library
+# ----------------------------------------------------------------------
+class SyntheticLibrary:
+    """Artists -> albums -> tracks, generated up front from a seed."""
+
+    def __init__(self, albums=500, artists=None, tracks_per_album=10, radios=25, seed=1):
+        rng = random.Random(seed)
+        artists = artists or max(1, albums // 4)
+        self.artists = [f"Artist {i:05d}" for i in range(artists)]
+        self.albums = []            # list of album dicts (with tracks)
+        self.by_uri = {}            # album uri / alias uri -> album
+        self.albums_by_artist = {a: [] for a in self.artists}
+        self.tracks_by_uri = {}
+
+        for i in range(albums):
+            artist = self.artists[i % artists]
+            title = f"Album {i:05d}"
+            uri = f"{LIBRARY_ROOT}/{artist}/{title}"
+            album = {
+                "title": title,
+                "artist": artist,
+                "uri": uri,
+                "albumart": f"/albumart?path={quote(uri)}",
+                "tracks": [],
+            }
+            for n in range(1, tracks_per_album + 1):
+                track = {
+                    "service": "mpd",
+                    "type": "song",
+                    "title": f"Track {n:02d}",
+                    "artist": artist,
+                    "album": title,
+                    "uri": f"{uri}/{n:02d} Track {n:02d}.flac",
+                    "albumart": album["albumart"],
+                    "duration": rng.randint(120, 420),
+                    "tracknumber": n,
+                    "trackType": "flac",
+                }
+                album["tracks"].append(track)
+                self.tracks_by_uri[track["uri"]] = track
+            self.albums.append(album)
+            self.albums_by_artist[artist].append(album)
+            self.by_uri[uri] = album
+            self.by_uri[f"albums://{quote(artist)}/{quote(title)}"] = album
+
+        self.radios = [{
+            "service": "webradio",
+            "type": "webradio",
+            "title": f"Radio {i:03d}",
+            "uri": f"http://radio.invalid/stream{i:03d}",
+            "albumart": "/albumart?sourceicon=music_service/webradio/icon.png",
+        } for i in range(radios)]
+
+    # -------- browse --------
+    def sources(self):
+        icon = "/albumart?sourceicon=music_service/{}/icon.png"
+        return [
+            {"name": "Music Library", "uri": "music-library", "plugin_type": "music_service",
+             "plugin_name": "mpd", "albumart": icon.format("mpd")},
+            {"name": "Artists", "uri": "artists://", "plugin_type": "music_service",
+             "plugin_name": "mpd", "albumart": icon.format("mpd")},
+            {"name": "Albums", "uri": "albums://", "plugin_type": "music_service",
+             "plugin_name": "mpd", "albumart": icon.format("mpd")},
+            {"name": "Web Radio", "uri": "radio", "plugin_type": "music_service",
+             "plugin_name": "webradio", "albumart": icon.format("webradio")},
+            {"name": "Playlists", "uri": "playlists", "plugin_type": "music_service",
+             "plugin_name": "playlists", "albumart": icon.format("playlists")},
+        ]
+
+    @staticmethod
+    def _folder(title, uri, **extra):
+        return {"service": "mpd", "type": "folder", "title": title, "uri": uri, **extra}
+
+    def _album_row(self, album, uri=None):
+        return self._folder(album["title"], uri or album["uri"],
+                            artist=album["artist"], albumart=album["albumart"])
+
+    def browse(self, uri):
+        """Return a Volumio-shaped browse payload for `uri`."""
+        uri = (uri or "").strip()
+        if uri not in ("artists://", "albums://"):
+            uri = uri.rstrip("/")
+        prev = ""
+        items = None
+
+        if uri in ("", "/"):
+            return {"navigation": {"lists": self.sources()}}
+        if uri == "music-library":
+            items = [self._folder("FAKE", LIBRARY_ROOT)]
+        elif uri == LIBRARY_ROOT:
+            prev = "music-library"
+            items = [self._folder(a, f"{LIBRARY_ROOT}/{a}") for a in self.artists]
+        elif uri.startswith(LIBRARY_ROOT + "/") and uri.count("/") == 2:
+            prev = LIBRARY_ROOT
+            artist = uri.rsplit("/", 1)[1]
+            items = [self._album_row(al) for al in self.albums_by_artist.get(artist, [])]
+        elif uri == "artists://":
+            items = [self._folder(a, f"artists://{quote(a)}") for a in self.artists]
+        elif uri.startswith("artists://"):
+            prev = "artists://"
+            artist = unquote(uri[len("artists://"):])
+            items = [self._album_row(al, f"albums://{quote(al['artist'])}/{quote(al['title'])}")
+                     for al in self.albums_by_artist.get(artist, [])]
+        elif uri == "albums://":
+            items = [self._album_row(al, f"albums://{quote(al['artist'])}/{quote(al['title'])}")
+                     for al in self.albums]
+        elif uri in self.by_uri:
+            album = self.by_uri[uri]
+            prev = "albums://" if uri.startswith("albums://") else album["uri"].rsplit("/", 1)[0]
+            items = [dict(t) for t in album["tracks"]]
+        elif uri == "radio":
+            items = list(self.radios)
+        elif uri == "playlists":
+            items = [{"service": "mpd", "type": "playlist", "title": "Fake Mix",
+                      "uri": "playlists/Fake Mix"}]
+
+        if items is None:
+            return {"navigation": {"prev": {"uri": ""}, "lists": []}, "uri": uri}
+        return {
+            "navigation": {
+                "prev": {"uri": prev},
+                "lists": [{"availableListViews": ["list", "grid"], "items": items}],
+            },
+            "uri": uri,
+        }
+
+    def expand(self, uri):
+        """Tracks for a playable uri: a track, an album folder, or a radio stream."""
+        if uri in self.tracks_by_uri:
+            return [self.tracks_by_uri[uri]]
+        if uri in self.by_uri:
+            return list(self.by_uri[uri]["tracks"])
+        if uri.startswith("playlists/"):
+            return [t for al in self.albums[:3] for t in al["tracks"]]
+        for radio in self.radios:
+            if radio["uri"] == uri:
+                return [dict(radio, duration=0, trackType="webradio")]
+        return [{"service": "mpd", "type": "song", "title": uri.rsplit("/", 1)[-1] or uri,
+                 "artist": "", "album": "", "uri": uri, "albumart": "", "duration": 0}]
+
+
+# ----------------------------------------------------------------------
+#   Player
+# ----------------------------------------------------------------------
+class FakePlayer:
+    def __init__(self, library: SyntheticLibrary):
+        self.library = library
+        self.queue = []
+        self.position = 0
+        self.status = "stop"
+        self.seek_base = 0.0          # seconds into the track at started_at
+        self.started_at = None
+        self.volume = 50
+        self.mute = False
+        self.random = False
+        self.repeat = False
+
+    def _elapsed(self):
+        if self.status == "play" and self.started_at is not None:
+            return self.seek_base + (time.monotonic() - self.started_at)
+        return self.seek_base
+
+    def current(self):
+        if 0 <= self.position < len(self.queue):
+            return self.queue[self.position]
+        return {}
+
+    def state(self):
+        track = self.current()
+        return {
+            "status": self.status,
+            "position": self.position,
+            "title": track.get("title", ""),
+            "artist": track.get("artist", ""),
+            "album": track.get("album", ""),
+            "albumart": track.get("albumart", "/albumart"),
+            "uri": track.get("uri", ""),
+            "trackType": track.get("trackType", "flac"),
+            "seek": int(self._elapsed() * 1000),
+            "duration": track.get("duration", 0),
+            "samplerate": "44.1 kHz",
+            "bitdepth": "16 bit",
+            "channels": 2,
+            "random": self.random,
+            "repeat": self.repeat,
+            "repeatSingle": False,
+            "consume": False,
+            "volume": self.volume,
+            "mute": self.mute,
+            "stream": track.get("trackType") == "webradio",
+            "updatedb": False,
+            "volatile": False,
+            "service": track.get("service", "mpd"),
+            # Server wall-clock send time, used by scripts/volumio_bench.py for lag
+            "fakeSentAt": time.time(),
+        }
+
+    # -------- transport --------
+    def play(self, position=None):
+        if position is not None:
+            self.position = max(0, min(int(position), len(self.queue) - 1))
+            self.seek_base = 0.0
+        if self.queue:
+            self.status = "play"
+            self.started_at = time.monotonic()
+
+    def pause(self):
+        self.seek_base = self._elapsed()
+        self.status = "pause"
+
+    def toggle(self):
+        self.pause() if self.status == "play" else self.play()
+
+    def stop(self):
+        self.status = "stop"
+        self.seek_base = 0.0
+
+    def skip(self, step):
+        if not self.queue:
+            return
+        if self.random and step > 0:
+            self.position = random.randrange(len(self.queue))
+        else:
+            nxt = self.position + step
+            if nxt >= len(self.queue):
+                nxt = 0 if self.repeat else len(self.queue) - 1
+            self.position = max(0, nxt)
+        self.seek_base = 0.0
+        self.started_at = time.monotonic()
+
+    def seek(self, seconds):
+        self.seek_base = max(0.0, float(seconds))
+        self.started_at = time.monotonic()
+
+    def replace_and_play(self, uri):
+        self.queue = self.library.expand(uri)
+        self.play(0)
+
+    def add_to_queue(self, uri):
+        self.queue.extend(self.library.expand(uri))
+        if self.status == "stop" and len(self.queue) == 1:
+            self.play(0)
+
+    def track_finished(self):
+        track = self.current()
+        duration = track.get("duration") or 0
+        return self.status == "play" and duration and self._elapsed() >= duration
+
+
+# ----------------------------------------------------------------------
+#   Server
+# ----------------------------------------------------------------------
+def _uris(payload):
+    """Accept {uri}, {item:{uri}}, [{uri}, ...] or a bare string."""
+    if payload is None:
+        return []
+    if isinstance(payload, str):
+        return [payload]
+    if isinstance(payload, list):
+        return [u for p in payload for u in _uris(p)]
+    if isinstance(payload, dict):
+        if "item" in payload:
+            return _uris(payload["item"])
+        if "list" in payload:
+            return _uris(payload["list"])
+        if payload.get("uri"):
+            return [payload["uri"]]
+    return []
+
+
+class _GatherManager(socketio.AsyncManager):
+    """
+    python-socketio 4.x AsyncManager.emit hands bare coroutines to
+    asyncio.wait(), which Python 3.11 rejects; gather them instead.
+    """
+
+    async def emit(self, event, data, namespace, room=None, skip_sid=None, callback=None, **kwargs):
+        if namespace not in self.rooms or room not in self.rooms[namespace]:
+            return
+        skip = skip_sid if isinstance(skip_sid, list) else [skip_sid]
+        sends = []
+        for sid in self.get_participants(namespace, room):
+            if sid in skip:
+                continue
+            ack = self._generate_ack_id(sid, namespace, callback) if callback is not None else None
+            sends.append(self.server._emit_internal(sid, event, data, namespace, ack))
+        if sends:
+            await asyncio.gather(*sends)
+
+
+class FakeVolumio:
+    def __init__(self, library, args):
+        self.library = library
+        self.player = FakePlayer(library)
+        self.args = args
+        self.rng = random.Random(args.seed)
+
+        self.sio = socketio.AsyncServer(async_mode="aiohttp", cors_allowed_origins="*",
+                                        client_manager=_GatherManager(),
+                                        logger=False, engineio_logger=False)
+        self.app = web.Application()
+        self.sio.attach(self.app)
+
+        self.clients = set()
+        self.in_outage_until = 0.0
+        self.stats = {"sio_in": 0, "sio_out": 0, "http": 0, "connects": 0, "kicked": 0}
+
+        self._register_socket_events()
+        self._register_routes()
+        self.app.on_startup.append(self._start_background)
+
+    # -------- helpers --------
+    async def _latency(self):
+        ms = self.args.latency_ms
+        if self.args.jitter_ms:
+            ms = self.rng.gauss(ms, self.args.jitter_ms)
+        if ms > 0:
+            await asyncio.sleep(ms / 1000.0)
+
+    async def _emit(self, event, data, to=None):
+        self.stats["sio_out"] += 1 if to else max(1, len(self.clients))
+        await self.sio.emit(event, data, room=to)
+
+    async def push_state(self, to=None):
+        await self._emit("pushState", self.player.state(), to=to)
+
+    async def push_track(self):
+        track = self.player.current()
+        await self._emit("pushTrack", {"track": track})
+
+    async def _command(self, name, arg=None):
+        p = self.player
+        before = p.position
+        if name == "play":
+            p.play(arg)
+        elif name == "pause":
+            p.pause()
+        elif name == "toggle":
+            p.toggle()
+        elif name == "stop":
+            p.stop()
+        elif name == "next":
+            p.skip(+1)
+        elif name in ("prev", "previous"):
+            p.skip(-1)
+        elif name == "seek":
+            p.seek(arg or 0)
+        elif name == "random":
+            p.random = bool(arg) if arg is not None else not p.random
+        elif name == "repeat":
+            p.repeat = bool(arg) if arg is not None else not p.repeat
+        elif name == "volume":
+            if arg == "mute":
+                p.mute = True
+            elif arg == "unmute":
+                p.mute = False
+            elif arg == "+":
+                p.volume = min(100, p.volume + 1)
+            elif arg == "-":
+                p.volume = max(0, p.volume - 1)
+            elif arg is not None:
+                p.volume = max(0, min(100, int(arg)))
+        else:
+            return False
+        await self.push_state()
+        if p.position != before:
+            await self.push_track()
+        return True
+
+    # -------- socket.io --------
+    def _register_socket_events(self):
+        sio = self.sio
+
+        @sio.event
+        async def connect(sid, environ):
+            if time.monotonic() < self.in_outage_until:
+                logger.info(f"Refusing {sid} (injected outage)")
+                return False
+            self.clients.add(sid)
+            self.stats["connects"] += 1
+            logger.info(f"Client connected: {sid}")
+
+        @sio.event
+        async def disconnect(sid):
+            self.clients.discard(sid)
+            logger.info(f"Client disconnected: {sid}")
+
+        def handler(name):
+            def deco(fn):
+                async def wrapped(sid, data=None):
+                    self.stats["sio_in"] += 1
+                    await self._latency()
+                    await fn(sid, data)
+                sio.on(name, wrapped)
+                return fn
+            return deco
+
+        @handler("getState")
+        async def _get_state(sid, data):
+            await self.push_state(to=sid)
+
+        @handler("getBrowseSources")
+        async def _sources(sid, data):
+            await self._emit("pushBrowseSources", self.library.sources(), to=sid)
+
+        @handler("browseLibrary")
+        async def _browse(sid, data):
+            uri = (data or {}).get("uri", "") if isinstance(data, dict) else ""
+            await self._emit("pushBrowseLibrary", self.library.browse(uri), to=sid)
+
+        @handler("replaceAndPlay")
+        async def _replace(sid, data):
+            uris = _uris(data)
+            if uris:
+                self.player.replace_and_play(uris[0])
+                for extra in uris[1:]:
+                    self.player.add_to_queue(extra)
+                await self.push_state()
+                await self.push_track()
+
+        @handler("addToQueue")
+        async def _add(sid, data):
+            for uri in _uris(data):
+                self.player.add_to_queue(uri)
+            await self._emit("pushToastMessage", {"type": "success", "title": "Added to queue",
+                                                  "message": ""}, to=sid)
+
+        @handler("playPlaylist")
+        async def _playlist(sid, data):
+            name = (data or {}).get("name", "") if isinstance(data, dict) else str(data or "")
+            self.player.replace_and_play(f"playlists/{name}")
+            await self.push_state()
+
+        for name in ("play", "pause", "toggle", "stop", "next", "prev"):
+            handler(name)(lambda sid, data, _n=name: self._command(_n))
+
+        @handler("seek")
+        async def _seek(sid, data):
+            await self._command("seek", data)
+
+        @handler("setRandom")
+        async def _random(sid, data):
+            await self._command("random", (data or {}).get("value"))
+
+        @handler("setRepeat")
+        async def _repeat(sid, data):
+            await self._command("repeat", (data or {}).get("value"))
+
+        @handler("volume")
+        async def _volume(sid, data):
+            await self._command("volume", data)
+
+    # -------- REST --------
+    def _register_routes(self):
+        r = self.app.router
+        r.add_get("/api/v1/browse", self.http_browse)
+        r.add_get("/api/v1/getState", self.http_get_state)
+        r.add_get("/api/v1/commands", self.http_commands)
+        r.add_get("/api/v1/commands/", self.http_commands)
+        r.add_post("/api/v1/commands", self.http_commands)
+        r.add_post("/api/v1/replaceAndPlay", self.http_replace_and_play)
+        r.add_post("/api/v1/addToQueue", self.http_add_to_queue)
+        r.add_get("/api/v1/ping", self.http_ping)
+
+    async def _http_enter(self):
+        self.stats["http"] += 1
+        await self._latency()
+
+    async def _body(self, request):
+        try:
+            return await request.json()
+        except Exception:
+            return {}
+
+    async def http_ping(self, request):
+        return web.Response(text="pong")
+
+    async def http_browse(self, request):
+        await self._http_enter()
+        return web.json_response(self.library.browse(request.query.get("uri", "")))
+
+    async def http_get_state(self, request):
+        await self._http_enter()
+        return web.json_response(self.player.state())
+
+    async def http_commands(self, request):
+        await self._http_enter()
+        params = dict(request.query)
+        if request.method == "POST":
+            params.update(await self._body(request))
+        cmd = params.get("cmd", "")
+        arg = None
+        if cmd == "seek":
+            arg = params.get("position")
+        elif cmd in ("random", "repeat"):
+            value = params.get("value")
+            arg = None if value is None else str(value).lower() in ("true", "1")
+        elif cmd == "volume":
+            arg = params.get("volume")
+        elif cmd == "play" and "N" in params:
+            arg = params.get("N")
+        ok = await self._command(cmd, arg)
+        if not ok:
+            return web.json_response({"error": f"unknown command {cmd!r}"}, status=400)
+        return web.json_response({"time": int(time.time() * 1000), "response": f"{cmd} Success"})
+
+    async def http_replace_and_play(self, request):
+        await self._http_enter()
+        uris = _uris(await self._body(request))
+        if not uris:
+            return web.json_response({"error": "no uri"}, status=400)
+        self.player.replace_and_play(uris[0])
+        for extra in uris[1:]:
+            self.player.add_to_queue(extra)
+        await self.push_state()
+        await self.push_track()
+        return web.json_response({"response": "success"})
+
+    async def http_add_to_queue(self, request):
+        await self._http_enter()
+        for uri in _uris(await self._body(request)):
+            self.player.add_to_queue(uri)
+        return web.json_response({"response": "success"})
+
+    # -------- background scripts --------
+    async def _start_background(self, app):
+        loop = asyncio.get_event_loop()
+        loop.create_task(self._state_stream())
+        loop.create_task(self._track_clock())
+        if self.args.disconnect_every:
+            loop.create_task(self._disconnect_injector())
+        if self.args.stats_interval:
+            loop.create_task(self._stats_reporter())
+
+    async def _state_stream(self):
+        """pushState at a fixed rate (Volumio itself pushes on change only)."""
+        if self.args.state_rate <= 0:
+            return
+        interval = 1.0 / self.args.state_rate
+        next_at = time.monotonic()
+        while True:
+            next_at += interval
+            if self.clients:
+                await self.push_state()
+            await asyncio.sleep(max(0.0, next_at - time.monotonic()))
+
+    async def _track_clock(self):
+        """Advance the queue when a track ends, or every --track-every seconds."""
+        last_change = time.monotonic()
+        while True:
+            await asyncio.sleep(0.25)
+            forced = self.args.track_every and time.monotonic() - last_change >= self.args.track_every
+            if self.player.queue and (forced or self.player.track_finished()):
+                if self.player.status != "play":
+                    self.player.play()
+                self.player.skip(+1)
+                last_change = time.monotonic()
+                await self.push_state()
+                await self.push_track()
+
+    async def _disconnect_injector(self):
+        while True:
+            await asyncio.sleep(self.args.disconnect_every)
+            self.in_outage_until = time.monotonic() + self.args.outage
+            kicked = list(self.clients)
+            logger.warning(f"Injecting disconnect for {len(kicked)} client(s), outage {self.args.outage}s")
+            for sid in kicked:
+                self.stats["kicked"] += 1
+                await self.sio.disconnect(sid)
+
+    async def _stats_reporter(self):
+        last = dict(self.stats)
+        while True:
+            await asyncio.sleep(self.args.stats_interval)
+            now = dict(self.stats)
+            rate = {k: (now[k] - last[k]) / self.args.stats_interval for k in ("sio_in", "sio_out", "http")}
+            logger.info(
+                f"clients={len(self.clients)} sio_in={rate['sio_in']:.1f}/s sio_out={rate['sio_out']:.1f}/s "
+                f"http={rate['http']:.1f}/s connects={now['connects']} kicked={now['kicked']}"
+            )
+            last = now
+
+
+# ----------------------------------------------------------------------
+#   CLI
+# ----------------------------------------------------------------------
+def parse_args(argv=None):
+    ap = argparse.ArgumentParser(description="Fake Volumio server for Quadify benchmarks.")
+    ap.add_argument("--host", default="127.0.0.1")
+    ap.add_argument("--port", type=int, default=3000)
+    ap.add_argument("--albums", type=int, default=500, help="number of synthetic albums")
+    ap.add_argument("--artists", type=int, default=None, help="number of artists (default albums/4)")
+    ap.add_argument("--tracks-per-album", type=int, default=10)
+    ap.add_argument("--radios", type=int, default=25)
+    ap.add_argument("--seed", type=int, default=1)
+    ap.add_argument("--state-rate", type=float, default=0.0, help="pushState broadcasts per second (0 = on change only)")
+    ap.add_argument("--track-every", type=float, default=0.0, help="force a track change every N seconds")
+    ap.add_argument("--latency-ms", type=float, default=0.0, help="added latency per request/event")
+    ap.add_argument("--jitter-ms", type=float, default=0.0, help="gaussian jitter on the added latency")
+    ap.add_argument("--disconnect-every", type=float, default=0.0, help="drop all clients every N seconds")
+    ap.add_argument("--outage", type=float, default=0.0, help="refuse reconnects for N seconds after a drop")
+    ap.add_argument("--autoplay", action="store_true", help="start playing the first album on startup")
+    ap.add_argument("--stats-interval", type=float, default=5.0)
+    ap.add_argument("-v", "--verbose", action="store_true")
+    return ap.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    logging.basicConfig(level=logging.DEBUG if args.verbose else logging.INFO,
+                        format="%(asctime)s - %(name)s - %(levelname)s - %(message)s")
+    if not args.verbose:
+        # Per-packet logs would dominate the timing at high push rates
+        for name in ("socketio.server", "engineio.server", "aiohttp.access"):
+            logging.getLogger(name).setLevel(logging.WARNING)
+
+    t0 = time.monotonic()
+    library = SyntheticLibrary(albums=args.albums, artists=args.artists,
+                               tracks_per_album=args.tracks_per_album,
+                               radios=args.radios, seed=args.seed)
+    logger.info(
+        f"Synthetic library: {len(library.artists)} artists, {len(library.albums)} albums, "
+        f"{len(library.tracks_by_uri)} tracks in {(time.monotonic() - t0) * 1000:.0f} ms"
+    )
+
+    server = FakeVolumio(library, args)
+    if args.autoplay and library.albums:
+        server.player.replace_and_play(library.albums[0]["uri"])
+
+    web.run_app(server.app, host=args.host, port=args.port, print=None)
+
+
+if __name__ == "__main__":
+    main()
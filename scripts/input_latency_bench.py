@@ -0,0 +1,121 @@
+#!/usr/bin/env python3
+# scripts/input_latency_bench.py
+"""
+End-to-end input latency on a desk (or in CI): no encoder, no panel.
+
+Drives quadrature edges into the real RotaryControl through an in-process
+fake RPi.GPIO, through RotaryAccelerator and MenuManager's list view, onto
+the luma dummy display, and prints the per-stage histograms collected by
+controls/input_trace.py (the same report as `quadify_ctl.py trace` on a
+running unit).
+
+Examples:
+  python scripts/input_latency_bench.py
+  python scripts/input_latency_bench.py --detents 400 --rate 25 --spi-ms 8
+  python scripts/input_latency_bench.py --json
+"""
+
+import argparse
+import json
+import os
+import sys
+import threading
+import time
+import types
+
+SRC = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src")
+sys.path.insert(0, SRC)
+
+CLK, DT, SW = 13, 5, 6
+
+
+def install_fake_gpio():
+    """A minimal RPi.GPIO whose pin levels and edge callbacks the bench owns."""
+    gpio = types.ModuleType("RPi.GPIO")
+    gpio.BCM = gpio.IN = gpio.PUD_UP = gpio.BOTH = gpio.FALLING = gpio.RISING = 0
+    gpio.LOW, gpio.HIGH = 0, 1
+    gpio.levels = {CLK: 1, DT: 1, SW: 1}
+    gpio.callbacks = {}
+    gpio.setmode = gpio.setwarnings = gpio.cleanup = lambda *a, **k: None
+    gpio.setup = lambda *a, **k: None
+    gpio.input = lambda pin: gpio.levels[pin]
+    gpio.add_event_detect = lambda pin, edge, callback=None, **k: gpio.callbacks.__setitem__(pin, callback)
+    gpio.remove_event_detect = lambda pin: gpio.callbacks.pop(pin, None)
+    rpi = types.ModuleType("RPi")
+    rpi.GPIO = gpio
+    sys.modules["RPi"] = rpi
+    sys.modules["RPi.GPIO"] = gpio
+    return gpio
+
+
+def turn(gpio, direction):
+    """One detent: a full quadrature cycle from rest (11), one edge at a time."""
+    cw = [(0, 1), (0, 0), (1, 0), (1, 1)]
+    ccw = [(1, 0), (0, 0), (0, 1), (1, 1)]
+    for a, b in (cw if direction > 0 else ccw):
+        changed = CLK if gpio.levels[CLK] != a else DT
+        gpio.levels[CLK], gpio.levels[DT] = a, b
+        gpio.callbacks[changed](changed)
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description="Rotary -> frame latency on fake GPIO and the dummy display")
+    ap.add_argument("--detents", type=int, default=200)
+    ap.add_argument("--rate", type=float, default=12.0, help="detents per second")
+    ap.add_argument("--rows", type=int, default=5000, help="list length")
+    ap.add_argument("--spi-ms", type=float, default=0.0, help="simulated panel transfer time per frame")
+    ap.add_argument("--no-accel", action="store_true", help="pass detents 1:1 (no acceleration)")
+    ap.add_argument("--json", action="store_true", help="print the snapshot as JSON instead of the table")
+    args = ap.parse_args(argv)
+
+    gpio = install_fake_gpio()
+
+    from controls.input_trace import tracer
+    from controls.rotary_control import RotaryControl
+    from controls.rotary_acceleration import RotaryAccelerator
+    from display.display_manager import DisplayManager
+    from managers.menu_manager import MenuManager
+
+    display = DisplayManager({"device": "dummy"})
+    if args.spi_ms > 0:
+        submit = display._submit_frame
+
+        def slow_submit(image):
+            time.sleep(args.spi_ms / 1000.0)
+            submit(image)
+        display._submit_frame = slow_submit
+
+    menu = MenuManager(display, None, None)
+    menu.is_active = True
+    menu.show_list("Latency", [{"title": f"Row {i:05d}", "type": "song"} for i in range(args.rows)])
+
+    def on_rotate(delta, detents):
+        tracer.mark("dispatch")
+        with menu.rotary_detents(detents):
+            menu.scroll_selection(delta)
+
+    accel = RotaryAccelerator(on_rotate, accelerate=lambda: not args.no_accel)
+    rotary = RotaryControl(rotation_callback=accel.feed)
+    threading.Thread(target=rotary.start, daemon=True).start()
+    time.sleep(0.05)
+    tracer.reset()
+
+    gap = 1.0 / args.rate if args.rate > 0 else 0.0
+    for i in range(args.detents):
+        turn(gpio, +1 if (i // 50) % 2 == 0 else -1)
+        time.sleep(gap)
+    time.sleep(0.3)
+
+    rotary.stop()
+    accel.stop()
+
+    if args.json:
+        print(json.dumps(tracer.snapshot(recent=10), indent=2))
+    else:
+        print(tracer.dump())
+    traced = tracer.snapshot()["sources"].get("rotary", {}).get("total", {}).get("count", 0)
+    return 0 if traced else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+# scripts/quadify_ctl.py
+"""
+Send commands to a running Quadify over its control socket (protocol 1,
+newline-delimited JSON; see src/network/command_server.py).
+
+All commands go down one connection, pipelined, and each reply is printed
+with its status and server-side handling time.
+
+Examples:
+  python scripts/quadify_ctl.py hello
+  python scripts/quadify_ctl.py query what=state
+  python scripts/quadify_ctl.py scroll delta=-5 select
+  python scripts/quadify_ctl.py --batch scroll_down scroll_down select
+  python scripts/quadify_ctl.py --watch            # print mode changes
+  python scripts/quadify_ctl.py trace              # input latency report
+  python scripts/quadify_ctl.py trace action=reset
+  python scripts/quadify_ctl.py boot format=text   # boot timeline to the first interactive frame
+"""
+
+import argparse
+import json
+import socket
+import sys
+import time
+
+SOCK_PATH = "/tmp/quadify.sock"
+PROTOCOL_VERSION = 1
+
+
+def parse_commands(tokens):
+    """['scroll', 'delta=-5', 'select'] -> [('scroll', {'delta': -5}), ('select', {})]"""
+    commands = []
+    for tok in tokens:
+        if "=" in tok and commands:
+            key, value = tok.split("=", 1)
+            try:
+                value = json.loads(value)
+            except ValueError:
+                pass
+            commands[-1][1][key] = value
+        else:
+            commands.append((tok, {}))
+    return commands
+
+
+def read_lines(sock):
+    buf = b""
+    while True:
+        data = sock.recv(65536)
+        if not data:
+            return
+        buf += data
+        while b"\n" in buf:
+            line, buf = buf.split(b"\n", 1)
+            yield json.loads(line)
+
+
+def send(sock, msg):
+    sock.sendall((json.dumps(msg) + "\n").encode("utf-8"))
+
+
+def main():
+    ap = argparse.ArgumentParser(description="Quadify control socket client")
+    ap.add_argument("commands", nargs="*", help="command [key=value ...] ...")
+    ap.add_argument("--socket", default=SOCK_PATH)
+    ap.add_argument("--batch", action="store_true", help="send all commands as one batch request")
+    ap.add_argument("--watch", action="store_true", help="subscribe to mode changes and print them")
+    args = ap.parse_args()
+    if not args.commands and not args.watch:
+        ap.error("nothing to do: give commands and/or --watch")
+
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    sock.connect(args.socket)
+
+    commands = parse_commands(args.commands)
+    started = time.perf_counter()
+    if args.batch and commands:
+        send(sock, {"v": PROTOCOL_VERSION, "id": 1,
+                    "batch": [{"cmd": c, "args": a} for c, a in commands]})
+        expected = 1
+    else:
+        for i, (cmd, cmd_args) in enumerate(commands, 1):
+            send(sock, {"v": PROTOCOL_VERSION, "id": i, "cmd": cmd, "args": cmd_args})
+        expected = len(commands)
+    if args.watch:
+        send(sock, {"v": PROTOCOL_VERSION, "id": 0, "cmd": "subscribe", "args": {"topic": "mode"}})
+
+    ok = True
+    replies = 0
+    for msg in read_lines(sock):
+        if msg.get("event") == "mode":
+            print(f"mode: {msg.get('mode')}")
+            continue
+        if msg.get("id") == 0:
+            continue
+        replies += 1
+        ok = ok and bool(msg.get("ok"))
+        if isinstance(msg.get("result"), str) and "\n" in msg["result"]:
+            print(msg["result"])      # multi-line reports (e.g. trace)
+        else:
+            print(json.dumps(msg))
+        if replies >= expected and not args.watch:
+            break
+    if commands:
+        print(f"{expected} repl{'y' if expected == 1 else 'ies'} in "
+              f"{(time.perf_counter() - started) * 1000:.2f} ms", file=sys.stderr)
+    sock.close()
+    return 0 if ok else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
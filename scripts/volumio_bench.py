@@ -0,0 +1,205 @@
+#!/usr/bin/env python3
+# scripts/volumio_bench.py
+"""
+Client-side load benchmark against scripts/fake_volumio.py.
+
+Measures, with the real VolumioListener from src/:
+  * pushState delivery rate and lag (server send -> state_changed handler)
+  * reconnects seen while the server injects disconnects
+  * HTTP /api/v1/browse latency and socket browseLibrary round trips
+  * optionally, MenuManager list render/scroll time on the dummy display
+
+Example:
+  python scripts/fake_volumio.py --port 3900 --albums 20000 --state-rate 50 &
+  python scripts/volumio_bench.py --port 3900 --duration 20 --render
+"""
+
+import argparse
+import logging
+import os
+import sys
+import threading
+import time
+
+SRC = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src")
+sys.path.insert(0, SRC)
+
+import requests  # noqa: E402
+
+from network.volumio_listener import VolumioListener  # noqa: E402
+from network.async_core import start_network_core, stop_network_core  # noqa: E402
+
+
+def percentile(values, pct):
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    k = min(len(ordered) - 1, max(0, int(round(pct / 100.0 * (len(ordered) - 1)))))
+    return ordered[k]
+
+
+def summary(name, samples_ms):
+    if not samples_ms:
+        return f"{name:<28} n=0"
+    return (f"{name:<28} n={len(samples_ms):<6} p50={percentile(samples_ms, 50):7.2f} ms  "
+            f"p95={percentile(samples_ms, 95):7.2f} ms  max={max(samples_ms):7.2f} ms")
+
+
+# ----------------------------------------------------------------------
+#   Benchmarks
+# ----------------------------------------------------------------------
+def bench_state_stream(listener, duration):
+    lags = []
+    counts = {"states": 0, "tracks": 0, "connects": 0, "disconnects": 0}
+    lock = threading.Lock()
+
+    def on_state(sender, state=None, **kw):
+        sent = (state or {}).get("fakeSentAt")
+        with lock:
+            counts["states"] += 1
+            if sent:
+                lags.append((time.time() - sent) * 1000.0)
+
+    def on_track(sender, **kw):
+        with lock:
+            counts["tracks"] += 1
+
+    def on_connect(sender, **kw):
+        with lock:
+            counts["connects"] += 1
+
+    def on_disconnect(sender, **kw):
+        with lock:
+            counts["disconnects"] += 1
+
+    listener.state_changed.connect(on_state)
+    listener.track_changed.connect(on_track)
+    listener.connected.connect(on_connect)
+    listener.disconnected.connect(on_disconnect)
+    try:
+        time.sleep(duration)
+    finally:
+        listener.state_changed.disconnect(on_state)
+        listener.track_changed.disconnect(on_track)
+        listener.connected.disconnect(on_connect)
+        listener.disconnected.disconnect(on_disconnect)
+
+    print(f"pushState received           {counts['states']} ({counts['states'] / duration:.1f}/s)")
+    print(f"pushTrack received           {counts['tracks']}")
+    print(f"reconnects                   {counts['connects']} (disconnects {counts['disconnects']})")
+    print(summary("pushState lag", lags))
+
+
+def bench_http_browse(base_url, uris, repeats):
+    session = requests.Session()
+    for uri in uris:
+        samples, items = [], 0
+        for _ in range(repeats):
+            t0 = time.perf_counter()
+            resp = session.get(f"{base_url}/api/v1/browse", params={"uri": uri}, timeout=30)
+            data = resp.json()
+            samples.append((time.perf_counter() - t0) * 1000.0)
+            lists = data.get("navigation", {}).get("lists") or []
+            items = sum(len(lst.get("items") or [1]) for lst in lists)
+        print(summary(f"http browse {uri or '<root>'!s:.16}", samples) + f"  items={items}")
+
+
+def bench_socket_browse(listener, uris, repeats):
+    done = threading.Event()
+
+    def on_nav(sender, **kw):
+        done.set()
+
+    listener.navigation_received.connect(on_nav)
+    try:
+        for uri in uris:
+            samples = []
+            for _ in range(repeats):
+                done.clear()
+                t0 = time.perf_counter()
+                listener.fetch_browse_library(uri)
+                if not done.wait(30):
+                    print(f"socket browse {uri!r}: timed out")
+                    break
+                samples.append((time.perf_counter() - t0) * 1000.0)
+            print(summary(f"socket browse {uri or '<root>'!s:.14}", samples))
+    finally:
+        listener.navigation_received.disconnect(on_nav)
+
+
+def bench_menu_render(listener, base_url, uri, scrolls):
+    from display.display_manager import DisplayManager
+    from managers.menu_manager import MenuManager
+
+    display = DisplayManager({"device": "dummy"})
+    menu = MenuManager(display, listener, None)
+    menu.is_active = True
+
+    data = requests.get(f"{base_url}/api/v1/browse", params={"uri": uri}, timeout=30).json()
+    items = []
+    for lst in data.get("navigation", {}).get("lists") or []:
+        items.extend(lst.get("items") or [])
+
+    t0 = time.perf_counter()
+    menu.show_list("Bench", items)
+    show_ms = (time.perf_counter() - t0) * 1000.0
+    print(f"show_list ({len(items)} rows)       {show_ms:.2f} ms")
+
+    samples = []
+    for i in range(scrolls):
+        t0 = time.perf_counter()
+        menu.scroll_list(1 if i < scrolls // 2 else -1)
+        samples.append((time.perf_counter() - t0) * 1000.0)
+    print(summary("scroll_list frame", samples))
+
+
+# ----------------------------------------------------------------------
+#   CLI
+# ----------------------------------------------------------------------
+def main(argv=None):
+    ap = argparse.ArgumentParser(description="Benchmark Quadify's Volumio client against fake_volumio.py")
+    ap.add_argument("--host", default="127.0.0.1")
+    ap.add_argument("--port", type=int, default=3000)
+    ap.add_argument("--duration", type=float, default=10.0, help="seconds to sample the pushState stream")
+    ap.add_argument("--async-core", action="store_true", help="run the listener on the asyncio network core")
+    ap.add_argument("--browse", nargs="*", default=["", "music-library", "albums://"],
+                    help="URIs to browse (HTTP and socket)")
+    ap.add_argument("--repeats", type=int, default=5)
+    ap.add_argument("--render", action="store_true", help="also time MenuManager on the dummy display")
+    ap.add_argument("--render-uri", default="albums://")
+    ap.add_argument("--scrolls", type=int, default=200)
+    ap.add_argument("-v", "--verbose", action="store_true")
+    args = ap.parse_args(argv)
+
+    logging.basicConfig(level=logging.INFO if args.verbose else logging.WARNING)
+    if not args.verbose:
+        # The app loggers set their own levels; keep the report readable
+        for name in ("VolumioListener", "MenuManager", "DisplayManager"):
+            logging.getLogger(name).setLevel(logging.WARNING)
+    base_url = f"http://{args.host}:{args.port}"
+
+    core = start_network_core() if args.async_core else None
+    if args.async_core and core is None:
+        print("aiohttp is not installed; falling back to the threaded listener")
+
+    t0 = time.perf_counter()
+    listener = VolumioListener(host=args.host, port=args.port, network_core=core)
+    if not args.verbose:
+        listener.logger.setLevel(logging.WARNING)
+    print(f"listener connect             {(time.perf_counter() - t0) * 1000:.1f} ms "
+          f"({'async core' if core else 'threaded'})")
+
+    try:
+        bench_state_stream(listener, args.duration)
+        if args.browse:
+            bench_http_browse(base_url, args.browse, args.repeats)
+            bench_socket_browse(listener, args.browse, args.repeats)
+        if args.render:
+            bench_menu_render(listener, base_url, args.render_uri, args.scrolls)
+    finally:
+        listener.stop()
+        stop_network_core()
+
+
+if __name__ == "__main__":
+    main()
@@ -1,12 +1,29 @@
 #!/usr/bin/env python3
 # src/assets/images/fetch_icons.py
+#
+# Service icons: discover Volumio's services, download their icons, rasterise
+# SVGs, trim and save 50x50 PNGs into ASSETS_DIR, and record them in the
+# manifest. Incremental: each manifest entry keeps the source URL, its ETag /
+# Last-Modified, a SHA-256 of the downloaded bytes and of the PNG written, so
+#
+#   - an entry checked within REVALIDATE_AFTER costs no request at all,
+#   - an older one is a conditional GET (304 -> unchanged),
+#   - a 200 whose bytes hash the same as before is not re-rendered,
+#   - PNGs this script did not write (shipped or hand-made) are kept as is,
+#
+# and downloads run on a small bounded pool. main.py runs it in the
+# background once the UI is up, so boot never waits on the network for it.
 
 import os
 import sys
 import json
+import time
+import hashlib
 import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from io import BytesIO
-from typing import Dict, Any, Optional
+from typing import Callable, Dict, Any, List, Optional, Tuple
 
 import requests
 from PIL import Image
@@ -18,6 +35,9 @@ ASSETS_DIR = os.environ.get("QUADIFY_ICON_DIR", "/home/volumio/Quadify/src/asset
 MANIFEST_PATH = os.environ.get("QUADIFY_ICON_MANIFEST", "/home/volumio/Quadify/src/assets/icons_manifest.json")
 ICON_SIZE = int(os.environ.get("QUADIFY_ICON_SIZE", "50"))
 MARGIN_RATIO = float(os.environ.get("QUADIFY_ICON_MARGIN", "1.2"))  # >1 leaves margin, 1 = tight
+WORKERS = int(os.environ.get("QUADIFY_ICON_WORKERS", "4"))            # parallel downloads
+REVALIDATE_AFTER = float(os.environ.get("QUADIFY_ICON_REVALIDATE", str(24 * 3600)))  # seconds
+MANIFEST_VERSION = 2
 
 # Allow "from network.service_listener import get_available_services"
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../../')))
@@ -100,13 +120,40 @@ def fit_square(img: Image.Image, size: int) -> Image.Image:
     return bg
 
 
-def fetch_bytes(url: str, timeout: float = 10.0) -> (bytes, Dict[str, str]):
-    resp = requests.get(url, timeout=timeout)
+_local = threading.local()
+
+
+def _session() -> requests.Session:
+    # One keep-alive session per download worker
+    s = getattr(_local, "session", None)
+    if s is None:
+        s = _local.session = requests.Session()
+    return s
+
+
+def sha256_bytes(data: bytes) -> str:
+    return hashlib.sha256(data).hexdigest()
+
+
+def sha256_file(path: str) -> Optional[str]:
+    try:
+        with open(path, "rb") as f:
+            return sha256_bytes(f.read())
+    except OSError:
+        return None
+
+
+def fetch_bytes(url: str, timeout: float = 10.0,
+                headers: Optional[Dict[str, str]] = None) -> Tuple[int, Dict[str, str], bytes, bytes]:
+    """GET url -> (status, headers, body, first 2KB); status 304 comes back with no body."""
+    resp = _session().get(url, timeout=timeout, headers=headers or {})
+    if resp.status_code == 304:
+        return 304, dict(resp.headers), b"", b""
     resp.raise_for_status()
     # grab first 2KB for sniffing
     body = resp.content
     head = body[:2048] if body else b""
-    return body, dict(resp.headers), head
+    return resp.status_code, dict(resp.headers), body, head
 
 
 def load_image_any(url: str) -> Optional[Image.Image]:
@@ -115,11 +162,14 @@ def load_image_any(url: str) -> Optional[Image.Image]:
     Returns an RGBA image or None on failure.
     """
     try:
-        body, headers, head = fetch_bytes(url)
+        _, headers, body, head = fetch_bytes(url)
     except Exception as e:
         logger.warning(f"Download failed for {url}: {e}")
         return None
+    return decode_image(url, body, headers, head)
+
 
+def decode_image(url: str, body: bytes, headers: Dict[str, str], head: bytes) -> Optional[Image.Image]:
     try:
         if is_svg_from_headers_or_url(url, headers, head):
             # Render SVG to PNG bytes at a generous size, then we’ll trim/fit.
@@ -140,7 +190,11 @@ def load_image_any(url: str) -> Optional[Image.Image]:
 
 
 def normalise_icon(url: str, size: int = ICON_SIZE, margin_ratio: float = MARGIN_RATIO) -> Optional[Image.Image]:
-    img = load_image_any(url)
+    return normalise_image(load_image_any(url), url, size, margin_ratio)
+
+
+def normalise_image(img: Optional[Image.Image], url: str, size: int = ICON_SIZE,
+                    margin_ratio: float = MARGIN_RATIO) -> Optional[Image.Image]:
     if img is None:
         return None
     try:
@@ -152,6 +206,18 @@ def normalise_icon(url: str, size: int = ICON_SIZE, margin_ratio: float = MARGIN
         return None
 
 
+def read_manifest(path: str = MANIFEST_PATH) -> Dict[str, Any]:
+    try:
+        with open(path, "r") as f:
+            data = json.load(f)
+        return data if isinstance(data, dict) else {}
+    except FileNotFoundError:
+        return {}
+    except Exception as e:
+        logger.warning(f"Ignoring unreadable icon manifest {path}: {e}")
+        return {}
+
+
 def write_manifest(manifest: Dict[str, Any], path: str = MANIFEST_PATH) -> None:
     ensure_dir(os.path.dirname(path))
     tmp = path + ".tmp"
@@ -160,23 +226,103 @@ def write_manifest(manifest: Dict[str, Any], path: str = MANIFEST_PATH) -> None:
     os.replace(tmp, path)
 
 
-# ---- Main flow ----
-def main() -> Dict[str, Any]:
+def save_icon(img: Image.Image, save_path: str) -> str:
+    """Write the PNG atomically and return its SHA-256."""
+    buf = BytesIO()
+    img.save(buf, format="PNG")
+    data = buf.getvalue()
+    tmp = save_path + ".tmp"
+    with open(tmp, "wb") as f:
+        f.write(data)
+    os.replace(tmp, save_path)
+    return sha256_bytes(data)
+
+
+def refresh_icon(label: str, icon_url: str, previous: Optional[Dict[str, Any]],
+                 rerender: bool = False) -> Tuple[Optional[Dict[str, Any]], str]:
     """
-    Discover services via Volumio, fetch & normalise icons into ASSETS_DIR,
-    write a manifest JSON, and return it (label -> file path).
+    Bring one icon up to date. Returns (manifest entry or None, outcome), outcome
+    being "unchanged", "kept" (not ours), "updated", "new" or "failed".
     """
-    ensure_dir(ASSETS_DIR)
+    save_path = os.path.join(ASSETS_DIR, f"{label}.png")
+    on_disk = sha256_file(save_path)
+    previous = previous or {}
+
+    if on_disk is not None and (previous.get("sha256") != on_disk or previous.get("kept")):
+        # A PNG this script did not write (or one written before the manifest tracked
+        # hashes): shipped or hand-made icons win over whatever Volumio serves
+        return {"path": save_path, "source": icon_url, "sha256": on_disk, "kept": True}, "kept"
+
+    headers = {}
+    if on_disk is not None and previous.get("source") == icon_url and not rerender:
+        if time.time() - previous.get("checked_at", 0) < REVALIDATE_AFTER:
+            return previous, "unchanged"
+        if previous.get("etag"):
+            headers["If-None-Match"] = previous["etag"]
+        if previous.get("last_modified"):
+            headers["If-Modified-Since"] = previous["last_modified"]
 
     try:
-        services = get_available_services()
+        status, resp_headers, body, head = fetch_bytes(icon_url, headers=headers)
     except Exception as e:
-        logger.error(f"get_available_services() failed: {e}")
-        services = []
+        logger.warning(f"Download failed for {label} ({icon_url}): {e}")
+        return (previous if on_disk is not None else None), "failed"
 
-    manifest: Dict[str, Any] = {"icons": {}, "size": ICON_SIZE}
-    seen_labels = set()
+    entry = dict(previous, path=save_path, source=icon_url, checked_at=time.time())
+    if status == 304:
+        return entry, "unchanged"
+
+    entry["etag"] = resp_headers.get("ETag") or resp_headers.get("Etag")
+    entry["last_modified"] = resp_headers.get("Last-Modified")
+    source_sha = sha256_bytes(body)
+    if on_disk is not None and not rerender and source_sha == previous.get("source_sha256"):
+        return entry, "unchanged"
 
+    img = normalise_image(decode_image(icon_url, body, resp_headers, head), icon_url,
+                          size=ICON_SIZE, margin_ratio=MARGIN_RATIO)
+    if img is None:
+        logger.warning(f"Icon fetch/convert failed for {label} ({icon_url})")
+        return (previous if on_disk is not None else None), "failed"
+    try:
+        entry["sha256"] = save_icon(img, save_path)
+    except Exception as e:
+        logger.warning(f"Failed to save {label} -> {save_path}: {e}")
+        return (previous if on_disk is not None else None), "failed"
+    entry["source_sha256"] = source_sha
+    logger.info(f"Saved icon for {label}: {save_path}")
+    return entry, ("updated" if on_disk is not None else "new")
+
+
+# ---- Main flow ----
+def main(services: Optional[List[Dict[str, Any]]] = None, workers: int = WORKERS,
+         on_changed: Optional[Callable[[List[str]], None]] = None) -> Dict[str, Any]:
+    """
+    Discover services via Volumio (unless given), bring their icons in ASSETS_DIR
+    up to date, write the manifest if anything in it changed, and return it.
+    on_changed(labels) is called when any PNG was written.
+    """
+    ensure_dir(ASSETS_DIR)
+    started = time.monotonic()
+
+    if services is None:
+        try:
+            services = get_available_services()
+        except Exception as e:
+            logger.error(f"get_available_services() failed: {e}")
+            services = []
+
+    previous = read_manifest(MANIFEST_PATH)
+    if not services:
+        # Volumio not answering: keep what we had rather than emptying the manifest
+        logger.info("No services discovered; icon manifest left as is.")
+        return previous
+
+    rerender = previous.get("version") == MANIFEST_VERSION and (
+        previous.get("size") != ICON_SIZE or previous.get("margin") != MARGIN_RATIO)
+    old_icons = previous.get("icons") if isinstance(previous.get("icons"), dict) else {}
+
+    jobs = []
+    seen_labels = set()
     for svc in services:
         name = svc.get("name") or svc.get("plugin") or "UNKNOWN"
         label = sanitise_label(name)
@@ -192,28 +338,37 @@ def main() -> Dict[str, Any]:
         if icon_url.startswith("/"):
             icon_url = VOLUMIO_HOST.rstrip("/") + icon_url
 
-        save_path = os.path.join(ASSETS_DIR, f"{label}.png")
-
-        if os.path.exists(save_path):
-            # Already cached—still add to manifest
-            manifest["icons"][label] = {"path": save_path, "source": icon_url}
-            logger.info(f"Icon already cached for {label}: {save_path}")
-            continue
-
-        img = normalise_icon(icon_url, size=ICON_SIZE, margin_ratio=MARGIN_RATIO)
-        if img is None:
-            logger.warning(f"Icon fetch/convert failed for {label} ({icon_url})")
-            continue
-
+        prev = old_icons.get(label)
+        jobs.append((label, icon_url, prev if isinstance(prev, dict) else None))
+
+    outcomes: Dict[str, int] = {}
+    changed: List[str] = []
+    manifest: Dict[str, Any] = {"version": MANIFEST_VERSION, "icons": {},
+                                "size": ICON_SIZE, "margin": MARGIN_RATIO}
+    if jobs:
+        with ThreadPoolExecutor(max_workers=max(1, min(workers, len(jobs))),
+                                thread_name_prefix="IconFetch") as pool:
+            results = list(pool.map(lambda job: refresh_icon(*job, rerender=rerender), jobs))
+        for (label, _, _), (entry, outcome) in zip(jobs, results):
+            outcomes[outcome] = outcomes.get(outcome, 0) + 1
+            if entry is not None:
+                manifest["icons"][label] = entry
+            if outcome in ("new", "updated"):
+                changed.append(label)
+
+    summary = ", ".join(f"{n} {k}" for k, n in sorted(outcomes.items())) or "nothing to do"
+    if manifest != previous:
+        write_manifest(manifest, MANIFEST_PATH)
+        logger.info(f"Wrote icon manifest: {MANIFEST_PATH} ({len(manifest['icons'])} entries; {summary}) "
+                    f"in {(time.monotonic() - started) * 1000:.0f} ms")
+    else:
+        logger.info(f"Icons up to date ({summary}) in {(time.monotonic() - started) * 1000:.0f} ms")
+
+    if changed and on_changed is not None:
         try:
-            img.save(save_path, format="PNG")
-            manifest["icons"][label] = {"path": save_path, "source": icon_url}
-            logger.info(f"Saved icon for {label}: {save_path}")
+            on_changed(changed)
         except Exception as e:
-            logger.warning(f"Failed to save {label} -> {save_path}: {e}")
-
-    write_manifest(manifest, MANIFEST_PATH)
-    logger.info(f"Wrote icon manifest: {MANIFEST_PATH} ({len(manifest['icons'])} entries)")
+            logger.warning(f"Icon change callback failed: {e}")
     return manifest
 
 
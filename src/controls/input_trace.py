@@ -0,0 +1,235 @@
+# src/controls/input_trace.py
+#
+# End-to-end input latency tracing: from the moment an input happened
+# (GPIO edge, matrix scan, IR command received) to the display frame that
+# reflects it.
+#
+#   begin()  input source   -> trace id, stamped with the input's own time
+#   mark()   "dispatch"     handle_scroll / handle_select (or a manager) starts
+#            "render"       a renderer starts composing a frame
+#   frame    "submit"       oled.display() called (wrapped by DisplayManager)
+#            "done"         oled.display() returned (SPI transfer finished)
+#
+# Trace ids follow the input across threads: whoever hands an input to
+# another thread passes current() along and re-enters it with activate().
+# A trace completes at the end of the first frame submitted after it was
+# dispatched (renders are coalesced, so one frame may complete several
+# traces); dispatched traces that see no frame within expire_s (volume
+# with no redraw, a transport button while the screen is idle) are counted
+# as "no_frame". Traces never dispatched (query, trace) are dropped silently.
+#
+# Per-stage durations go into log-bucket histograms; dump() renders a report
+# (exposed as the "trace" control-socket command).
+
+import itertools
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from typing import Dict, List, Optional
+
+STAGES = ("queue", "dispatch", "render", "spi", "total")
+# queue    : input time   -> dispatch   (encoder queue, accelerator, socket)
+# dispatch : dispatch     -> render     (mode routing, ModeManager/MenuManager locks)
+# render   : render       -> submit     (composing the frame)
+# spi      : submit       -> done       (oled.display)
+# total    : input time   -> done
+
+BUCKETS_MS = (0.1, 0.25, 0.5, 1, 2, 5, 10, 20, 50, 100, 200, 500, 1000)
+BUCKET_LABELS = tuple(f"<={b}ms" for b in BUCKETS_MS) + (f">{BUCKETS_MS[-1]}ms",)
+
+
+class Histogram:
+    def __init__(self):
+        self.counts = [0] * (len(BUCKETS_MS) + 1)
+        self.n = 0
+        self.total = 0.0
+        self.max = 0.0
+        self._recent = deque(maxlen=512)   # for percentiles
+
+    def add(self, ms: float):
+        self.n += 1
+        self.total += ms
+        self.max = max(self.max, ms)
+        self._recent.append(ms)
+        for i, edge in enumerate(BUCKETS_MS):
+            if ms <= edge:
+                self.counts[i] += 1
+                return
+        self.counts[-1] += 1
+
+    def percentile(self, p: float) -> float:
+        if not self._recent:
+            return 0.0
+        data = sorted(self._recent)
+        return data[min(len(data) - 1, int(round(p / 100.0 * (len(data) - 1))))]
+
+    def snapshot(self) -> Dict:
+        return {
+            "count": self.n,
+            "mean_ms": round(self.total / self.n, 3) if self.n else 0.0,
+            "p50_ms": round(self.percentile(50), 3),
+            "p95_ms": round(self.percentile(95), 3),
+            "p99_ms": round(self.percentile(99), 3),
+            "max_ms": round(self.max, 3),
+            "buckets": {label: c for label, c in zip(BUCKET_LABELS, self.counts) if c},
+        }
+
+
+class InputTracer:
+    def __init__(self, enabled=True, expire_s=2.0, keep_recent=200):
+        self.enabled = enabled
+        self.expire_s = expire_s
+        self._ids = itertools.count(1)
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self._open: Dict[int, Dict] = {}
+        self._recent = deque(maxlen=keep_recent)
+        self.histograms: Dict[str, Dict[str, Histogram]] = {}   # source -> stage -> histogram
+        self.no_frame: Dict[str, int] = {}
+
+    # ------------------------------------------------------------------
+    #   Input side
+    # ------------------------------------------------------------------
+    def begin(self, source: str, kind: str = "", t: Optional[float] = None) -> Optional[int]:
+        """Open a trace for one input; t is its time.monotonic() stamp."""
+        if not self.enabled:
+            return None
+        tid = next(self._ids)
+        now = time.monotonic()
+        with self._lock:
+            if len(self._open) > 64:
+                self._expire(now)
+            self._open[tid] = {"id": tid, "source": source, "kind": kind,
+                               "input": t if t is not None else now}
+        return tid
+
+    def drop_undispatched(self, tid: Optional[int]):
+        """Forget a trace whose handler finished without reaching the UI."""
+        if tid is None:
+            return
+        with self._lock:
+            tr = self._open.get(tid)
+            if tr is not None and "dispatch" not in tr:
+                del self._open[tid]
+
+    def current(self) -> List[int]:
+        """Trace ids active on this thread (to hand to another thread)."""
+        return list(getattr(self._local, "ids", ()))
+
+    @contextmanager
+    def activate(self, ids):
+        """Make trace id(s) current on this thread for the duration."""
+        if not self.enabled or not ids:
+            yield
+            return
+        if isinstance(ids, int):
+            ids = [ids]
+        prev = getattr(self._local, "ids", ())
+        self._local.ids = tuple(prev) + tuple(i for i in ids if i is not None)
+        try:
+            yield
+        finally:
+            self._local.ids = prev
+
+    def mark(self, stage: str):
+        """Stamp `stage` (first time only) on the traces current on this thread."""
+        if not self.enabled:
+            return
+        ids = getattr(self._local, "ids", ())
+        if not ids:
+            return
+        now = time.monotonic()
+        with self._lock:
+            for tid in ids:
+                tr = self._open.get(tid)
+                if tr is not None and stage not in tr:
+                    tr[stage] = now
+
+    # ------------------------------------------------------------------
+    #   Frame side (DisplayManager wraps oled.display)
+    # ------------------------------------------------------------------
+    def frame_begin(self) -> Optional[float]:
+        return time.monotonic() if self.enabled and self._open else None
+
+    def frame_end(self, submit: Optional[float]):
+        if submit is None:
+            return
+        done = time.monotonic()
+        finished = []
+        with self._lock:
+            for tid, tr in list(self._open.items()):
+                if "dispatch" in tr and tr["dispatch"] <= submit:
+                    tr["submit"] = submit
+                    tr["done"] = done
+                    finished.append(self._open.pop(tid))
+            self._expire(done)
+            for tr in finished:
+                self._record(tr)
+
+    def _expire(self, now):
+        # caller holds _lock
+        for tid, tr in list(self._open.items()):
+            if now - tr["input"] > self.expire_s:
+                del self._open[tid]
+                if "dispatch" in tr:
+                    self.no_frame[tr["source"]] = self.no_frame.get(tr["source"], 0) + 1
+
+    def _record(self, tr):
+        t_in, t_disp = tr["input"], tr["dispatch"]
+        t_render = tr.get("render", tr["submit"])
+        stages = {
+            "queue": (t_disp - t_in) * 1000,
+            "dispatch": (t_render - t_disp) * 1000,
+            "render": (tr["submit"] - t_render) * 1000,
+            "spi": (tr["done"] - tr["submit"]) * 1000,
+            "total": (tr["done"] - t_in) * 1000,
+        }
+        hists = self.histograms.setdefault(tr["source"], {s: Histogram() for s in STAGES})
+        for stage, ms in stages.items():
+            hists[stage].add(max(0.0, ms))
+        self._recent.append({"id": tr["id"], "source": tr["source"], "kind": tr["kind"],
+                             **{k: round(v, 3) for k, v in stages.items()}})
+
+    # ------------------------------------------------------------------
+    #   Reporting
+    # ------------------------------------------------------------------
+    def snapshot(self, recent: int = 0) -> Dict:
+        with self._lock:
+            out = {
+                "enabled": self.enabled,
+                "open": len(self._open),
+                "no_frame": dict(self.no_frame),
+                "sources": {src: {stage: h.snapshot() for stage, h in hists.items()}
+                            for src, hists in self.histograms.items()},
+            }
+            if recent:
+                out["recent"] = list(self._recent)[-recent:]
+        return out
+
+    def reset(self):
+        with self._lock:
+            self._open.clear()
+            self._recent.clear()
+            self.histograms.clear()
+            self.no_frame.clear()
+
+    def dump(self) -> str:
+        snap = self.snapshot()
+        lines = [f"input trace ({'on' if snap['enabled'] else 'off'}), open={snap['open']}, "
+                 f"no_frame={snap['no_frame'] or 0}"]
+        for src, stages in sorted(snap["sources"].items()):
+            lines.append(f"[{src}] {stages['total']['count']} traced")
+            lines.append(f"  {'stage':<9}{'mean':>9}{'p50':>9}{'p95':>9}{'p99':>9}{'max':>9}  (ms)")
+            for stage in STAGES:
+                s = stages[stage]
+                lines.append(f"  {stage:<9}{s['mean_ms']:>9.3f}{s['p50_ms']:>9.3f}{s['p95_ms']:>9.3f}"
+                             f"{s['p99_ms']:>9.3f}{s['max_ms']:>9.3f}")
+        return "\n".join(lines)
+
+
+tracer = InputTracer()
+
+
+def get_tracer() -> InputTracer:
+    return tracer
@@ -0,0 +1,235 @@
+# src/controls/rotary_acceleration.py
+#
+# Velocity-sensitive layer between RotaryControl and the scroll handlers.
+#
+#   RotaryControl --feed(+1/-1)--> RotaryAccelerator --callback(delta, detents)--> UI
+#
+# Each detent is scaled by the current spin rate (detents/second) through a
+# configurable step curve, and detents that arrive while the UI is still
+# handling the previous delta are summed into one call, so a fast spin
+# becomes a few multi-row jumps (one scroll + one render each) instead of a
+# render per detent. The raw signed detent count behind each delta is passed
+# along too, for gestures measured in knob movement rather than rows.
+#
+# Run as a module to replay recorded detent timings against a curve:
+#   python -m controls.rotary_acceleration trace.txt --render-ms 6
+# where trace.txt has one "<seconds> <+1|-1>" detent per line.
+
+import argparse
+import logging
+import threading
+import time
+from collections import deque
+from typing import Callable, List, Optional, Sequence, Tuple
+
+from .input_trace import tracer
+
+# (detents per second, rows per detent), ascending. The last threshold the
+# measured rate reaches wins.
+DEFAULT_CURVE: List[Tuple[float, int]] = [
+    (0, 1),
+    (10, 2),
+    (18, 4),
+    (30, 8),
+]
+
+
+def parse_curve(curve) -> List[Tuple[float, int]]:
+    """Normalise a curve from config ([[rate, step], ...] or {rate: step})."""
+    if not curve:
+        return list(DEFAULT_CURVE)
+    pairs = curve.items() if isinstance(curve, dict) else curve
+    out = sorted((float(rate), max(1, int(step))) for rate, step in pairs)
+    if out[0][0] > 0:
+        out.insert(0, (0.0, 1))
+    return out
+
+
+class RotaryAccelerator:
+    def __init__(
+        self,
+        callback: Callable[[int, int], None],
+        curve=None,
+        rate_window: float = 0.25,
+        min_detents: int = 3,
+        accelerate: Optional[Callable[[], bool]] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """
+        callback    - receives the summed, signed row delta (never 0) and
+                      the signed number of detents it was made from
+        curve       - step curve, see DEFAULT_CURVE / parse_curve()
+        rate_window - seconds of detent history used to measure the rate
+        min_detents - detents in the window before any acceleration applies
+                      (a single quick double-click stays 1:1)
+        accelerate  - optional predicate; when it returns False detents are
+                      passed 1:1 (still coalesced), e.g. for volume screens
+        """
+        self.logger = logging.getLogger(self.__class__.__name__)
+        self.logger.setLevel(logging.INFO)
+
+        self.callback = callback
+        self.curve = parse_curve(curve)
+        self.rate_window = rate_window
+        self.min_detents = max(2, min_detents)
+        self.accelerate = accelerate
+        self.clock = clock
+
+        self._times = deque()
+        self._last_direction = 0
+        self._pending = 0
+        self._pending_detents = 0
+        self._pending_traces: List[int] = []   # input traces riding on _pending
+        self._cond = threading.Condition()
+        self._running = True
+        self._worker = threading.Thread(target=self._run, name="RotaryAccelerator", daemon=True)
+        self._worker.start()
+
+    # ------------------------------------------------------------------
+    #   Input side (RotaryControl thread)
+    # ------------------------------------------------------------------
+    def feed(self, direction: int):
+        """RotaryControl rotation_callback: one detent, +1 or -1."""
+        accelerate = True
+        if self.accelerate is not None:
+            try:
+                accelerate = bool(self.accelerate())
+            except Exception:
+                accelerate = False
+        steps = self.step(direction, self.clock()) if accelerate else (1 if direction > 0 else -1)
+        with self._cond:
+            if self._pending and (self._pending > 0) != (steps > 0):
+                # reversal cancels whatever has not been shown yet
+                self._pending = 0
+                self._pending_detents = 0
+            self._pending += steps
+            self._pending_detents += 1 if steps > 0 else -1
+            self._pending_traces.extend(tracer.current())
+            self._cond.notify()
+
+    def step(self, direction: int, now: float) -> int:
+        """Signed rows for one detent at time `now` (pure; used by replay too)."""
+        direction = 1 if direction > 0 else -1
+        if direction != self._last_direction:
+            self._times.clear()
+            self._last_direction = direction
+        self._times.append(now)
+        while now - self._times[0] > self.rate_window:
+            self._times.popleft()
+        return direction * self.steps_for(self.rate())
+
+    def rate(self) -> float:
+        if len(self._times) < self.min_detents:
+            return 0.0
+        span = self._times[-1] - self._times[0]
+        return (len(self._times) - 1) / span if span > 0 else float("inf")
+
+    def steps_for(self, rate: float) -> int:
+        steps = 1
+        for threshold, s in self.curve:
+            if rate >= threshold:
+                steps = s
+            else:
+                break
+        return steps
+
+    # ------------------------------------------------------------------
+    #   Delivery side (worker thread)
+    # ------------------------------------------------------------------
+    def _run(self):
+        while True:
+            with self._cond:
+                while self._running and not self._pending:
+                    self._cond.wait()
+                if not self._running:
+                    return
+                delta, self._pending = self._pending, 0
+                detents, self._pending_detents = self._pending_detents, 0
+                traces, self._pending_traces = self._pending_traces, []
+            try:
+                with tracer.activate(traces):
+                    self.callback(delta, detents)
+            except Exception:
+                self.logger.exception("Rotary callback failed")
+
+    def stop(self):
+        with self._cond:
+            self._running = False
+            self._cond.notify()
+
+
+# ----------------------------------------------------------------------
+#   Replay harness
+# ----------------------------------------------------------------------
+def replay(events: Sequence[Tuple[float, int]], curve=None, rate_window=0.25, render_ms=5.0, min_detents=3):
+    """
+    Replay (time, direction) detents through the curve, modelling a UI that
+    takes render_ms per delivered delta. Returns (deliveries, rows_moved),
+    deliveries being a list of (time, delta).
+    """
+    acc = RotaryAccelerator.__new__(RotaryAccelerator)
+    acc.curve = parse_curve(curve)
+    acc.rate_window = rate_window
+    acc.min_detents = max(2, min_detents)
+    acc._times = deque()
+    acc._last_direction = 0
+
+    busy_until = 0.0
+    pending = 0
+    deliveries = []
+    for t, direction in events:
+        if pending and t >= busy_until:
+            deliveries.append((busy_until, pending))
+            busy_until += render_ms / 1000.0
+            pending = 0
+        steps = acc.step(direction, t)
+        if pending and (pending > 0) != (steps > 0):
+            pending = 0
+        pending += steps
+        if t >= busy_until:
+            deliveries.append((t, pending))
+            busy_until = t + render_ms / 1000.0
+            pending = 0
+    if pending:
+        deliveries.append((busy_until, pending))
+    return deliveries, sum(d for _, d in deliveries)
+
+
+def _load_trace(path) -> List[Tuple[float, int]]:
+    events = []
+    with open(path) as f:
+        for line in f:
+            line = line.split("#", 1)[0].strip()
+            if line:
+                t, d = line.split()[:2]
+                events.append((float(t), int(d)))
+    return events
+
+
+def _demo_trace() -> List[Tuple[float, int]]:
+    # Slow browse, a hard flick, a medium spin, then fine adjustment back
+    events, t = [], 0.0
+    for gap, n, d in ((0.25, 5, 1), (0.02, 40, 1), (0.06, 20, 1), (0.3, 3, -1)):
+        for _ in range(n):
+            t += gap
+            events.append((round(t, 4), d))
+        t += 0.5
+    return events
+
+
+if __name__ == "__main__":
+    ap = argparse.ArgumentParser(description="Replay rotary detent timings through the acceleration curve.")
+    ap.add_argument("trace", nargs="?", help="file of '<seconds> <+1|-1>' lines (default: built-in demo)")
+    ap.add_argument("--render-ms", type=float, default=5.0, help="modelled time to scroll+render one delta")
+    ap.add_argument("--window", type=float, default=0.25, help="rate window in seconds")
+    ap.add_argument("--curve", default=None, help="e.g. '0:1,10:2,18:4,30:8'")
+    args = ap.parse_args()
+
+    curve = [tuple(p.split(":")) for p in args.curve.split(",")] if args.curve else None
+    events = _load_trace(args.trace) if args.trace else _demo_trace()
+    deliveries, rows = replay(events, curve, args.window, args.render_ms)
+
+    print(f"{len(events)} detents -> {len(deliveries)} scroll+render calls, net {rows:+d} rows")
+    print(f"curve: {parse_curve(curve)}")
+    for t, delta in deliveries:
+        print(f"  {t:8.3f}s  {delta:+d}")
@@ -1,7 +1,27 @@
 import logging
+import queue
+import threading
 import time
 import RPi.GPIO as GPIO
 from .gpio_setup_module import GPIOSetup  # Import the GPIO setup module
+from .input_trace import tracer
+
+# Quadrature decoder: index is (previous AB << 2) | current AB, value is the
+# step (+1 clockwise, -1 counter-clockwise, 0 for no change or an invalid
+# double transition, i.e. contact bounce or a missed edge).
+# Clockwise runs 00 -> 10 -> 11 -> 01 -> 00.
+QUAD_TABLE = (
+    0, -1, +1, 0,
+    +1, 0, 0, -1,
+    -1, 0, 0, +1,
+    0, +1, -1, 0,
+)
+
+# Event kinds on the queue
+EV_ROTATE = "rotate"
+EV_PRESS = "press"
+EV_LONG_PRESS = "long_press"
+
 
 class RotaryControl:
     def __init__(
@@ -10,10 +30,20 @@ class RotaryControl:
         rotation_callback=None,
         button_callback=None,
         long_press_callback=None,
-        long_press_threshold=2.5  # Long press threshold in seconds
+        long_press_threshold=2.5,  # Long press threshold in seconds
+        use_interrupts=True,       # edge events; falls back to polling if unavailable
+        poll_interval=0.005,       # polling fallback period (seconds)
+        debounce=0.02,             # button debounce (seconds)
+        steps_per_detent=4,        # quadrature transitions per detent
     ):
         """
         Initializes the RotaryControl with GPIO setup already provided.
+
+        Edges on CLK/DT/SW are decoded (table-driven) on the GPIO event
+        thread and pushed as timestamped events onto a queue; start() drains
+        the queue and runs the callbacks, so a slow UI callback never makes
+        the decoder miss transitions. Long press is a timer armed on press,
+        not a loop watching the pin.
         """
         self.logger = logging.getLogger(self.__class__.__name__)
         self.logger.setLevel(logging.DEBUG)  # Set to DEBUG for detailed logs
@@ -26,6 +56,10 @@ class RotaryControl:
         self.button_callback = button_callback
         self.long_press_callback = long_press_callback
         self.long_press_threshold = long_press_threshold
+        self.use_interrupts = use_interrupts
+        self.poll_interval = poll_interval
+        self.debounce = debounce
+        self.steps_per_detent = steps_per_detent
 
         # Use GPIO pins from the provided gpio_setup
         self.CLK_PIN = self.gpio_setup.CLK_PIN
@@ -34,8 +68,16 @@ class RotaryControl:
 
         # Variables for rotary state
         self.last_encoded = self._read_encoder()  # To track the previous state of CLK and DT
-        self.full_cycle = 0  # To track full quadrature cycles
+        self.full_cycle = 0  # Quadrature steps since the last detent
         self.button_last_state = self._read_button_state()  # Save the initial state of the button
+        self._button_changed_at = 0.0
+        self._long_press_timer = None
+        self._long_press_fired = False
+
+        self.events = queue.Queue()  # (timestamp, kind, value)
+        self.mode = None             # "interrupt" | "polling" once started
+        self._decode_lock = threading.Lock()
+        self._running = False
 
         self.logger.debug("RotaryControl initialized using GPIO setup.")
 
@@ -49,66 +91,138 @@ class RotaryControl:
         """Read the current state of the button."""
         return GPIO.input(self.SW_PIN)
 
+    # ------------------------------------------------------------------
+    #   Decoding (GPIO event thread, or the polling loop)
+    # ------------------------------------------------------------------
+    def _decode(self, now):
+        with self._decode_lock:
+            current_encoded = self._read_encoder()
+            if current_encoded == self.last_encoded:
+                return
+            self.full_cycle += QUAD_TABLE[(self.last_encoded << 2) | current_encoded]
+            self.last_encoded = current_encoded
+
+            # Register a single detent after a full cycle
+            if abs(self.full_cycle) >= self.steps_per_detent:
+                direction = 1 if self.full_cycle > 0 else -1
+                self.full_cycle = 0
+                self.events.put((now, EV_ROTATE, direction))
+
+    def _button_edge(self, now):
+        button_state = self._read_button_state()
+        if button_state == self.button_last_state or now - self._button_changed_at < self.debounce:
+            return
+        self.button_last_state = button_state
+        self._button_changed_at = now
+
+        if button_state == GPIO.LOW:
+            # Pressed: long press fires from a timer if the button is still held
+            self._long_press_fired = False
+            self._cancel_long_press()
+            self._long_press_timer = threading.Timer(self.long_press_threshold, self._on_long_press)
+            self._long_press_timer.daemon = True
+            self._long_press_timer.start()
+        else:
+            # Released: a short press unless the long press already fired
+            self._cancel_long_press()
+            if not self._long_press_fired:
+                self.events.put((now, EV_PRESS, None))
+
+    def _on_long_press(self):
+        if self._read_button_state() == GPIO.LOW:
+            self._long_press_fired = True
+            self.events.put((time.monotonic(), EV_LONG_PRESS, None))
+
+    def _cancel_long_press(self):
+        if self._long_press_timer is not None:
+            self._long_press_timer.cancel()
+            self._long_press_timer = None
+
+    def _on_encoder_edge(self, channel):
+        self._decode(time.monotonic())
+
+    def _on_button_edge(self, channel):
+        self._button_edge(time.monotonic())
+
+    # ------------------------------------------------------------------
+    #   Run loop
+    # ------------------------------------------------------------------
     def start(self):
-        """Start listening to rotary events."""
-        self.logger.debug("RotaryControl started listening to rotary events.")
-        try:
-            # Read the initial encoder state
-            self.last_encoded = self._read_encoder()
-
-            while True:
-                # Read the current encoder state
-                current_encoded = self._read_encoder()
-
-                # Detect changes in state
-                if current_encoded != self.last_encoded:
-                    # Determine direction based on state transitions
-                    if (self.last_encoded == 0b00 and current_encoded == 0b10) or \
-                       (self.last_encoded == 0b10 and current_encoded == 0b11) or \
-                       (self.last_encoded == 0b11 and current_encoded == 0b01) or \
-                       (self.last_encoded == 0b01 and current_encoded == 0b00):
-                        self.full_cycle += 1  # Clockwise step
-                    elif (self.last_encoded == 0b00 and current_encoded == 0b01) or \
-                         (self.last_encoded == 0b01 and current_encoded == 0b11) or \
-                         (self.last_encoded == 0b11 and current_encoded == 0b10) or \
-                         (self.last_encoded == 0b10 and current_encoded == 0b00):
-                        self.full_cycle -= 1  # Counter-clockwise step
-
-                    # Register a single detent after a full cycle
-                    if abs(self.full_cycle) == 4:  # Full quadrature cycle detected
-                        direction = 1 if self.full_cycle > 0 else -1
-                        self.logger.debug(f"Scrolling in direction: {direction}")
-                        if self.rotation_callback:
-                            self.rotation_callback(direction)
-                        self.full_cycle = 0  # Reset cycle counter
-
-                    self.last_encoded = current_encoded  # Update last state
-
-                # Poll the button state
-                button_state = self._read_button_state()
-                if button_state == GPIO.LOW and self.button_last_state == GPIO.HIGH:
-                    press_start_time = time.time()
-                    while GPIO.input(self.SW_PIN) == GPIO.LOW:
-                        if time.time() - press_start_time > self.long_press_threshold:
-                            if self.long_press_callback:
-                                self.long_press_callback()
-                            break
-                    else:
-                        if time.time() - press_start_time < self.long_press_threshold:
-                            if self.button_callback:
-                                self.button_callback()
-
-                # Update the last state for the button
-                self.button_last_state = button_state
-
-                # Add a small delay to avoid CPU overuse
-                time.sleep(0.01)
+        """Start listening to rotary events (blocks; run it on a thread)."""
+        self._running = True
+        self.last_encoded = self._read_encoder()
+        self.button_last_state = self._read_button_state()
+
+        if self.use_interrupts and self._enable_interrupts():
+            self.mode = "interrupt"
+            self.logger.debug("RotaryControl started listening to rotary events (edge interrupts).")
+            poller = None
+        else:
+            self.mode = "polling"
+            self.logger.info(f"RotaryControl polling every {self.poll_interval * 1000:.0f} ms "
+                             f"(edge detection unavailable or disabled).")
+            poller = threading.Thread(target=self._poll_loop, name="RotaryPoll", daemon=True)
+            poller.start()
 
+        try:
+            self._dispatch_loop()
         except KeyboardInterrupt:
             self.logger.info("RotaryControl terminated by user.")
             self.stop()
 
+    def _enable_interrupts(self):
+        try:
+            GPIO.add_event_detect(self.CLK_PIN, GPIO.BOTH, callback=self._on_encoder_edge)
+            GPIO.add_event_detect(self.DT_PIN, GPIO.BOTH, callback=self._on_encoder_edge)
+            GPIO.add_event_detect(self.SW_PIN, GPIO.BOTH, callback=self._on_button_edge)
+            return True
+        except Exception as e:
+            self.logger.warning(f"GPIO edge detection failed ({e}); falling back to polling.")
+            self._disable_interrupts()
+            return False
+
+    def _disable_interrupts(self):
+        for pin in (self.CLK_PIN, self.DT_PIN, self.SW_PIN):
+            try:
+                GPIO.remove_event_detect(pin)
+            except Exception:
+                pass
+
+    def _poll_loop(self):
+        while self._running:
+            now = time.monotonic()
+            self._decode(now)
+            self._button_edge(now)
+            time.sleep(self.poll_interval)
+
+    def _dispatch_loop(self):
+        while self._running:
+            item = self.events.get()
+            if item is None:
+                break
+            t, kind, value = item
+            # t is the edge's own timestamp, so queueing shows up in the trace
+            try:
+                with tracer.activate(tracer.begin("rotary", kind, t)):
+                    if kind == EV_ROTATE:
+                        self.logger.debug(f"Scrolling in direction: {value}")
+                        if self.rotation_callback:
+                            self.rotation_callback(value)
+                    elif kind == EV_PRESS:
+                        if self.button_callback:
+                            self.button_callback()
+                    elif kind == EV_LONG_PRESS:
+                        if self.long_press_callback:
+                            self.long_press_callback()
+            except Exception:
+                self.logger.exception(f"Rotary {kind} callback failed")
+
     def stop(self):
         """Cleans up GPIO resources using the GPIOSetup instance."""
+        self._running = False
+        self._cancel_long_press()
+        if self.mode == "interrupt":
+            self._disable_interrupts()
+        self.events.put(None)
         self.gpio_setup.cleanup()
         self.logger.info("GPIO cleanup complete.")
@@ -4,18 +4,33 @@ import time
 import threading
 from PIL import Image, ImageDraw, ImageFont, ImageSequence
 from luma.core.interface.serial import spi
+from luma.core.device import dummy
 from luma.oled.device import ssd1322
 
+from controls.input_trace import tracer
+
 
 class DisplayManager:
     def __init__(self, config):
-        # SPI connection for SSD1322 (256x64), rotate=2 for your panel orientation
-        self.serial = spi(device=0, port=0)
-        self.oled = ssd1322(self.serial, width=256, height=64, rotate=2)
         self.icons = {}
         self.config = config or {}
+        rotation = self.config.get('rotation', 2)
+
+        if self.config.get('device', 'ssd1322') == 'dummy':
+            # In-memory framebuffer (no SPI); for benchmarks against a fake Volumio
+            self.serial = None
+            self.oled = dummy(width=256, height=64, rotate=rotation, mode="RGB")
+        else:
+            # SPI connection for SSD1322 (256x64), rotate=2 for your panel orientation
+            self.serial = spi(device=0, port=0)
+            self.oled = ssd1322(self.serial, width=256, height=64, rotate=rotation)
         self.lock = threading.Lock()
 
+        # Every frame goes through oled.display(); wrap it once so input traces
+        # can be closed against the frame that shows them
+        self._submit_frame = self.oled.display
+        self.oled.display = self._display_traced
+
         # Logger
         self.logger = logging.getLogger(self.__class__.__name__)
         self.logger.setLevel(logging.WARNING)
@@ -53,6 +68,11 @@ class DisplayManager:
             except Exception as e:
                 self.logger.error(f"Error in callback {cb}: {e}")
 
+    def _display_traced(self, image):
+        submitted = tracer.frame_begin()
+        self._submit_frame(image)
+        tracer.frame_end(submitted)
+
     # ---------- Font loading ----------
 
     def _load_fonts(self):
@@ -0,0 +1,148 @@
+# src/display/image_pipeline.py
+#
+# One-off preprocessing for art and icons shown on the SSD1322 (4-bit, 16
+# grey levels). Run once per image and cache the result; the output is an
+# "L" image whose values are already exact panel levels (k * 17), so luma's
+# own conversion is lossless and the render path only pastes.
+#
+# Steps: flatten alpha on black -> linear-light luminance -> downscale in
+# linear light -> sRGB-encode -> contrast stretch -> quantise to 16 levels
+# with ordered (Bayer) or error-diffusion (Floyd-Steinberg) dithering.
+#
+# NumPy is optional; without it a PIL-only path gives the same output format
+# with plain (gamma-encoded) luminance.
+
+from typing import Tuple
+
+from PIL import Image, ImageOps
+
+try:
+    import numpy as np
+except ImportError:  # optional dependency
+    np = None
+
+LEVELS = 16
+
+_BAYER_4X4 = (
+    (0, 8, 2, 10),
+    (12, 4, 14, 6),
+    (3, 11, 1, 9),
+    (15, 7, 13, 5),
+)
+
+_palettes = {}
+
+
+def flatten(img: Image.Image, background=(0, 0, 0)) -> Image.Image:
+    """RGB copy of `img` with any transparency composited onto `background`."""
+    if img.mode in ("RGBA", "LA") or (img.mode == "P" and "transparency" in img.info):
+        img = img.convert("RGBA")
+        bg = Image.new("RGB", img.size, background)
+        bg.paste(img, mask=img.split()[3])
+        return bg
+    return img.convert("RGB")
+
+
+# ----------------------------------------------------------------------
+#   Luminance (gamma-correct with NumPy)
+# ----------------------------------------------------------------------
+def _srgb_to_linear(a):
+    return np.where(a <= 0.04045, a / 12.92, ((a + 0.055) / 1.055) ** 2.4)
+
+
+def _linear_to_srgb(a):
+    return np.where(a <= 0.0031308, a * 12.92, 1.055 * np.power(a, 1 / 2.4) - 0.055)
+
+
+def luminance(img: Image.Image, size: Tuple[int, int] = None) -> Image.Image:
+    """
+    Greyscale "L" image, optionally resized to `size`. With NumPy the
+    luminance is computed and resampled in linear light, so thin bright
+    detail does not darken or band when art is shrunk.
+    """
+    rgb = flatten(img)
+    if np is None:
+        grey = rgb.convert("L")
+        return grey.resize(size, Image.LANCZOS) if size else grey
+
+    if size and (rgb.width > 4 * size[0] and rgb.height > 4 * size[1]):
+        # Cheap box pre-shrink for large sources; the final resample stays linear
+        rgb = rgb.reduce(max(1, min(rgb.width // (2 * size[0]), rgb.height // (2 * size[1]))))
+
+    lin = _srgb_to_linear(np.asarray(rgb, dtype=np.float32) / 255.0)
+    y = lin[..., 0] * 0.2126 + lin[..., 1] * 0.7152 + lin[..., 2] * 0.0722
+    if size:
+        y = np.asarray(Image.fromarray(y.astype(np.float32), mode="F").resize(size, Image.LANCZOS))
+    encoded = _linear_to_srgb(np.clip(y, 0.0, 1.0))
+    return Image.fromarray((encoded * 255.0 + 0.5).astype(np.uint8), mode="L")
+
+
+def stretch(grey: Image.Image, cutoff: float = 1.0) -> Image.Image:
+    """Contrast stretch so the darkest/brightest `cutoff`% map to black/white."""
+    if np is None:
+        return ImageOps.autocontrast(grey, cutoff=cutoff)
+    a = np.asarray(grey, dtype=np.float32)
+    lo, hi = np.percentile(a, (cutoff, 100.0 - cutoff))
+    if hi - lo < 8:
+        return grey  # flat image (logo on a solid field); leave it alone
+    a = np.clip((a - lo) * (255.0 / (hi - lo)), 0, 255)
+    return Image.fromarray((a + 0.5).astype(np.uint8), mode="L")
+
+
+# ----------------------------------------------------------------------
+#   Quantisation to panel levels
+# ----------------------------------------------------------------------
+def _grey_palette(levels: int) -> Image.Image:
+    pal = _palettes.get(levels)
+    if pal is None:
+        step = 255 / (levels - 1)
+        values = []
+        for k in range(levels):
+            v = int(round(k * step))
+            values.extend((v, v, v))
+        values.extend((0, 0, 0) * (256 - levels))
+        pal = Image.new("P", (1, 1))
+        pal.putpalette(values)
+        _palettes[levels] = pal
+    return pal
+
+
+def quantise(grey: Image.Image, levels: int = LEVELS, dither: str = "fs") -> Image.Image:
+    """
+    Map an "L" image onto `levels` evenly spaced greys.
+    dither: "fs" (Floyd-Steinberg), "bayer" (4x4 ordered) or "none".
+    """
+    step = 255 / (levels - 1)
+
+    if dither == "bayer" and np is not None:
+        a = np.asarray(grey, dtype=np.float32) * ((levels - 1) / 255.0)
+        h, w = a.shape
+        threshold = (np.array(_BAYER_4X4, dtype=np.float32) + 0.5) / 16.0
+        threshold = np.tile(threshold, ((h + 3) // 4, (w + 3) // 4))[:h, :w]
+        q = np.clip(np.floor(a + threshold), 0, levels - 1)
+        return Image.fromarray((q * step + 0.5).astype(np.uint8), mode="L")
+
+    if dither in ("fs", "bayer"):
+        # PIL's C quantiser does the error diffusion
+        return grey.convert("RGB").quantize(
+            palette=_grey_palette(levels), dither=Image.FLOYDSTEINBERG
+        ).convert("L")
+
+    lut = [int(round(round(v / step) * step)) for v in range(256)]
+    return grey.point(lut)
+
+
+# ----------------------------------------------------------------------
+#   Entry point
+# ----------------------------------------------------------------------
+def prepare_for_panel(img: Image.Image, size: Tuple[int, int], dither: str = "fs",
+                      contrast: bool = True, levels: int = LEVELS) -> Image.Image:
+    """
+    Full pipeline: returns an "L" image at `size` holding only panel grey
+    levels. Photos want dither="fs"/"bayer"; flat icons look cleaner with
+    dither="none" and contrast=False.
+    """
+    grey = luminance(img, tuple(size))
+    if contrast:
+        grey = stretch(grey)
+    return quantise(grey, levels=levels, dither=dither)
@@ -9,6 +9,7 @@ class Clock:
         self.config = config
         self.running = False
         self.thread = None
+        self._wake = threading.Event()   # cuts the 1 s tick short on stop()
 
         self.font_y_offsets = {
             "clock_sans":    -15,
@@ -90,23 +91,26 @@ class Clock:
         """Start continuous clock updates."""
         if not self.running:
             self.running = True
+            self._wake.clear()
             self.thread = threading.Thread(target=self.update_clock, daemon=True)
             self.thread.start()
             print("Clock: Started.")
 
-    def stop(self):
-        """Stop continuous clock updates and clear the display."""
+    def stop(self, clear=True):
+        """Stop continuous clock updates (and clear the display unless the next screen draws over it)."""
         if self.running:
             self.running = False
+            self._wake.set()
             self.thread.join()
-            self.display_manager.clear_screen()
+            if clear:
+                self.display_manager.clear_screen()
             print("Clock: Stopped.")
 
     def update_clock(self):
         """Threaded loop: updates the clock display every second."""
         while self.running:
             self.draw_clock()
-            time.sleep(1)
+            self._wake.wait(1)
 
     def toggle_play_pause(self):
         """Send toggle command to Volumio (if connected)."""
@@ -6,16 +6,19 @@ import time
 import subprocess
 from PIL import Image, ImageDraw, ImageFont, ImageEnhance
 from managers.menus.base_manager import BaseManager
+from display.screens.suspendable import SuspendableScreen
 
 FIFO_PATH = "/tmp/display.fifo"  # Same as ModernScreen
 
-class DigitalVUScreen(BaseManager):
+class DigitalVUScreen(SuspendableScreen, BaseManager):
     """
     Modern VU Meter screen for Quadify:
     - Draws PNG background
     - Two white needles (L/R)
     - Artist and title at top
     """
+
+    mode_name = "digitalvuscreen"
     def __init__(self, display_manager, volumio_listener, mode_manager):
         super().__init__(display_manager, volumio_listener, mode_manager)
         self.logger = logging.getLogger(self.__class__.__name__)
@@ -91,6 +94,20 @@ class DigitalVUScreen(BaseManager):
         except subprocess.CalledProcessError:
             return False
 
+    def _ensure_cava(self):
+        if not self._is_cava_running():
+            self.logger.info("DigitalVUScreen: CAVA not running, attempting to start.")
+            self._start_cava_service()
+        else:
+            self.logger.info("DigitalVUScreen: CAVA already running.")
+
+    def _on_resume(self):
+        # systemctl is slow on a Pi: check CAVA off the mode-switch path
+        threading.Thread(target=self._ensure_cava, name="CavaCheck", daemon=True).start()
+
+        # The spectrum reader is stopped while suspended
+        self._ensure_spectrum_reader()
+
     def _start_cava_service(self):
         """Starts or restarts cava.service."""
         try:
@@ -107,7 +124,7 @@ class DigitalVUScreen(BaseManager):
         self.logger.debug("DigitalVUScreen: reading from FIFO for spectrum data.")
         try:
             with open(FIFO_PATH, "r") as fifo:
-                while self.running_spectrum:
+                while self.running_spectrum and self.spectrum_thread is threading.current_thread():
                     line = fifo.readline().strip()
                     if line:
                         bars = [int(x) for x in line.split(";") if x.isdigit()]
@@ -130,7 +147,7 @@ class DigitalVUScreen(BaseManager):
     def update_display_loop(self):
         self.logger.info("update_display_loop: Thread started.")
         while not self.stop_event.is_set():
-            triggered = self.update_event.wait(timeout=0.1)
+            triggered = self.update_event.wait(timeout=self.loop_timeout(0.1))
             with self.state_lock:
                 if triggered and self.latest_state:
                     self.current_state = self.latest_state
@@ -153,14 +170,10 @@ class DigitalVUScreen(BaseManager):
         self.logger.info("start_mode: DigitalVUScreen is now active.")
 
         # Ensure CAVA is running for VU
-        if not self._is_cava_running():
-            self.logger.info("DigitalVUScreen: CAVA not running, attempting to start.")
-            self._start_cava_service()
-        else:
-            self.logger.info("DigitalVUScreen: CAVA already running.")
+        self._ensure_cava()
 
         # Start the CAVA spectrum thread if not already running
-        if not self.spectrum_thread or not self.spectrum_thread.is_alive():
+        if not self.running_spectrum or not self.spectrum_thread or not self.spectrum_thread.is_alive():
             self.running_spectrum = True
             self.spectrum_thread = threading.Thread(target=self._read_fifo, daemon=True)
             self.spectrum_thread.start()
@@ -245,7 +258,7 @@ class DigitalVUScreen(BaseManager):
         self.logger.info("update_display_loop: Thread started.")
         last_update_time = time.time()
         while not self.stop_event.is_set():
-            triggered = self.update_event.wait(timeout=0.1)
+            triggered = self.update_event.wait(timeout=self.loop_timeout(0.1))
             with self.state_lock:
                 if triggered and self.latest_state:
                     self.current_state = self.latest_state
@@ -4,8 +4,9 @@ import threading
 import time
 from PIL import Image, ImageDraw, ImageFont
 from managers.menus.base_manager import BaseManager
+from display.screens.suspendable import SuspendableScreen
 
-class MinimalScreen(BaseManager):
+class MinimalScreen(SuspendableScreen, BaseManager):
     """
     A minimalist screen style akin to Hegel’s design:
       - Large volume number on the right
@@ -14,6 +15,8 @@ class MinimalScreen(BaseManager):
       - Very minimal, white-on-black layout
     """
 
+    mode_name = "minimal"
+
     def __init__(self, display_manager, volumio_listener, mode_manager):
         super().__init__(display_manager, volumio_listener, mode_manager)
 
@@ -76,7 +79,7 @@ class MinimalScreen(BaseManager):
         and simulates progress update so the duration circle refreshes.
         """
         while not self.stop_event.is_set():
-            triggered = self.update_event.wait(timeout=0.1)
+            triggered = self.update_event.wait(timeout=self.loop_timeout(0.1))
             with self.state_lock:
                 if triggered and self.latest_state:
                     self.current_state = self.latest_state.copy()
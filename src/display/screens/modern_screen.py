@@ -9,6 +9,7 @@ from typing import Optional
 from PIL import Image, ImageDraw, ImageFont
 
 from managers.menus.base_manager import BaseManager
+from display.screens.suspendable import SuspendableScreen
 
 # IconProvider is optional: prefer a provided instance on the mode_manager,
 # otherwise try to construct one. If import fails, we'll fall back gracefully.
@@ -20,7 +21,7 @@ except Exception:  # noqa: BLE001
 FIFO_PATH = "/tmp/display.fifo"  # Path to the FIFO for CAVA data
 
 
-class ModernScreen(BaseManager):
+class ModernScreen(SuspendableScreen, BaseManager):
     """
     A 'Modern' / 'Detailed' playback screen:
       - Artist & Title (scrolling when needed)
@@ -30,6 +31,8 @@ class ModernScreen(BaseManager):
       - Small service icon (Tidal, Qobuz, Spotify, Radio Paradise, etc.)
     """
 
+    mode_name = "modern"
+
     # --------------------------- Init & wiring ---------------------------
 
     def __init__(self, display_manager, volumio_listener, mode_manager):
@@ -111,7 +114,7 @@ class ModernScreen(BaseManager):
     def update_display_loop(self):
         last_update_time = time.time()
         while not self.stop_event.is_set():
-            triggered = self.update_event.wait(timeout=0.1)
+            triggered = self.update_event.wait(timeout=self.loop_timeout(0.1))
             with self.state_lock:
                 if triggered and self.latest_state:
                     self.current_state = self.latest_state.copy()
@@ -153,7 +156,7 @@ class ModernScreen(BaseManager):
             self.logger.warning("ModernScreen: Failed to emit 'getState'. Error => %s", e)
 
         # Start spectrum thread
-        if not self.spectrum_thread or not self.spectrum_thread.is_alive():
+        if not self.running_spectrum or not self.spectrum_thread or not self.spectrum_thread.is_alive():
             self.running_spectrum = True
             self.spectrum_thread = threading.Thread(target=self._read_fifo, daemon=True)
             self.spectrum_thread.start()
@@ -165,6 +168,13 @@ class ModernScreen(BaseManager):
             self.update_thread = threading.Thread(target=self.update_display_loop, daemon=True)
             self.update_thread.start()
 
+    def _on_resume(self):
+        # Spectrum style may have been changed in the config menu while suspended
+        self.spectrum_mode = self.mode_manager.config.get("modern_spectrum_mode", "bars")
+
+        # The spectrum reader is stopped while suspended
+        self._ensure_spectrum_reader()
+
     def stop_mode(self):
         if not self.is_active:
             return
@@ -195,7 +205,7 @@ class ModernScreen(BaseManager):
 
         try:
             with open(FIFO_PATH, "r") as fifo:
-                while self.running_spectrum:
+                while self.running_spectrum and self.spectrum_thread is threading.current_thread():
                     line = fifo.readline().strip()
                     if line:
                         bars = [int(x) for x in line.split(";") if x.isdigit()]
@@ -7,14 +7,17 @@ import time
 
 from PIL import Image, ImageDraw, ImageFont, ImageSequence
 from managers.menus.base_manager import BaseManager  # Or whichever base class your project uses
+from display.screens.suspendable import SuspendableScreen
 
-class OriginalScreen(BaseManager):
+class OriginalScreen(SuspendableScreen, BaseManager):
     """
     A screen class for 'Original' playback mode. It uses VolumioListener
     for state changes and updates an 'original'-style display (e.g. a
     classic FM4-like screen).
     """
 
+    mode_name = "original"
+
     def __init__(self, display_manager, volumio_listener, mode_manager):
         super().__init__(display_manager, volumio_listener, mode_manager)
         self.logger = logging.getLogger(self.__class__.__name__)
@@ -84,7 +87,7 @@ class OriginalScreen(BaseManager):
         draws the updated display if active & mode == 'original'.
         """
         while not self.stop_event.is_set():
-            triggered = self.update_event.wait(timeout=0.1)
+            triggered = self.update_event.wait(timeout=self.loop_timeout(0.1))
             if triggered:
                 with self.state_lock:
                     state_to_process = self.latest_state
@@ -0,0 +1,99 @@
+# src/display/screens/suspendable.py
+#
+# Suspend/resume lifecycle for the playback screens.
+#
+# start_mode()/stop_mode() build a screen up and tear it down: threads are
+# joined, the panel is cleared and getState is sent again on the way back.
+# ModeManager switches screens with suspend_mode()/resume_mode() instead:
+#
+#   suspend_mode  - is_active goes False (every update loop only draws while
+#                   active), the update loop parks on its event, the spectrum
+#                   reader (if any) is told to stop so only the visible
+#                   screen reads the CAVA FIFO, nothing is joined and the
+#                   panel is left for the next screen to draw over.
+#   resume_mode   - draws the first frame straight away, in the caller, from
+#                   the listener's cached state (seek advanced by the time
+#                   since that state arrived), then hands the same state to
+#                   the update loop. No getState round trip. Per-entry
+#                   setup that start_mode does besides threads and getState
+#                   (config re-reads, CAVA check) runs in the _on_resume()
+#                   hook, which screens override.
+#
+# resume_mode() falls back to start_mode() for a screen that was never
+# started, whose update thread has died, or when there is no cached state.
+
+import threading
+import time
+
+
+class SuspendableScreen:
+    """Mixin for playback screens with the usual update-loop attributes."""
+
+    mode_name = None          # ModeManager mode this screen draws in
+    is_suspended = False
+
+    def loop_timeout(self, active_timeout):
+        """Wait for the update loop: its normal tick when shown, parked when suspended."""
+        return None if self.is_suspended else active_timeout
+
+    def suspend_mode(self):
+        if not self.is_active:
+            return
+        self.is_active = False
+        self.is_suspended = True
+        if getattr(self, "running_spectrum", False):
+            # Not joined: the reader may sit in readline() until CAVA writes again
+            self.running_spectrum = False
+        self.logger.debug(f"{self.__class__.__name__}: suspended.")
+
+    def resume_mode(self):
+        was_suspended, self.is_suspended = self.is_suspended, False
+        state = self.cached_state() if was_suspended else None
+        if not state or not self.update_thread.is_alive():
+            self.start_mode()
+            return
+        if self.mode_manager.get_mode() != self.mode_name:
+            self.logger.warning(f"{self.__class__.__name__}: Attempted resume, but mode != '{self.mode_name}'.")
+            return
+
+        self.is_active = True
+        try:
+            self._on_resume()
+        except Exception as e:
+            self.logger.warning(f"{self.__class__.__name__}: resume hook failed: {e}")
+        if hasattr(self, "reset_scrolling"):
+            self.reset_scrolling()
+        self.draw_display(state)
+
+        # Unpark the update loop on the same state (it redraws from there)
+        with self.state_lock:
+            self.latest_state = dict(state)
+        self.update_event.set()
+        self.logger.debug(f"{self.__class__.__name__}: resumed from cached state.")
+
+    def _on_resume(self):
+        """Per-entry setup from start_mode that a resume must repeat (override)."""
+
+    def _ensure_spectrum_reader(self):
+        """(Re)start _read_fifo; a reader left over from a suspend exits on its next line."""
+        if self.running_spectrum and self.spectrum_thread and self.spectrum_thread.is_alive():
+            return
+        self.running_spectrum = True
+        self.spectrum_thread = threading.Thread(target=self._read_fifo, daemon=True)
+        self.spectrum_thread.start()
+
+    def cached_state(self):
+        """Listener's last pushState, with the seek position brought up to now."""
+        listener = self.volumio_listener
+        if not listener:
+            return None
+        state = listener.get_current_state()
+        if not state:
+            return None
+        received_at = getattr(listener, "state_received_at", None)
+        if received_at and (state.get("status") or "").lower() == "play":
+            try:
+                state["seek"] = int(state.get("seek") or 0) + int((time.monotonic() - received_at) * 1000)
+            except (TypeError, ValueError):
+                pass
+        return state
@@ -1,12 +1,12 @@
-import os
 import logging
 from PIL import Image, ImageDraw, ImageFont
 import threading
 import time
-import requests
-from io import BytesIO
 
-class WebRadioScreen:
+from handlers.album_art_cache import get_album_art_cache
+from display.screens.suspendable import SuspendableScreen
+
+class WebRadioScreen(SuspendableScreen):
     """
     A simplified WebRadio screen that displays:
       - Line 1: Title (truncated to 20 characters)
@@ -17,6 +17,8 @@ class WebRadioScreen:
     Additionally, if album art is available it is pasted in the upper-right corner.
     """
 
+    mode_name = "webradio"
+
     def __init__(self, display_manager, volumio_listener, mode_manager):
         self.logger = logging.getLogger(self.__class__.__name__)
         self.logger.setLevel(logging.ERROR)
@@ -38,6 +40,10 @@ class WebRadioScreen:
         self.font_label = display_manager.fonts.get('radio_bitrate', ImageFont.load_default())
         self.font_small = display_manager.fonts.get('radio_small', ImageFont.load_default())
 
+        # Station logos / album art (memory + disk cache, fetched off the render path)
+        self.art_cache = get_album_art_cache()
+        self.album_art_size = (60, 60)
+
         # Display update thread
         self.update_thread = threading.Thread(target=self.update_display_loop, daemon=True)
         self.update_thread.start()
@@ -81,7 +87,7 @@ class WebRadioScreen:
         Wait for updates (or timeout periodically) and then refresh the display.
         """
         while not self.stop_event.is_set():
-            triggered = self.update_event.wait(timeout=0.1)
+            triggered = self.update_event.wait(timeout=self.loop_timeout(0.1))
             with self.state_lock:
                 if triggered and self.latest_state:
                     self.current_state = self.latest_state.copy()
@@ -186,39 +192,11 @@ class WebRadioScreen:
     # ------------------------------------------------------------------
     def get_albumart(self, url):
         """
-        Download and return an Image object from the given album art URL.
-        If no URL is provided or downloading fails, load the default album art
-        specified in the display configuration.
+        Return panel-ready album art for the given URL from the art cache.
+        Never blocks: until the art has been fetched (or if the URL is empty or
+        fails), the default album art from the display configuration is returned.
         """
-        if not url:
-            default_path = self.display_manager.config.get("default_album_art")
-            if default_path and os.path.exists(default_path):
-                try:
-                    img = Image.open(default_path)
-                    return img.convert("RGB")
-                except Exception as e:
-                    self.logger.error(f"Failed to load default album art from {default_path}: {e}")
-                    return None
-            else:
-                self.logger.error("No album art URL provided and default album art not found.")
-                return None
-
-        try:
-            response = requests.get(url, timeout=3)
-            response.raise_for_status()
-            img = Image.open(BytesIO(response.content))
-            return img.convert("RGB")
-        except Exception as e:
-            self.logger.error(f"Failed to load album art from {url}: {e}")
-            default_path = self.display_manager.config.get("default_album_art")
-            if default_path and os.path.exists(default_path):
-                try:
-                    img = Image.open(default_path)
-                    return img.convert("RGB")
-                except Exception as e:
-                    self.logger.error(f"Failed to load default album art from {default_path}: {e}")
-                    return None
-            return None
+        return self.art_cache.get(url, self.album_art_size, on_ready=self.update_event.set)
 
     # ------------------------------------------------------------------
     # Drawing the Screen
@@ -275,7 +253,7 @@ class WebRadioScreen:
             draw.text((margin, artist_y), artist, font=self.font_small, fill="white")
 
         # Draw a solid horizontal separator.
-        album_art_width = 60              # The width of your album art.
+        album_art_width = self.album_art_size[0]  # The width of your album art.
         gap_between_line_and_art = 15     # Gap between the end of the line and the album art.
         line_end_x = screen_width - margin - album_art_width - gap_between_line_and_art
         draw.line((margin, divider_y, line_end_x, divider_y), fill="white")
@@ -296,9 +274,7 @@ class WebRadioScreen:
         if albumart_url:
             albumart = self.get_albumart(albumart_url)
             if albumart:
-                album_art_size = (album_art_width, album_art_width)
-                albumart = albumart.resize(album_art_size, Image.LANCZOS)
-                art_x = screen_width - album_art_size[0] - margin
+                art_x = screen_width - self.album_art_size[0] - margin
                 art_y = margin
                 base_image.paste(albumart, (art_x, art_y))
 
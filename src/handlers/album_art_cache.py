@@ -0,0 +1,304 @@
+# src/handlers/album_art_cache.py
+#
+# Album art / station logo cache for the playback screens.
+#
+#   get(url, size)   -> panel-ready PIL image (greyscale, resized) or a
+#                       placeholder while the real art is fetched in the
+#                       background; never blocks on the network.
+#   prefetch(url)    -> warm the cache (wired to pushTrack / pushState).
+#
+# Three tiers: an in-memory LRU of panel-ready images keyed by (url, size),
+# a size-capped disk cache of decoded art in src/cache/album_art/<md5>.png
+# (with ETag / Last-Modified revalidation metadata beside it), and the
+# network fetch itself, done on a small worker pool.
+
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from io import BytesIO
+from typing import Callable, Dict, Optional, Tuple
+
+import requests
+from PIL import Image
+
+from display.image_pipeline import prepare_for_panel
+from network.async_core import get_network_core
+
+CACHE_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "cache", "album_art")
+
+_cache = None
+_cache_lock = threading.Lock()
+
+
+def start_album_art_cache(**kwargs):
+    """Create the process-wide cache with explicit settings (idempotent)."""
+    global _cache
+    with _cache_lock:
+        if _cache is None:
+            _cache = AlbumArtCache(**kwargs)
+        return _cache
+
+
+def get_album_art_cache():
+    """Return the process-wide cache, creating one with defaults if needed."""
+    return _cache or start_album_art_cache()
+
+
+class AlbumArtCache:
+    SOURCE_MAX = 256          # longest side kept on disk; the panel is 256x64
+    REVALIDATE_AFTER = 3600   # seconds before a disk entry is checked with the server
+    RETRY_FAILED_AFTER = 30   # seconds before a failed URL is tried again
+
+    def __init__(self, base_url="http://localhost:3000", cache_dir=CACHE_DIR,
+                 max_disk_mb=20, memory_items=32, workers=2, timeout=3.0,
+                 placeholder_path=None, prefetch_sizes=((60, 60),), dither="fs"):
+        self.logger = logging.getLogger(self.__class__.__name__)
+        self.logger.setLevel(logging.INFO)
+
+        self.base_url = base_url.rstrip("/")
+        self.cache_dir = cache_dir
+        self.max_disk_bytes = int(max_disk_mb * 1024 * 1024)
+        self.memory_items = memory_items
+        self.timeout = timeout
+        self.placeholder_path = placeholder_path
+        self.dither = dither
+
+        self._memory: "OrderedDict[Tuple[str, Tuple[int, int]], Image.Image]" = OrderedDict()
+        self._placeholders: Dict[Tuple[int, int], Image.Image] = {}
+        self._sizes = set(tuple(s) for s in prefetch_sizes)  # sizes screens have asked for
+        self._inflight: Dict[str, list] = {}     # url -> [on_ready callbacks]
+        self._failed: Dict[str, float] = {}      # url -> monotonic time of failure
+        self._lock = threading.Lock()
+        self._pool = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="AlbumArt")
+        self._session = requests.Session()
+        self._last_prefetch = None
+
+        os.makedirs(self.cache_dir, exist_ok=True)
+
+    # ------------------------------------------------------------------
+    #   Public API
+    # ------------------------------------------------------------------
+    def get(self, url: Optional[str], size: Tuple[int, int],
+            on_ready: Optional[Callable[[], None]] = None) -> Optional[Image.Image]:
+        """
+        Panel-ready art for `url` at `size`. Returns the placeholder (and starts
+        a background fetch) on a miss; `on_ready` is called once the art lands.
+        """
+        size = (int(size[0]), int(size[1]))
+        url = self._absolute(url)
+        if not url:
+            return self.placeholder(size)
+
+        key = (url, size)
+        with self._lock:
+            self._sizes.add(size)
+            img = self._memory.get(key)
+            if img is not None:
+                self._memory.move_to_end(key)
+                return img
+        self._schedule(url, on_ready)
+        return self.placeholder(size)
+
+    def prefetch(self, url: Optional[str]):
+        """Fetch and prepare `url` for every size requested so far."""
+        url = self._absolute(url)
+        if url and url != self._last_prefetch:
+            self._last_prefetch = url
+            self._schedule(url, None)
+
+    def attach_listener(self, volumio_listener):
+        """Prefetch art as soon as Volumio announces a new track or state."""
+        volumio_listener.track_changed.connect(self._on_track_changed, weak=False)
+        volumio_listener.state_changed.connect(self._on_state_changed, weak=False)
+
+    def placeholder(self, size: Tuple[int, int]) -> Image.Image:
+        img = self._placeholders.get(size)
+        if img is None:
+            if self.placeholder_path and os.path.exists(self.placeholder_path):
+                try:
+                    img = self._panel_ready(Image.open(self.placeholder_path), size)
+                except Exception as e:
+                    self.logger.warning(f"Could not load placeholder art {self.placeholder_path}: {e}")
+            if img is None:
+                img = Image.new("L", size, 24)
+            self._placeholders[size] = img
+        return img
+
+    # ------------------------------------------------------------------
+    #   Signal handlers
+    # ------------------------------------------------------------------
+    def _on_track_changed(self, sender, track_info=None, **kwargs):
+        self.prefetch((track_info or {}).get("albumart"))
+
+    def _on_state_changed(self, sender, state=None, **kwargs):
+        self.prefetch((state or {}).get("albumart"))
+
+    # ------------------------------------------------------------------
+    #   Fetch pipeline (worker pool)
+    # ------------------------------------------------------------------
+    def _absolute(self, url: Optional[str]) -> Optional[str]:
+        if not url:
+            return None
+        return f"{self.base_url}{url}" if url.startswith("/") else url
+
+    def _schedule(self, url: str, on_ready):
+        with self._lock:
+            failed_at = self._failed.get(url)
+            if failed_at and time.monotonic() - failed_at < self.RETRY_FAILED_AFTER:
+                return
+            waiters = self._inflight.get(url)
+            if waiters is not None:
+                if on_ready:
+                    waiters.append(on_ready)
+                return
+            self._inflight[url] = [on_ready] if on_ready else []
+        self._pool.submit(self._load, url)
+
+    def _load(self, url: str):
+        t0 = time.monotonic()
+        source = None
+        try:
+            source = self._load_source(url)
+        except Exception as e:
+            self.logger.warning(f"Album art fetch failed for {url}: {e}")
+
+        with self._lock:
+            waiters = self._inflight.pop(url, [])
+            if source is None:
+                self._failed[url] = time.monotonic()
+                return
+            self._failed.pop(url, None)
+            sizes = set(self._sizes)
+
+        prepared = {size: self._panel_ready(source, size) for size in sizes}
+        with self._lock:
+            for size, img in prepared.items():
+                self._memory[(url, size)] = img
+                self._memory.move_to_end((url, size))
+            while len(self._memory) > self.memory_items:
+                self._memory.popitem(last=False)
+        self.logger.debug(f"Album art ready in {(time.monotonic() - t0) * 1000:.0f} ms: {url}")
+
+        for cb in waiters:
+            try:
+                cb()
+            except Exception as e:
+                self.logger.error(f"Album art on_ready callback failed: {e}")
+
+    def _load_source(self, url: str) -> Optional[Image.Image]:
+        """Decoded art from disk, revalidating or refetching over HTTP when stale."""
+        path, meta_path = self._paths(url)
+        meta = self._read_meta(meta_path)
+        on_disk = os.path.exists(path)
+
+        if on_disk and time.time() - meta.get("checked_at", 0) < self.REVALIDATE_AFTER:
+            return self._open_disk(path)
+
+        headers = {}
+        if on_disk:
+            if meta.get("etag"):
+                headers["If-None-Match"] = meta["etag"]
+            if meta.get("last_modified"):
+                headers["If-Modified-Since"] = meta["last_modified"]
+
+        try:
+            status, resp_headers, body = self._http_get(url, headers)
+        except Exception:
+            if on_disk:
+                # Server unreachable: stale art beats no art
+                return self._open_disk(path)
+            raise
+
+        if status == 304 and on_disk:
+            meta["checked_at"] = time.time()
+            self._write_meta(meta_path, meta)
+            return self._open_disk(path)
+        if status != 200:
+            raise IOError(f"HTTP {status}")
+
+        img = Image.open(BytesIO(body))
+        img = img.convert("RGB")
+        img.thumbnail((self.SOURCE_MAX, self.SOURCE_MAX), Image.LANCZOS)
+        tmp = path + ".tmp"
+        img.save(tmp, "PNG")
+        os.replace(tmp, path)
+        self._write_meta(meta_path, {
+            "url": url,
+            "etag": resp_headers.get("ETag") or resp_headers.get("Etag"),
+            "last_modified": resp_headers.get("Last-Modified"),
+            "checked_at": time.time(),
+        })
+        self._enforce_disk_cap()
+        return img
+
+    def _http_get(self, url: str, headers: Dict[str, str]):
+        core = get_network_core()
+        if core is not None:
+            return core.get_bytes(url, headers=headers, timeout=self.timeout).result(self.timeout + 1)
+        resp = self._session.get(url, headers=headers, timeout=self.timeout)
+        return resp.status_code, resp.headers, resp.content
+
+    # ------------------------------------------------------------------
+    #   Disk cache
+    # ------------------------------------------------------------------
+    def _paths(self, url: str):
+        digest = hashlib.md5(url.encode("utf-8")).hexdigest()
+        base = os.path.join(self.cache_dir, digest)
+        return base + ".png", base + ".json"
+
+    @staticmethod
+    def _read_meta(meta_path: str) -> Dict:
+        try:
+            with open(meta_path, "r") as f:
+                return json.load(f)
+        except Exception:
+            return {}
+
+    @staticmethod
+    def _write_meta(meta_path: str, meta: Dict):
+        try:
+            with open(meta_path, "w") as f:
+                json.dump(meta, f)
+        except OSError:
+            pass
+
+    def _open_disk(self, path: str) -> Image.Image:
+        os.utime(path, None)  # mtime doubles as last-used for eviction
+        with Image.open(path) as img:
+            return img.convert("RGB")
+
+    def _enforce_disk_cap(self):
+        try:
+            entries = []
+            total = 0
+            for name in os.listdir(self.cache_dir):
+                if not name.endswith(".png"):
+                    continue
+                p = os.path.join(self.cache_dir, name)
+                st = os.stat(p)
+                entries.append((st.st_mtime, st.st_size, p))
+                total += st.st_size
+            if total <= self.max_disk_bytes:
+                return
+            for _, size, p in sorted(entries):
+                os.remove(p)
+                meta = p[:-4] + ".json"
+                if os.path.exists(meta):
+                    os.remove(meta)
+                total -= size
+                if total <= self.max_disk_bytes:
+                    break
+        except OSError as e:
+            self.logger.warning(f"Album art disk cache cleanup failed: {e}")
+
+    # ------------------------------------------------------------------
+    #   Panel preparation
+    # ------------------------------------------------------------------
+    def _panel_ready(self, img: Image.Image, size: Tuple[int, int]) -> Image.Image:
+        """Greyscale, resize and dither once, so the render path only has to paste."""
+        return prepare_for_panel(img, size, dither=self.dither)
@@ -0,0 +1,181 @@
+# src/handlers/boot_profiler.py
+#
+# Boot timeline: where the time goes between the process starting (systemd
+# exec of quadify.service) and the first interactive frame.
+#
+# main.py imports this module first, then marks phase boundaries with
+# boot.step("name") (each step closes the previous phase) and calls
+# boot.finish() once the UI takes input. finish() writes a compact JSON
+# report (and optionally appends it to a history file, one line per boot,
+# to compare releases); the "boot" control-socket command returns it.
+#
+# Offsets are milliseconds since the process started, taken from
+# /proc/self/stat, so interpreter start-up and imports are included.
+# Set QUADIFY_PROFILE_IMPORTS=1 to also time main.py's top-level imports.
+
+import builtins
+import json
+import logging
+import os
+import sys
+import threading
+import time
+from typing import Dict, List, Optional
+
+VERSION_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "..", "VERSION")
+REPORT_PATH = "/tmp/quadify_boot.json"
+TOP_IMPORTS = 15
+
+
+def _process_start_monotonic() -> Optional[float]:
+    """time.monotonic() value at process start (None off Linux)."""
+    try:
+        with open("/proc/self/stat") as f:
+            fields = f.read().rsplit(")", 1)[1].split()
+        start_since_boot = int(fields[19]) / os.sysconf("SC_CLK_TCK")   # field 22: starttime
+        boot_offset = time.clock_gettime(time.CLOCK_BOOTTIME) - time.monotonic()
+        return start_since_boot - boot_offset
+    except (OSError, ValueError, IndexError, AttributeError):
+        return None
+
+
+class BootProfiler:
+    def __init__(self):
+        self.logger = logging.getLogger(self.__class__.__name__)
+        self.logger.setLevel(logging.INFO)
+
+        self.loaded_at = time.monotonic()
+        self.process_start = _process_start_monotonic() or self.loaded_at
+        self.phases: List[tuple] = []          # (name, start, end)
+        self.marks: List[tuple] = []           # (name, t)
+        self.imports: Dict[str, float] = {}    # module -> inclusive ms
+        self.report: Optional[Dict] = None
+        self._current = None                   # (name, start) of the open phase
+        self._lock = threading.Lock()
+        self._import_hook = None
+
+    # ------------------------------------------------------------------
+    #   Recording
+    # ------------------------------------------------------------------
+    def step(self, name: str):
+        """Close the open phase (if any) and start `name`."""
+        now = time.monotonic()
+        with self._lock:
+            self._close(now)
+            self._current = (name, now)
+
+    def mark(self, name: str):
+        with self._lock:
+            self.marks.append((name, time.monotonic()))
+
+    def _close(self, now):
+        if self._current is not None:
+            self.phases.append((self._current[0], self._current[1], now))
+            self._current = None
+
+    def enable_import_timing(self):
+        """Time first imports made at top level (inclusive of what they pull in)."""
+        if self._import_hook is not None:
+            return
+        original = builtins.__import__
+        local = threading.local()
+
+        def timed_import(name, globals=None, locals=None, fromlist=(), level=0):
+            if level or name in sys.modules or getattr(local, "depth", 0):
+                return original(name, globals, locals, fromlist, level)
+            local.depth = 1
+            started = time.perf_counter()
+            try:
+                return original(name, globals, locals, fromlist, level)
+            finally:
+                local.depth = 0
+                self.imports[name] = self.imports.get(name, 0.0) + (time.perf_counter() - started) * 1000
+
+        self._import_hook = (original, timed_import)
+        builtins.__import__ = timed_import
+
+    def disable_import_timing(self):
+        if self._import_hook is not None and builtins.__import__ is self._import_hook[1]:
+            builtins.__import__ = self._import_hook[0]
+        self._import_hook = None
+
+    # ------------------------------------------------------------------
+    #   Report
+    # ------------------------------------------------------------------
+    def finish(self, name="first_interactive_frame", report_path=REPORT_PATH, history_path=None, extra=None):
+        """Close the timeline at `name`, write the report, and return it."""
+        now = time.monotonic()
+        with self._lock:
+            self._close(now)
+            self.marks.append((name, now))
+        self.disable_import_timing()
+        self.report = self.snapshot(end=name, extra=extra)
+        self.logger.info(f"Boot: {name} after {self.report['total_ms'] / 1000:.2f} s")
+        self._write(report_path, history_path)
+        return self.report
+
+    def snapshot(self, end=None, extra=None) -> Dict:
+        if self.report is not None and end is None:
+            return self.report
+        ms = lambda t: round((t - self.process_start) * 1000, 1)   # noqa: E731
+        with self._lock:
+            phases = list(self.phases)
+            if self._current is not None:
+                phases.append((self._current[0], self._current[1], time.monotonic()))
+            marks = list(self.marks)
+        last = marks[-1][1] if end and marks else time.monotonic()
+        report = {
+            "version": self._version(),
+            "started": time.strftime("%Y-%m-%dT%H:%M:%S",
+                                     time.localtime(time.time() - (time.monotonic() - self.process_start))),
+            "end": end,
+            "total_ms": ms(last),
+            "python_ms": ms(self.loaded_at),   # interpreter start + imports before main.py's first
+            "phases": [[n, ms(s), round((e - s) * 1000, 1)] for n, s, e in phases],
+            "marks": [[n, ms(t)] for n, t in marks],
+        }
+        if self.imports:
+            top = sorted(self.imports.items(), key=lambda kv: -kv[1])[:TOP_IMPORTS]
+            report["imports"] = [[n, round(v, 1)] for n, v in top]
+        if extra:
+            report.update(extra)
+        return report
+
+    def format(self, report: Optional[Dict] = None) -> str:
+        """Readable table of a report (the current snapshot by default)."""
+        report = report or self.snapshot()
+        lines = [f"boot {report.get('version')} {report.get('started')}: "
+                 f"{report.get('end') or 'in progress'} at {report['total_ms'] / 1000:.2f} s"]
+        lines.append(f"  {'python + early imports':<24}{0.0:>10.1f}{report['python_ms']:>10.1f}")
+        for name, start, dur in report["phases"]:
+            lines.append(f"  {name:<24}{start:>10.1f}{dur:>10.1f}")
+        for name, ms in report.get("imports", []):
+            lines.append(f"  import {name:<17}{'':>10}{ms:>10.1f}")
+        return "\n".join(lines)
+
+    def _version(self):
+        try:
+            with open(VERSION_FILE) as f:
+                return f.read().strip()
+        except OSError:
+            return None
+
+    def _write(self, report_path, history_path):
+        line = json.dumps(self.report, separators=(",", ":"))
+        for path, mode in ((report_path, "w"), (history_path, "a")):
+            if not path:
+                continue
+            try:
+                with open(path, mode) as f:
+                    f.write(line + "\n")
+            except OSError as e:
+                self.logger.warning(f"Boot: could not write {path}: {e}")
+
+
+boot = BootProfiler()
+if os.environ.get("QUADIFY_PROFILE_IMPORTS"):
+    boot.enable_import_timing()
+
+
+def get_boot_profiler() -> BootProfiler:
+    return boot
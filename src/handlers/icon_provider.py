@@ -1,21 +1,13 @@
 # src/handlers/icon_provider.py
 #
-# Lightweight icon lookup that pulls from your cached PNGs and (optionally)
-# the icons manifest written by your icon_fetcher. No dependency on
-# display_manager.icons.
+# Lightweight icon lookup by service/label name. Icons come from the shared
+# IconStore (handlers/icon_store.py), so screens and the menu reuse the same
+# decoded PNGs and prepared tiles. No dependency on display_manager.icons.
 
-import os
-import json
-from typing import Optional, Dict, List
-from PIL import Image
+from typing import Optional, List
 
-ASSETS_PNG_DIR = "/home/volumio/Quadify/src/assets/pngs"
-ASSETS_MANIFEST = "/home/volumio/Quadify/src/assets/icons_manifest.json"
-
-
-def _norm_label(s):  # type: (str) -> str
-    s = (s or "").strip()
-    return s.upper().replace(" ", "_").replace("-", "_").replace("/", "_")
+from handlers.icon_store import IconStore, get_icon_store, norm_label as _norm_label, \
+    ASSETS_PNG_DIR, ASSETS_MANIFEST
 
 
 def _variants(s):  # type: (str) -> List[str]
@@ -37,37 +29,34 @@ class IconProvider:
         img2 = ip.get_service_icon_from_state(state, size=18)
     """
 
-    def __init__(self, assets_dir=ASSETS_PNG_DIR, manifest_path=ASSETS_MANIFEST):
-        self.assets_dir = assets_dir
-        self.manifest_path = manifest_path
-        self._cache = {}        # type: Dict[str, Image.Image]  # base images by UPPER label
-        self._index = {}        # type: Dict[str, str]           # UPPER label -> absolute path
-        self._manifest = {}     # type: Dict[str, str]           # UPPER label -> absolute path
-        self.reload()
+    def __init__(self, assets_dir=ASSETS_PNG_DIR, manifest_path=ASSETS_MANIFEST, store=None):
+        if store is None:
+            default = (assets_dir, manifest_path) == (ASSETS_PNG_DIR, ASSETS_MANIFEST)
+            store = get_icon_store() if default else IconStore(assets_dir, manifest_path)
+        self.store = store
 
     # ----------------------- public API -----------------------
 
     def reload(self):
-        """(Re)load directory index and manifest (does not clear decoded image cache)."""
-        self._build_index()
-        self._load_manifest()
+        """Re-index the asset directory and manifest."""
+        self.store.reload()
 
-    def get_icon(self, key, size=None):  # type: (str, Optional[int]) -> Optional[Image.Image]
+    def get_icon(self, key, size=None, variant="normal"):  # type: (str, Optional[int], str) -> Optional[PIL.Image.Image]
         """
         Return a PIL.Image (RGBA) for 'key' (e.g. 'qobuz', 'RADIO_PARADISE').
-        If size is provided, returns a resized COPY; base image stays cached.
+        If size is provided, returns a panel-ready "L" image (flattened on black,
+        quantised to 16 greys) from the shared store.
         """
         for v in _variants(key):
-            base = self._load_base(_norm_label(v))
-            if base is not None:
-                if size:
-                    img = base.copy()
-                    img = img.resize((size, size), Image.LANCZOS)
-                    return img
-                return base
+            if size:
+                img = self.store.tile(v, size, variant)
+            else:
+                img = self.store.source(v)
+            if img is not None:
+                return img
         return None
 
-    def get_service_icon_from_state(self, state, size=None):  # type: (dict, Optional[int]) -> Optional[Image.Image]
+    def get_service_icon_from_state(self, state, size=None):  # type: (dict, Optional[int]) -> Optional[PIL.Image.Image]
         """
         Try multiple hints from a Volumio state: service, trackType, plugin, stream.
         Includes a few normalised aliases (spop->SPOTIFY, radio_paradise->RADIO_PARADISE, etc).
@@ -98,53 +87,3 @@ class IconProvider:
             if img is not None:
                 return img
         return None
-
-    # ----------------------- internals ------------------------
-
-    def _build_index(self):
-        self._index.clear()
-        if not os.path.isdir(self.assets_dir):
-            return
-        for name in os.listdir(self.assets_dir):
-            if not name.lower().endswith(".png"):
-                continue
-            label = _norm_label(os.path.splitext(name)[0])
-            self._index[label] = os.path.join(self.assets_dir, name)
-
-    def _load_manifest(self):
-        self._manifest.clear()
-        try:
-            if os.path.exists(self.manifest_path):
-                with open(self.manifest_path, "r") as f:
-                    data = json.load(f)
-
-                # support both list-of-entries and {label:path} formats
-                if isinstance(data, list):
-                    for entry in data:
-                        label = _norm_label(entry.get("label", ""))
-                        path = entry.get("path")
-                        if label and path:
-                            self._manifest[label] = path
-                elif isinstance(data, dict):
-                    for k, v in data.items():
-                        self._manifest[_norm_label(k)] = v
-        except Exception:
-            # Manifest is optional; ignore errors.
-            pass
-
-    def _load_base(self, label_upper):  # type: (str) -> Optional[Image.Image]
-        if not label_upper:
-            return None
-        if label_upper in self._cache:
-            return self._cache[label_upper]
-
-        path = self._manifest.get(label_upper) or self._index.get(label_upper)
-        if not path or not os.path.exists(path):
-            return None
-
-        try:
-            img = Image.open(path).convert("RGBA")
-            self._cache[label_upper] = img
-            return img
-        except Exception:
-            return None
@@ -0,0 +1,194 @@
+# src/handlers/icon_store.py
+#
+# One process-wide store for the PNG icons in src/assets/pngs (plus the
+# optional icons manifest), shared by MenuManager, IconProvider and the
+# playback screens.
+#
+#   tile(label, size, variant) -> panel-ready "L" image, prepared once
+#
+# Nothing is decoded up front: the directory is listed at start, a PNG is
+# opened the first time any size of it is asked for, and both the decoded
+# sources and the prepared tiles live in small LRUs, so memory stays
+# bounded however many services Volumio reports.
+
+import json
+import logging
+import os
+import threading
+from collections import OrderedDict
+from typing import Dict, Optional
+
+from PIL import Image
+
+from display.image_pipeline import prepare_for_panel
+
+ASSETS_PNG_DIR = "/home/volumio/Quadify/src/assets/pngs"
+ASSETS_MANIFEST = "/home/volumio/Quadify/src/assets/icons_manifest.json"
+
+# Labels that are spelled differently by Volumio and the asset files
+ALIASES = {
+    "LIBRARY": "MUSIC_LIBRARY",
+    "RADIO": "WEB_RADIO",
+    "RADIO_P": "RADIO_PARADISE",
+    "FAVOURITES": "FAVORITES",
+}
+
+VARIANTS = ("normal", "selected", "dimmed")
+
+_store = None
+_store_lock = threading.Lock()
+
+
+def norm_label(s) -> str:
+    s = (s or "").strip()
+    return s.upper().replace(" ", "_").replace("-", "_").replace("/", "_")
+
+
+def get_icon_store():
+    """Return the shared store, creating it with the default asset paths."""
+    global _store
+    if _store is None:
+        with _store_lock:
+            if _store is None:
+                _store = IconStore()
+    return _store
+
+
+class IconStore:
+    def __init__(self, assets_dir=ASSETS_PNG_DIR, manifest_path=ASSETS_MANIFEST,
+                 max_sources=24, max_tiles=160, dim_level=0.6):
+        self.logger = logging.getLogger(self.__class__.__name__)
+        self.logger.setLevel(logging.INFO)
+
+        self.assets_dir = assets_dir
+        self.manifest_path = manifest_path
+        self.max_sources = max_sources
+        self.max_tiles = max_tiles
+        self.dim_level = dim_level
+
+        self._paths: Dict[str, str] = {}                 # UPPER label -> png path
+        self._sources: "OrderedDict[str, Image.Image]" = OrderedDict()
+        self._tiles: "OrderedDict" = OrderedDict()     # (label, size, variant) -> tile
+        self._missing = set()
+        self._lock = threading.Lock()
+        self.reload()
+
+    # ------------------------------------------------------------------
+    #   Public API
+    # ------------------------------------------------------------------
+    def reload(self):
+        """Re-list the asset dir and manifest; prepared tiles are dropped."""
+        paths = {}
+        if os.path.isdir(self.assets_dir):
+            for name in os.listdir(self.assets_dir):
+                if name.lower().endswith(".png"):
+                    paths[norm_label(os.path.splitext(name)[0])] = os.path.join(self.assets_dir, name)
+        paths.update(self._read_manifest())
+        with self._lock:
+            self._paths = paths
+            self._sources.clear()
+            self._tiles.clear()
+            self._missing.clear()
+        self.logger.debug(f"Icon store indexed {len(paths)} icons")
+
+    def has(self, label) -> bool:
+        return self._resolve(norm_label(label)) is not None
+
+    def source(self, label) -> Optional[Image.Image]:
+        """Decoded RGBA icon at its original size, or None."""
+        key = self._resolve(norm_label(label))
+        if key is None:
+            return None
+        with self._lock:
+            img = self._sources.get(key)
+            if img is not None:
+                self._sources.move_to_end(key)
+                return img
+        try:
+            with Image.open(self._paths[key]) as f:
+                img = f.convert("RGBA")
+        except Exception as e:
+            self.logger.warning(f"Could not load icon {self._paths.get(key)}: {e}")
+            with self._lock:
+                self._missing.add(key)
+            return None
+        with self._lock:
+            self._sources[key] = img
+            while len(self._sources) > self.max_sources:
+                self._sources.popitem(last=False)
+        return img
+
+    def tile(self, label, size: int, variant: str = "normal") -> Optional[Image.Image]:
+        """
+        Panel-ready "L" tile of `label` at size x size. Variants:
+        "normal"/"selected" at full brightness, "dimmed" at dim_level.
+        """
+        if variant not in VARIANTS:
+            raise ValueError(f"Unknown icon variant: {variant}")
+        key = self._resolve(norm_label(label))
+        if key is None:
+            return None
+        tkey = (key, int(size), variant)
+        with self._lock:
+            img = self._tiles.get(tkey)
+            if img is not None:
+                self._tiles.move_to_end(tkey)
+                return img
+
+        if variant == "dimmed":
+            base = self.tile(key, size, "normal")
+            if base is None:
+                return None
+            step = 255 / 15
+            lut = [int(round(round(v * self.dim_level / step) * step)) for v in range(256)]
+            img = base.point(lut)
+        else:
+            src = self.source(key)
+            if src is None:
+                return None
+            img = prepare_for_panel(src, (size, size), dither="none", contrast=False)
+
+        with self._lock:
+            self._tiles[tkey] = img
+            while len(self._tiles) > self.max_tiles:
+                self._tiles.popitem(last=False)
+        return img
+
+    # ------------------------------------------------------------------
+    #   Internals
+    # ------------------------------------------------------------------
+    def _resolve(self, label: str) -> Optional[str]:
+        if not label or label in self._missing:
+            return None
+        if label in self._paths:
+            return label
+        alias = ALIASES.get(label)
+        if alias and alias in self._paths:
+            return alias
+        return None
+
+    def _read_manifest(self) -> Dict[str, str]:
+        out = {}
+        try:
+            if os.path.exists(self.manifest_path):
+                with open(self.manifest_path, "r") as f:
+                    data = json.load(f)
+                if isinstance(data, dict) and isinstance(data.get("icons"), dict):
+                    data = data["icons"]
+                # support both list-of-entries and {label:path} formats
+                if isinstance(data, list):
+                    for entry in data:
+                        label = norm_label(entry.get("label", ""))
+                        path = entry.get("path")
+                        if label and path and os.path.exists(path):
+                            out[label] = path
+                elif isinstance(data, dict):
+                    for k, v in data.items():
+                        if isinstance(v, dict):   # convert2 entries: {path, source, sha256, ...}
+                            v = v.get("path")
+                        if isinstance(v, str) and os.path.exists(v):
+                            out[norm_label(k)] = v
+        except Exception:
+            # Manifest is optional; ignore errors.
+            pass
+        return out
@@ -0,0 +1,337 @@
+# src/handlers/library_index.py
+#
+# Offline search index of the Volumio music library (artists, albums, tracks).
+#
+#   ingest(uri, data)   -> fold a /api/v1/browse response into the index
+#                          (LibraryManager calls this for every list it shows)
+#   start_refresh()     -> background crawl of artists://, albums:// and then,
+#                          slowly, each album's tracks; resumable across restarts
+#   search(query)       -> prefix matches in a few ms, artists first
+#
+# Stored in SQLite (src/cache/library_index.db) with an FTS5 table when the
+# sqlite build has it, plain LIKE matching otherwise. SQLite keeps the data
+# on disk, so memory use is bounded by its page cache, and the index
+# survives restarts. Writes go through one worker thread.
+
+import logging
+import os
+import re
+import sqlite3
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional
+
+import requests
+
+from network.async_core import get_network_core
+
+INDEX_PATH = os.environ.get(
+    "QUADIFY_LIBRARY_INDEX",
+    os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "cache", "library_index.db"),
+)
+
+_index = None
+_index_lock = threading.Lock()
+
+
+def start_library_index(**kwargs):
+    """Open the process-wide index (idempotent)."""
+    global _index
+    with _index_lock:
+        if _index is None:
+            _index = LibraryIndex(**kwargs)
+        return _index
+
+
+def get_library_index():
+    """The running index, or None when search is disabled."""
+    return _index
+
+
+def stop_library_index():
+    global _index
+    with _index_lock:
+        if _index is not None:
+            _index.close()
+            _index = None
+
+
+def classify(item: Dict) -> Optional[str]:
+    """'artist' / 'album' / 'track' for a browse row, None for anything else."""
+    typ = (item.get("type") or "").lower()
+    uri = item.get("uri") or ""
+    if typ in ("song", "track"):
+        return "track"
+    if uri.startswith("artists://"):
+        return "artist" if "/" not in uri[len("artists://"):] else "album"
+    if uri.startswith("albums://") or typ == "album":
+        return "album"
+    return None
+
+
+class LibraryIndex:
+    SCHEMA_VERSION = 1
+
+    def __init__(self, path=INDEX_PATH, base_url="http://localhost:3000", max_rows=200000,
+                 refresh_hours=24, crawl_tracks=True, crawl_delay=0.05, cache_kb=2048, timeout=10.0):
+        self.logger = logging.getLogger(self.__class__.__name__)
+        self.logger.setLevel(logging.INFO)
+
+        self.path = path
+        self.base_url = base_url.rstrip("/")
+        self.max_rows = max_rows
+        self.refresh_s = refresh_hours * 3600
+        self.crawl_tracks = crawl_tracks
+        self.crawl_delay = crawl_delay
+        self.timeout = timeout
+
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        self._db = sqlite3.connect(path, check_same_thread=False)
+        self._lock = threading.Lock()
+        self._writer = ThreadPoolExecutor(max_workers=1, thread_name_prefix="LibraryIndex")
+        self._session = requests.Session()
+        self._stop = threading.Event()
+        self._refresh_thread = None
+
+        with self._lock:
+            self._db.execute("PRAGMA journal_mode=WAL")
+            self._db.execute("PRAGMA synchronous=NORMAL")
+            self._db.execute(f"PRAGMA cache_size=-{int(cache_kb)}")
+            self.fts = self._create_schema()
+        self.logger.info(f"Library index at {path} ({self.count()} rows, "
+                         f"{'FTS5' if self.fts else 'LIKE'} search)")
+
+    # ------------------------------------------------------------------
+    #   Schema
+    # ------------------------------------------------------------------
+    def _create_schema(self) -> bool:
+        db = self._db
+        version = db.execute("PRAGMA user_version").fetchone()[0]
+        if version not in (0, self.SCHEMA_VERSION):
+            for table in ("items_fts", "items", "crawl"):
+                db.execute(f"DROP TABLE IF EXISTS {table}")
+        db.executescript("""
+            CREATE TABLE IF NOT EXISTS items (
+                id       INTEGER PRIMARY KEY,
+                uri      TEXT UNIQUE NOT NULL,
+                kind     TEXT NOT NULL,
+                title    TEXT NOT NULL,
+                artist   TEXT,
+                album    TEXT,
+                albumart TEXT,
+                service  TEXT,
+                seen     REAL NOT NULL
+            );
+            CREATE INDEX IF NOT EXISTS items_seen ON items(seen);
+            CREATE INDEX IF NOT EXISTS items_artist ON items(kind, artist);
+            CREATE TABLE IF NOT EXISTS crawl (
+                uri     TEXT PRIMARY KEY,
+                crawled REAL NOT NULL
+            );
+        """)
+        db.execute(f"PRAGMA user_version={self.SCHEMA_VERSION}")
+
+        try:
+            db.executescript("""
+                CREATE VIRTUAL TABLE IF NOT EXISTS items_fts USING fts5(
+                    title, artist, album,
+                    content='items', content_rowid='id',
+                    tokenize='unicode61 remove_diacritics 2', prefix='1 2 3'
+                );
+                CREATE TRIGGER IF NOT EXISTS items_ai AFTER INSERT ON items BEGIN
+                    INSERT INTO items_fts(rowid, title, artist, album)
+                    VALUES (new.id, new.title, new.artist, new.album);
+                END;
+                CREATE TRIGGER IF NOT EXISTS items_ad AFTER DELETE ON items BEGIN
+                    INSERT INTO items_fts(items_fts, rowid, title, artist, album)
+                    VALUES ('delete', old.id, old.title, old.artist, old.album);
+                END;
+                CREATE TRIGGER IF NOT EXISTS items_au AFTER UPDATE OF title, artist, album ON items BEGIN
+                    INSERT INTO items_fts(items_fts, rowid, title, artist, album)
+                    VALUES ('delete', old.id, old.title, old.artist, old.album);
+                    INSERT INTO items_fts(rowid, title, artist, album)
+                    VALUES (new.id, new.title, new.artist, new.album);
+                END;
+            """)
+            db.commit()
+            return True
+        except sqlite3.OperationalError as e:
+            self.logger.warning(f"SQLite has no FTS5 ({e}); falling back to LIKE search")
+            db.execute("CREATE INDEX IF NOT EXISTS items_title ON items(title COLLATE NOCASE)")
+            db.commit()
+            return False
+
+    # ------------------------------------------------------------------
+    #   Ingest
+    # ------------------------------------------------------------------
+    def ingest(self, uri: str, data: Dict):
+        """Queue a browse response for indexing (never blocks the caller)."""
+        items = self._items(data)
+        if items:
+            self._writer.submit(self._ingest_items, items, uri)
+
+    def _ingest_items(self, items: List[Dict], parent_uri: Optional[str] = None):
+        now = time.time()
+        rows = []
+        for it in items:
+            kind = classify(it)
+            uri = it.get("uri")
+            title = it.get("title") or it.get("album") or it.get("name")
+            if not kind or not uri or not title:
+                continue
+            artist = it.get("artist") or (title if kind == "artist" else None)
+            album = it.get("album") or (title if kind == "album" else None)
+            rows.append((uri, kind, title, artist, album, it.get("albumart"), it.get("service"), now))
+        if not rows:
+            return 0
+        try:
+            with self._lock:
+                # Only rows that actually changed are rewritten (and re-tokenised)
+                self._db.executemany("""
+                    INSERT INTO items(uri, kind, title, artist, album, albumart, service, seen)
+                    VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+                    ON CONFLICT(uri) DO UPDATE SET
+                        kind=excluded.kind, title=excluded.title, artist=excluded.artist,
+                        album=excluded.album, albumart=excluded.albumart,
+                        service=excluded.service, seen=excluded.seen
+                    WHERE items.title IS NOT excluded.title OR items.artist IS NOT excluded.artist
+                       OR items.album IS NOT excluded.album OR items.kind IS NOT excluded.kind
+                       OR items.albumart IS NOT excluded.albumart
+                """, rows)
+                self._db.executemany("UPDATE items SET seen = ? WHERE uri = ?", [(now, r[0]) for r in rows])
+                if parent_uri and any(r[1] == "track" for r in rows):
+                    self._db.execute("INSERT OR REPLACE INTO crawl(uri, crawled) VALUES (?, ?)", (parent_uri, now))
+                self._trim()
+                self._db.commit()
+        except sqlite3.Error as e:
+            self.logger.warning(f"Library index write failed: {e}")
+            return 0
+        return len(rows)
+
+    def _trim(self):
+        """Drop the least recently seen rows beyond max_rows (caller holds the lock)."""
+        count = self._db.execute("SELECT COUNT(*) FROM items").fetchone()[0]
+        excess = count - self.max_rows
+        if excess > 0:
+            self._db.execute(
+                "DELETE FROM items WHERE id IN (SELECT id FROM items ORDER BY seen LIMIT ?)", (excess,)
+            )
+
+    # ------------------------------------------------------------------
+    #   Queries
+    # ------------------------------------------------------------------
+    def search(self, query: str, limit: int = 40) -> List[Dict]:
+        """Rows whose title/artist/album words start with every query word."""
+        tokens = re.findall(r"\w+", (query or "").casefold())
+        if not tokens:
+            return []
+        order = "CASE i.kind WHEN 'artist' THEN 0 WHEN 'album' THEN 1 ELSE 2 END"
+        if self.fts:
+            match = " ".join(f'"{t}"*' for t in tokens)
+            sql = f"""
+                SELECT i.kind, i.title, i.artist, i.album, i.uri, i.albumart, i.service
+                FROM items_fts f JOIN items i ON i.id = f.rowid
+                WHERE items_fts MATCH ?
+                ORDER BY {order}, bm25(items_fts), i.title
+                LIMIT ?
+            """
+            params = (match, limit)
+        else:
+            where = " AND ".join(
+                "(i.title LIKE ? OR i.title LIKE ? OR i.artist LIKE ? OR i.album LIKE ?)" for _ in tokens
+            )
+            params = []
+            for t in tokens:
+                params += [f"{t}%", f"% {t}%", f"{t}%", f"{t}%"]
+            sql = f"""
+                SELECT i.kind, i.title, i.artist, i.album, i.uri, i.albumart, i.service
+                FROM items i WHERE {where}
+                ORDER BY {order}, i.title COLLATE NOCASE
+                LIMIT ?
+            """
+            params = (*params, limit)
+        with self._lock:
+            rows = self._db.execute(sql, params).fetchall()
+        return [self._row(r) for r in rows]
+
+    def albums_by(self, artist: str, limit: int = 200) -> List[Dict]:
+        with self._lock:
+            rows = self._db.execute("""
+                SELECT kind, title, artist, album, uri, albumart, service FROM items
+                WHERE kind = 'album' AND artist = ? ORDER BY title COLLATE NOCASE LIMIT ?
+            """, (artist, limit)).fetchall()
+        return [self._row(r) for r in rows]
+
+    def count(self, kind: Optional[str] = None) -> int:
+        with self._lock:
+            if kind:
+                return self._db.execute("SELECT COUNT(*) FROM items WHERE kind = ?", (kind,)).fetchone()[0]
+            return self._db.execute("SELECT COUNT(*) FROM items").fetchone()[0]
+
+    @staticmethod
+    def _row(r) -> Dict:
+        kind, title, artist, album, uri, albumart, service = r
+        return {"kind": kind, "title": title, "artist": artist, "album": album,
+                "uri": uri, "albumart": albumart, "service": service or "mpd"}
+
+    # ------------------------------------------------------------------
+    #   Background refresh
+    # ------------------------------------------------------------------
+    def start_refresh(self):
+        """Crawl the library in the background (no-op if a crawl is running)."""
+        if self._refresh_thread and self._refresh_thread.is_alive():
+            return
+        self._stop.clear()
+        self._refresh_thread = threading.Thread(target=self._refresh, name="LibraryIndexRefresh", daemon=True)
+        self._refresh_thread.start()
+
+    def _refresh(self):
+        t0 = time.monotonic()
+        try:
+            albums = []
+            for root in ("artists://", "albums://"):
+                items = self._items(self._browse(root))
+                self._writer.submit(self._ingest_items, items).result()
+                if root == "albums://":
+                    albums = [it["uri"] for it in items if it.get("uri")]
+            crawled = 0
+            if self.crawl_tracks:
+                for uri in self._stale_albums(albums):
+                    if self._stop.wait(self.crawl_delay):
+                        break
+                    try:
+                        self._writer.submit(self._ingest_items, self._items(self._browse(uri)), uri).result()
+                        crawled += 1
+                    except Exception as e:
+                        self.logger.debug(f"Index crawl skipped {uri}: {e}")
+            self.logger.info(f"Library index refreshed in {time.monotonic() - t0:.1f} s "
+                             f"({crawled} albums crawled, {self.count()} rows)")
+        except Exception as e:
+            self.logger.warning(f"Library index refresh failed: {e}")
+
+    def _stale_albums(self, uris: List[str]) -> List[str]:
+        cutoff = time.time() - self.refresh_s
+        with self._lock:
+            fresh = {u for (u,) in self._db.execute("SELECT uri FROM crawl WHERE crawled >= ?", (cutoff,))}
+        return [u for u in uris if u not in fresh]
+
+    @staticmethod
+    def _items(data: Dict) -> List[Dict]:
+        return [it for lst in ((data or {}).get("navigation") or {}).get("lists") or []
+                for it in (lst.get("items") or [])]
+
+    def _browse(self, uri: str) -> Dict:
+        core = get_network_core()
+        url = f"{self.base_url}/api/v1/browse"
+        if core is not None:
+            return core.get_json(url, params={"uri": uri}, timeout=self.timeout).result(self.timeout + 1)
+        resp = self._session.get(url, params={"uri": uri}, timeout=self.timeout)
+        resp.raise_for_status()
+        return resp.json()
+
+    def close(self):
+        self._stop.set()
+        self._writer.shutdown(wait=True)
+        with self._lock:
+            self._db.close()
@@ -1,5 +1,4 @@
 import smbus2
-import json
 import time
 import threading
 import logging
@@ -8,14 +7,33 @@ from enum import IntEnum
 import yaml
 from pathlib import Path
 
-# MCP23017 Register Definitions
+from network.volumio_commands import VolumioCommandClient
+from hardware.led_driver import LEDDriver
+from controls.input_trace import tracer
+
+try:
+    import RPi.GPIO as GPIO
+except ImportError:  # interrupt mode needs a Pi GPIO for INTA/INTB
+    GPIO = None
+
+# MCP23017 Register Definitions (IOCON.BANK = 0)
 MCP23017_IODIRA = 0x00
 MCP23017_IODIRB = 0x01
+MCP23017_GPINTENB = 0x05
+MCP23017_DEFVALB  = 0x07
+MCP23017_INTCONB  = 0x09
+MCP23017_IOCON    = 0x0A
+MCP23017_INTFB    = 0x0F
+MCP23017_INTCAPB  = 0x11
 MCP23017_GPIOA  = 0x12
 MCP23017_GPIOB  = 0x13
 MCP23017_GPPUA  = 0x0C
 MCP23017_GPPUB  = 0x0D
 
+IOCON_MIRROR = 0x40  # INTA and INTB both signal either port
+IOCON_ODR    = 0x04  # open-drain INT pins (Pi side pull-up), active low
+ROW_MASK     = 0x3C  # B2..B5 carry the four matrix rows
+
 DEFAULT_MCP23017_ADDRESS = 0x20
 SWAP_COLUMNS = True  # If your wiring for columns is reversed
 
@@ -52,7 +70,13 @@ class ButtonsLEDController:
     and ephemeral LED override ensures only one LED is lit at a time.
     """
 
-    def __init__(self, config_path='config.yaml', debounce_delay=0.1):
+    def __init__(self, config_path='config.yaml', debounce_delay=0.1, command_client=None):
+        """
+        Buttons are scanned by polling unless `buttons: interrupt_pin` (BCM)
+        is set in the config: the MCP23017 then raises INTA/INTB when a row
+        input changes, and the matrix is only scanned from that edge until
+        every button is released again.
+        """
         self.logger = logging.getLogger(self.__class__.__name__)
         self.logger.setLevel(logging.INFO)
 
@@ -67,6 +91,9 @@ class ButtonsLEDController:
         self.debounce_delay = debounce_delay
         self.bus = None
 
+        # Socket-backed command client; HTTP-only until main attaches the VolumioListener
+        self.command_client = command_client or VolumioCommandClient()
+
         # Attempt to open SMBus #1
         try:
             self.bus = smbus2.SMBus(1)
@@ -83,18 +110,28 @@ class ButtonsLEDController:
             [7, 8],  # row3 => (Spare=7, Reload=8)
         ]
 
-        # LED states
-        self.status_led_state = 0            # For showing play/pause
-        self.current_button_led_state = 0    # Ephemeral override
-        self.current_led_state = 0           # Last hardware state
+        # LED state (play/pause); the LEDDriver owns GPIOA and the ephemeral override
+        self.status_led_state = 0
 
-        self.mcp23017_address = self._load_config(config_path)
+        self.mcp23017_address, buttons_cfg = self._load_config(config_path)
+        self.interrupt_pin = buttons_cfg.get("interrupt_pin")
+        self.scan_settle = 0.005             # column drive -> row read settle time
+        self.interrupt_mode = False
+        self._button_irq = threading.Event()
         self._initialize_mcp23017()
+        self.leds = LEDDriver(self.bus, self.mcp23017_address, MCP23017_GPIOA)
 
         self.running = False
         self.button_thread = None
         self.volumio_monitor_thread = None
 
+        # Play/pause LED follows VolumioListener pushes; HTTP poll only while disconnected
+        self.volumio_listener = None
+        self.fallback_poll_interval = 10.0
+        self._volumio_connected = threading.Event()
+        self._monitor_wake = threading.Event()
+        self._last_status = None
+
         self.button8_down_time = None
         self.button8_pending = False
 
@@ -104,11 +141,12 @@ class ButtonsLEDController:
         if path.is_file():
             try:
                 with open(path, "r") as f:
-                    data = yaml.safe_load(f)
-                    return data.get("mcp23017_address", DEFAULT_MCP23017_ADDRESS)
+                    data = yaml.safe_load(f) or {}
+                    return (data.get("mcp23017_address", DEFAULT_MCP23017_ADDRESS),
+                            data.get("buttons", {}) or {})
             except Exception as e:
                 self.logger.error(f"Error reading config: {e}")
-        return DEFAULT_MCP23017_ADDRESS
+        return DEFAULT_MCP23017_ADDRESS, {}
 
     def _initialize_mcp23017(self):
         if not self.bus:
@@ -130,6 +168,60 @@ class ButtonsLEDController:
         except Exception as e:
             self.logger.error(f"Init error: {e}")
 
+    def _enable_button_interrupts(self):
+        """
+        Interrupt-on-change for the row inputs, signalled on interrupt_pin.
+        Idle state drives both columns low so any press pulls its row low.
+        Returns False (polling is used) if anything is missing or fails.
+        """
+        if self.interrupt_pin is None or not self.bus:
+            return False
+        if GPIO is None:
+            self.logger.warning("RPi.GPIO not available; buttons fall back to polling.")
+            return False
+        addr = self.mcp23017_address
+        try:
+            self.bus.write_byte_data(addr, MCP23017_IOCON, IOCON_MIRROR | IOCON_ODR)
+            self.bus.write_byte_data(addr, MCP23017_INTCONB, 0x00)   # compare against previous value
+            self.bus.write_byte_data(addr, MCP23017_DEFVALB, 0x00)
+            self.bus.write_byte_data(addr, MCP23017_GPIOB, 0xFC)     # both columns active
+            self.bus.write_byte_data(addr, MCP23017_GPINTENB, ROW_MASK)
+            self._clear_button_interrupt()
+
+            GPIO.setmode(GPIO.BCM)
+            GPIO.setup(self.interrupt_pin, GPIO.IN, pull_up_down=GPIO.PUD_UP)
+            GPIO.add_event_detect(self.interrupt_pin, GPIO.FALLING,
+                                  callback=lambda channel: self._button_irq.set())
+        except Exception as e:
+            self.logger.warning(f"MCP23017 interrupt setup failed ({e}); buttons fall back to polling.")
+            self._disable_button_interrupts()
+            return False
+        self.scan_settle = 0.001
+        self.logger.info(f"Buttons: MCP23017 interrupt on GPIO{self.interrupt_pin}.")
+        return True
+
+    def _disable_button_interrupts(self):
+        try:
+            if self.bus:
+                self.bus.write_byte_data(self.mcp23017_address, MCP23017_GPINTENB, 0x00)
+                self.bus.write_byte_data(self.mcp23017_address, MCP23017_GPIOB, 0x03)
+        except Exception:
+            pass
+        if GPIO is not None and self.interrupt_pin is not None:
+            try:
+                GPIO.remove_event_detect(self.interrupt_pin)
+            except Exception:
+                pass
+
+    def _clear_button_interrupt(self):
+        """
+        One block read of INTFB..GPIOB (INTFB, INTCAPA, INTCAPB, GPIOA,
+        GPIOB); reading INTCAPB/GPIOB releases the INT line. Returns GPIOB.
+        """
+        regs = self.bus.read_i2c_block_data(self.mcp23017_address, MCP23017_INTFB,
+                                            MCP23017_GPIOB - MCP23017_INTFB + 1)
+        return regs[-1]
+
     def start(self):
         self.running = True
         # Thread for reading button presses
@@ -144,6 +236,8 @@ class ButtonsLEDController:
 
     def stop(self):
         self.running = False
+        self._monitor_wake.set()
+        self._button_irq.set()
         if self.button_thread and self.button_thread.is_alive():
             self.button_thread.join()
         if self.volumio_monitor_thread and self.volumio_monitor_thread.is_alive():
@@ -161,44 +255,77 @@ class ButtonsLEDController:
     # Monitoring Buttons
     # -----------------------------------------------------------------
     def _monitor_buttons_loop(self):
-        while self.running:
-            if not self.bus:
-                break
-            matrix = self._read_matrix()
-            for r in range(4):
-                for c in range(2):
-                    curr = matrix[r][c]
-                    prev = self.prev_button_state[r][c]
-                    btn_id = self.button_map[r][c]
-
-                    # --- Special logic for Button 8 (long press support) ---
-                    if btn_id == 8:
-                        # Button 8 pressed down
-                        if curr == 0 and prev == 1:
-                            self.button8_down_time = time.time()
-                            self.button8_pending = True
-                        # Button 8 released
-                        elif curr == 1 and prev == 0 and self.button8_pending:
-                            held_time = time.time() - self.button8_down_time if self.button8_down_time else 0
-                            if held_time >= 3.0:
-                                self.logger.info("Button 8 long press (restart CAVA only)")
-                                self.restart_cava_only()
-                            else:
-                                self.logger.info("Button 8 short press (restart Quadify)")
-                                self.restart_quadify_only()
-                            self.light_button_led_for(LED.RELOAD, 0.5)
-                            self.button8_pending = False
-
-                    # --- All other buttons (default: short press only) ---
-                    else:
-                        if curr == 0 and prev == 1:
-                            self.logger.info(f"Button {btn_id} pressed.")
+        self.interrupt_mode = self._enable_button_interrupts()
+        try:
+            while self.running:
+                if not self.bus:
+                    break
+                if self.interrupt_mode:
+                    self._wait_for_button_interrupt()
+                    if not self.running:
+                        break
+                self._scan_buttons()
+                time.sleep(self.debounce_delay)
+        finally:
+            if self.interrupt_mode:
+                self._disable_button_interrupts()
+
+    def _wait_for_button_interrupt(self):
+        """
+        Block until a row changes, unless a button is still held (then keep
+        scanning so releases and button 8's hold time are seen).
+        """
+        if any(v == 0 for row in self.prev_button_state for v in row):
+            return
+        try:
+            # Back to idle: both columns active, pending change cleared
+            self.bus.write_byte_data(self.mcp23017_address, MCP23017_GPIOB, 0xFC)
+            self._button_irq.clear()
+            gpiob = self._clear_button_interrupt()
+        except Exception as e:
+            self.logger.error(f"Button interrupt re-arm error: {e}")
+            return
+        if (gpiob & ROW_MASK) != ROW_MASK:
+            return  # pressed between the last scan and re-arming
+        self._button_irq.wait()
+
+    def _scan_buttons(self):
+        scanned_at = time.monotonic()   # input time for latency traces
+        matrix = self._read_matrix()
+        for r in range(4):
+            for c in range(2):
+                curr = matrix[r][c]
+                prev = self.prev_button_state[r][c]
+                btn_id = self.button_map[r][c]
+
+                # --- Special logic for Button 8 (long press support) ---
+                if btn_id == 8:
+                    # Button 8 pressed down
+                    if curr == 0 and prev == 1:
+                        self.button8_down_time = time.time()
+                        self.button8_pending = True
+                    # Button 8 released
+                    elif curr == 1 and prev == 0 and self.button8_pending:
+                        held_time = time.time() - self.button8_down_time if self.button8_down_time else 0
+                        if held_time >= 3.0:
+                            self.logger.info("Button 8 long press (restart CAVA only)")
+                            self.restart_cava_only()
+                        else:
+                            self.logger.info("Button 8 short press (restart Quadify)")
+                            self.restart_quadify_only()
+                        self.light_button_led_for(LED.RELOAD, 0.5)
+                        self.button8_pending = False
+
+                # --- All other buttons (default: short press only) ---
+                else:
+                    if curr == 0 and prev == 1:
+                        self.logger.info(f"Button {btn_id} pressed.")
+                        with tracer.activate(tracer.begin("button", str(btn_id), scanned_at)):
+                            tracer.mark("dispatch")
                             self.handle_button_press(btn_id)
 
-                    # Update previous state for this button
-                    self.prev_button_state[r][c] = curr
-
-            time.sleep(self.debounce_delay)
+                # Update previous state for this button
+                self.prev_button_state[r][c] = curr
 
 
     def _read_matrix(self):
@@ -210,7 +337,7 @@ class ButtonsLEDController:
             for col in range(2):
                 col_out = ~(1 << col) & 0x03
                 self.bus.write_byte_data(self.mcp23017_address, MCP23017_GPIOB, col_out | 0xFC)
-                time.sleep(0.005)
+                time.sleep(self.scan_settle)
                 val_b = self.bus.read_byte_data(self.mcp23017_address, MCP23017_GPIOB)
                 for row in range(4):
                     bit_val = (val_b >> (row+2)) & 0x01
@@ -225,68 +352,106 @@ class ButtonsLEDController:
     # -----------------------------------------------------------------
     # Volumio Monitor => sets PLAY or PAUSE LED
     # -----------------------------------------------------------------
+    def attach_volumio_listener(self, volumio_listener):
+        """
+        Drive the PLAY/PAUSE LED from VolumioListener pushes instead of polling.
+        The monitor thread only polls (over HTTP, slowly) while the socket is down.
+        """
+        self.volumio_listener = volumio_listener
+        volumio_listener.state_changed.connect(self._on_volumio_state)
+        volumio_listener.connected.connect(self._on_volumio_connected)
+        volumio_listener.disconnected.connect(self._on_volumio_disconnected)
+        if volumio_listener.is_connected():
+            self._volumio_connected.set()
+            state = volumio_listener.get_current_state()
+            if state:
+                self._set_status(state.get("status"))
+        self._monitor_wake.set()
+
+    def _on_volumio_state(self, sender, state, **kwargs):
+        self._set_status((state or {}).get("status"))
+
+    def _on_volumio_connected(self, sender, **kwargs):
+        self._volumio_connected.set()
+        self._monitor_wake.set()
+
+    def _on_volumio_disconnected(self, sender, **kwargs):
+        self._volumio_connected.clear()
+        self._monitor_wake.set()
+
     def _monitor_volumio_loop(self):
         while self.running:
+            if self.volumio_listener is not None and self._volumio_connected.is_set():
+                # Pushes keep the LED current; sleep until the connection drops
+                self._monitor_wake.wait()
+                self._monitor_wake.clear()
+                continue
             try:
                 self.update_play_pause_led()
             except Exception as e:
                 self.logger.error(f"Volumio monitor error: {e}")
-            time.sleep(2)
+            self._monitor_wake.wait(self.fallback_poll_interval)
+            self._monitor_wake.clear()
 
     def update_play_pause_led(self):
+        """Poll Volumio's state over HTTP and update the LED (fallback path)."""
         try:
-            # 1) Run volumio status
-            res = subprocess.run(["volumio", "status"], capture_output=True, text=True)
-            if res.returncode == 0:
-                data = json.loads(res.stdout)
-                state = data.get("status", "").lower()
-                prev_led_state = self.status_led_state
-
-                if state == "play":
-                    self.status_led_state = LED.PLAY.value
-                elif state in ["pause", "stop"]:
-                    self.status_led_state = LED.PAUSE.value
-                else:
-                    self.status_led_state = 0
-
-                # **Clear ephemeral LED if Volumio state has changed**
-                if self.current_button_led_state and self.status_led_state != prev_led_state:
-                    self.current_button_led_state = 0
-
-                self.control_leds()
+            data = self.command_client.get_state()
+            if data:
+                self._set_status(data.get("status"))
         except Exception as e:
             self.logger.error(f"update_play_pause_led => {e}")
 
+    def _set_status(self, status):
+        status = str(status or "").lower()
+        if status == self._last_status:
+            return
+        self._last_status = status
+        prev_led_state = self.status_led_state
+
+        if status == "play":
+            self.status_led_state = LED.PLAY.value
+        elif status in ["pause", "stop"]:
+            self.status_led_state = LED.PAUSE.value
+        else:
+            self.status_led_state = 0
+
+        # **Clear ephemeral LED if Volumio state has changed**
+        self.leds.set_base(self.status_led_state,
+                           clear_override=self.status_led_state != prev_led_state)
+
 
     # -----------------------------------------------------------------
     # Button Press => ephemeral LED
     # -----------------------------------------------------------------
     def handle_button_press(self, btn_id):
         """
-        Button 1 => 'volumio play' or 'toggle'?
-        Button 2 => 'volumio pause'
-        etc.
+        Button 1 => play
+        Button 2 => pause
+        Button 3/4 => previous/next, 5/6 => shuffle/repeat toggle.
+        Commands go through the VolumioCommandClient (socket.io, HTTP fallback).
         """
+        cmd = self.command_client
         try:
             if btn_id == 1:
                 # "Play"
-                subprocess.run(["volumio","play"], check=False)
+                cmd.play()
                 #self.light_button_led_for(LED.PLAY, 0.5)
             elif btn_id == 2:
                 # "Pause"
-                subprocess.run(["volumio","pause"], check=False)
+                cmd.pause()
                 #self.light_button_led_for(LED.PAUSE, 0.5)
             elif btn_id == 3:
-                subprocess.run(["volumio","previous"], check=False)
+                cmd.previous()
                 self.light_button_led_for(LED.PREV, 0.5)
             elif btn_id == 4:
-                subprocess.run(["volumio","next"], check=False)
+                cmd.next()
                 self.light_button_led_for(LED.NEXT, 0.5)
             elif btn_id == 5:
-                subprocess.run(["volumio","random"], check=False)
+                cmd.random()
                 self.light_button_led_for(LED.SHUFF, 0.5)
             elif btn_id == 6:
-                subprocess.run(["volumio","repeat"], check=False)
+                cmd.repeat()
                 self.light_button_led_for(LED.REPEAT, 0.5)
             elif btn_id == 7:
                 self.light_button_led_for(LED.SPARE, 0.5)
@@ -301,39 +466,19 @@ class ButtonsLEDController:
     def light_button_led_for(self, led_enum, duration):
         """
         ephemeral override => show just this LED for 'duration' seconds,
-        ignoring the play/pause LED.
+        ignoring the play/pause LED (expiry is handled by the LED scheduler).
         """
-        self.current_button_led_state = led_enum.value
-        self.control_leds()
-        t = threading.Timer(duration, self.reset_button_led)
-        t.start()
+        self.leds.flash(led_enum.value, duration)
 
     def reset_button_led(self):
-        self.current_button_led_state = 0
-        self.control_leds()
+        self.leds.clear_override()
 
     def control_leds(self):
         """
-        If ephemeral LED is active => show only ephemeral
-        else => show the status_led_state (play or pause).
+        Push the play/pause state to the LED driver; it only touches the
+        bus when the composed output actually changes.
         """
-        if self.current_button_led_state != 0:
-            total_state = self.current_button_led_state
-        else:
-            total_state = self.status_led_state
-
-        if total_state != self.current_led_state:
-            if self.bus:
-                try:
-                    self.bus.write_byte_data(self.mcp23017_address, MCP23017_GPIOA, total_state)
-                    self.current_led_state = total_state
-                    self.logger.info(f"LED state => {bin(total_state)}")
-                except Exception as e:
-                    self.logger.error(f"Error setting LEDs: {e}")
-            else:
-                self.logger.error("No bus => cannot set LED.")
-        else:
-            self.logger.debug("No LED change needed.")
+        self.leds.set_base(self.status_led_state)
 
     def shutdown_leds(self):
         """
@@ -342,8 +487,8 @@ class ButtonsLEDController:
         """
         if self.bus:
             try:
-                # Clear LED outputs on port A (assuming LEDs are connected to GPIOA)
-                self.bus.write_byte_data(self.mcp23017_address, MCP23017_GPIOA, 0x00)
+                # Clear LED outputs on port A (drops any effect or override too)
+                self.leds.all_off()
                 # Optionally, you could also reset GPIOB if needed (e.g. setting columns to their inactive state)
                 self.bus.write_byte_data(self.mcp23017_address, MCP23017_GPIOB, 0x03)
                 self.logger.info("MCP23017 shutdown: All LEDs turned off.")
@@ -352,6 +497,7 @@ class ButtonsLEDController:
 
 
     def close(self):
+        self.leds.close()
         if self.bus:
             self.bus.close()
             self.logger.info("Closed SMBus.")
@@ -1,35 +1,158 @@
 #!/usr/bin/env python3
+import itertools
+import json
 import socket
+import threading
 import time
 import os
-import subprocess
+from collections import deque
 
-# Global dictionary for debouncing
-last_processed_time = {}
-DEBOUNCE_TIME = 0.3  # seconds, adjust as needed
+QUADIFY_SOCK = "/tmp/quadify.sock"
+PROTOCOL_VERSION = 1
+LIRC_SOCK = "/var/run/lirc/lircd"  # default is usually /var/run/lirc/lircd
 
-def send_command(command, retries=5, delay=0.5):
-    sock_path = "/tmp/quadify.sock"
-    for attempt in range(retries):
+# Held keys: LIRC sends the same key with a rising repeat count (~110 ms apart).
+# Only these keys auto-repeat, after the first REPEAT_DELAY repeats.
+REPEATABLE_KEYS = {"KEY_UP", "KEY_DOWN", "KEY_LEFT", "KEY_RIGHT", "KEY_VOLUMEUP", "KEY_VOLUMEDOWN"}
+REPEAT_DELAY = 2
+
+
+class QuadifyClient:
+    """
+    Persistent connection to the Quadify command server (protocol 1,
+    newline-delimited JSON; see src/network/command_server.py).
+    - Each command carries an id and the server replies with status and
+      handling time, so a burst is simply pipelined
+    - A mode subscription makes the server push every mode change, so the
+      current mode is known without reading /tmp/quadify_mode
+    - While Quadify is down, commands are queued (bounded) and sent once a
+      reconnect succeeds
+    """
+
+    def __init__(self, sock_path=QUADIFY_SOCK, max_pending=32, retry_delay=0.5):
+        self.sock_path = sock_path
+        self.retry_delay = retry_delay
+        self.mode = None
+        self.acks = 0
+        self.errors = 0
+        self.last_ms = None                # server-side handling time of the last reply
+        self._ids = itertools.count(1)
+        self._sock = None
+        self._lock = threading.Lock()
+        self._pending = deque(maxlen=max_pending)
+        self._reconnecting = False
+
+    def connect(self):
+        """Connect now, or keep retrying in the background."""
+        with self._lock:
+            if self._sock is None and not self._connect_locked():
+                self._schedule_reconnect()
+
+    @staticmethod
+    def _frame(msg):
+        return (json.dumps(msg, separators=(",", ":")) + "\n").encode("utf-8")
+
+    def send(self, command, **args):
+        msg = {"v": PROTOCOL_VERSION, "id": next(self._ids), "cmd": command}
+        if args:
+            msg["args"] = args
+        line = self._frame(msg)
+        with self._lock:
+            if self._sock is None and not self._connect_locked():
+                self._pending.append(line)
+                self._schedule_reconnect()
+                return
+            try:
+                self._sock.sendall(line)
+            except OSError as e:
+                print(f"Command connection lost ({e}); queueing '{command}'")
+                self._close_locked()
+                self._pending.append(line)
+                self._schedule_reconnect()
+
+    def _connect_locked(self):
         try:
             s = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
-            s.connect(sock_path)
-            s.sendall(command.encode("utf-8"))
-            s.close()
-            return  # Success
-        except Exception as e:
-            print(f"Attempt {attempt+1}: Error sending command '{command}': {e}")
-            time.sleep(delay)
-    print(f"Failed to send command '{command}' after {retries} attempts.")
-
-
-def process_key(key, current_mode):
-    """Decide what command to run based on the key and current mode, with debouncing."""
-    now = time.time()
-    if key in last_processed_time and (now - last_processed_time[key]) < DEBOUNCE_TIME:
-        print(f"Ignoring duplicate key: {key}")
+            s.connect(self.sock_path)
+            s.sendall(self._frame({"v": PROTOCOL_VERSION, "cmd": "subscribe", "args": {"topic": "mode"}}))
+            while self._pending:
+                s.sendall(self._pending.popleft())
+        except OSError:
+            return False
+        self._sock = s
+        threading.Thread(target=self._reader, args=(s,), daemon=True).start()
+        print("Connected to Quadify command server.")
+        return True
+
+    def _close_locked(self):
+        if self._sock is not None:
+            try:
+                self._sock.close()
+            except OSError:
+                pass
+            self._sock = None
+        self.mode = None
+
+    def _schedule_reconnect(self):
+        if self._reconnecting:
+            return
+        self._reconnecting = True
+
+        def _retry():
+            while True:
+                time.sleep(self.retry_delay)
+                with self._lock:
+                    if self._sock is not None or self._connect_locked():
+                        self._reconnecting = False
+                        return
+
+        threading.Thread(target=_retry, daemon=True).start()
+
+    def _reader(self, s):
+        buf = b""
+        try:
+            while True:
+                data = s.recv(4096)
+                if not data:
+                    break
+                buf += data
+                while b"\n" in buf:
+                    line, buf = buf.split(b"\n", 1)
+                    self._on_line(line.decode("utf-8", errors="replace").strip())
+        except OSError:
+            pass
+        with self._lock:
+            if self._sock is s:
+                print("Quadify command server closed the connection.")
+                self._close_locked()
+                self._schedule_reconnect()
+
+    def _on_line(self, line):
+        try:
+            msg = json.loads(line)
+        except ValueError:
+            return
+        if msg.get("event") == "mode":
+            self.mode = msg.get("mode")
+        elif msg.get("ok"):
+            self.acks += 1
+            self.last_ms = msg.get("ms")
+        elif "ok" in msg:
+            self.errors += 1
+            print(f"Quadify rejected command {msg.get('id')}: {msg.get('error')}")
+
+
+client = QuadifyClient()
+
+
+def send_command(command):
+    client.send(command)
+
+
+def process_key(key, current_mode, repeat=0):
+    """Decide what command to run based on the key and current mode."""
+    if repeat and (key not in REPEATABLE_KEYS or repeat < REPEAT_DELAY):
         return
-    last_processed_time[key] = now
 
     print(f"Processing key: {key} in mode: {current_mode}")
     
@@ -103,9 +226,11 @@ def process_key(key, current_mode):
 
 def get_current_mode():
     """
-    Reads the current Quadify mode from a file.
-    Ensure your Quadify application writes the current mode to /tmp/quadify_mode.
+    Current Quadify mode: pushed over the command connection; the mode file
+    is only read while not connected.
     """
+    if client.mode:
+        return client.mode
     try:
         with open("/tmp/quadify_mode", "r") as f:
             return f.read().strip()
@@ -115,39 +240,41 @@ def get_current_mode():
 def ir_event_listener():
     """
     Listens for IR events from the LIRC socket and processes them.
+    Reads block until lircd has data; lines are reassembled across reads.
     """
-    # Path to LIRC's Unix socket (default is usually /var/run/lirc/lircd)
-    sock_path = "/var/run/lirc/lircd"
-    if not os.path.exists(sock_path):
-        print(f"Error: LIRC socket {sock_path} not found!")
+    if not os.path.exists(LIRC_SOCK):
+        print(f"Error: LIRC socket {LIRC_SOCK} not found!")
         return
 
     # Create a Unix socket and connect to LIRC daemon
     s = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
-    s.connect(sock_path)
-    s.setblocking(False)
+    s.connect(LIRC_SOCK)
     print("IR listener connected to LIRC socket.")
 
+    client.connect()
+
+    buf = b""
     try:
         while True:
-            try:
-                data = s.recv(1024)
-                if data:
-                    # LIRC events are typically sent as lines of text.
-                    lines = data.decode("utf-8").splitlines()
-                    for line in lines:
-                        # Expected line format:
-                        # "0000000000000001 00 KEY_POWER /home/volumio/lircd.conf"
-                        parts = line.split()
-                        if len(parts) >= 3:
-                            key = parts[2]
-                            current_mode = get_current_mode()
-                            print(f"IR event: {key} (mode: {current_mode})")
-                            process_key(key, current_mode)
-                else:
-                    time.sleep(0.1)
-            except BlockingIOError:
-                time.sleep(0.1)
+            data = s.recv(1024)
+            if not data:
+                print("LIRC socket closed.")
+                return
+            buf += data
+            while b"\n" in buf:
+                raw, buf = buf.split(b"\n", 1)
+                # Expected line format:
+                # "0000000000000001 00 KEY_POWER /home/volumio/lircd.conf"
+                parts = raw.decode("utf-8", errors="replace").split()
+                if len(parts) >= 3:
+                    key = parts[2]
+                    try:
+                        repeat = int(parts[1], 16)
+                    except ValueError:
+                        repeat = 0
+                    current_mode = get_current_mode()
+                    print(f"IR event: {key} (mode: {current_mode}, repeat: {repeat})")
+                    process_key(key, current_mode, repeat)
     finally:
         s.close()
 
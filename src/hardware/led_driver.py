@@ -0,0 +1,245 @@
+# src/hardware/led_driver.py
+#
+# LED output for the MCP23017 port that drives the button LEDs.
+#
+# The driver keeps a shadow of the output latch and is the only writer of
+# that register. Callers describe what should be lit (a base state, a
+# temporary override, per-bit effects) and a single scheduler thread turns
+# that into at most one I2C write per frame, and only when the composed
+# byte actually differs from the latch. With nothing animating the thread
+# sleeps until the next expiry or request. Compose + write run under one
+# I/O lock (taken before _cond), so all_off() from another thread can't be
+# overtaken by a frame composed just before it.
+#
+#   base      - steady state (e.g. PLAY or PAUSE from Volumio)
+#   override  - flash(): shows only its bits for a while, then base again
+#   effects   - blink / pulse / fade on individual bits, layered on top;
+#               pulse and fade use software PWM while they run
+
+import logging
+import threading
+import time
+from typing import Dict, Optional
+
+MCP23017_GPIOA = 0x12
+
+
+class _Effect:
+    def __init__(self, kind, start, period, until=None, level_from=0.0, level_to=1.0):
+        self.kind = kind              # "blink" | "pulse" | "fade"
+        self.start = start
+        self.period = period
+        self.until = until            # None = until stopped
+        self.level_from = level_from  # fade only
+        self.level_to = level_to
+
+    def level(self, now: float) -> float:
+        """Brightness 0..1 of the effect's bits at `now`."""
+        t = now - self.start
+        if self.kind == "blink":
+            return 1.0 if (t % self.period) < self.period / 2 else 0.0
+        if self.kind == "pulse":
+            phase = (t % self.period) / self.period
+            return 1.0 - abs(2.0 * phase - 1.0)           # triangle 0 -> 1 -> 0
+        if self.kind == "fade":
+            span = max(1e-6, (self.until or now) - self.start)
+            p = min(1.0, max(0.0, t / span))
+            return self.level_from + (self.level_to - self.level_from) * p
+        return 1.0
+
+    @property
+    def pwm(self) -> bool:
+        return self.kind in ("pulse", "fade")
+
+
+class LEDDriver:
+    def __init__(self, bus, address, register=MCP23017_GPIOA, frame=0.02,
+                 pwm_frame=0.004, pwm_steps=8):
+        """
+        bus/address/register - smbus2 bus and the latch register to drive
+        frame                - minimum time between writes (changes requested
+                               inside one frame are written together)
+        pwm_frame            - tick while a PWM effect runs; one PWM cycle is
+                               pwm_steps ticks, so pwm_steps brightness levels
+        """
+        self.logger = logging.getLogger(self.__class__.__name__)
+        self.logger.setLevel(logging.INFO)
+
+        self.bus = bus
+        self.address = address
+        self.register = register
+        self.frame = frame
+        self.pwm_frame = pwm_frame
+        self.pwm_steps = max(2, pwm_steps)
+
+        self.shadow = None                 # last value written (None = unknown)
+        self.writes = 0
+        self.skipped = 0                   # compositions that matched the latch
+
+        self._base = 0
+        self._override = None              # (mask, until)
+        self._effects: Dict[int, _Effect] = {}   # bit mask -> effect
+        self._tick = 0
+        self._last_write = 0.0
+        self._dirty = True
+        self._cond = threading.Condition()
+        self._io_lock = threading.Lock()   # compose+write, shadow/_last_write/counters
+        self._running = True
+        self._thread = threading.Thread(target=self._run, name="LEDDriver", daemon=True)
+        self._thread.start()
+
+    # ------------------------------------------------------------------
+    #   Public API (any thread)
+    # ------------------------------------------------------------------
+    @property
+    def base(self) -> int:
+        return self._base
+
+    def set_base(self, value: int, clear_override: bool = False):
+        with self._cond:
+            if value == self._base and not (clear_override and self._override):
+                return
+            self._base = value & 0xFF
+            if clear_override:
+                self._override = None
+            self._kick()
+
+    def flash(self, value: int, duration: float):
+        """Show only `value` for `duration` seconds, then the base state again."""
+        with self._cond:
+            self._override = (value & 0xFF, time.monotonic() + duration)
+            self._kick()
+
+    def clear_override(self):
+        with self._cond:
+            if self._override is not None:
+                self._override = None
+                self._kick()
+
+    def blink(self, mask: int, period: float = 0.5, duration: Optional[float] = None):
+        self._add_effect(mask, _Effect("blink", time.monotonic(), period, None), duration)
+
+    def pulse(self, mask: int, period: float = 1.5, duration: Optional[float] = None):
+        self._add_effect(mask, _Effect("pulse", time.monotonic(), period, None), duration)
+
+    def fade(self, mask: int, start: float, end: float, duration: float):
+        now = time.monotonic()
+        self._add_effect(mask, _Effect("fade", now, duration, now + duration, start, end), None)
+
+    def stop_effect(self, mask: Optional[int] = None):
+        """Stop the effect(s) on these bits (all effects if mask is None)."""
+        with self._cond:
+            if mask is None:
+                self._effects.clear()
+            else:
+                for m in [m for m in self._effects if m & mask]:
+                    del self._effects[m]
+            self._kick()
+
+    def all_off(self):
+        """Clear everything and write 0 now (shutdown path)."""
+        with self._io_lock:
+            with self._cond:
+                self._base = 0
+                self._override = None
+                self._effects.clear()
+                self._kick()
+            self._write(0, force=True)
+
+    def close(self):
+        with self._cond:
+            self._running = False
+            self._cond.notify()
+        self._thread.join(timeout=1.0)
+
+    # ------------------------------------------------------------------
+    #   Scheduler
+    # ------------------------------------------------------------------
+    def _add_effect(self, mask, effect, duration):
+        if duration is not None:
+            effect.until = effect.start + duration
+        with self._cond:
+            for m in [m for m in self._effects if m & mask]:
+                del self._effects[m]
+            self._effects[mask & 0xFF] = effect
+            self._kick()
+
+    def _kick(self):
+        self._dirty = True
+        self._cond.notify()
+
+    def _compose(self, now):
+        """Output byte at `now` and the time of the next change (or None)."""
+        wake = None
+        if self._override is not None and now >= self._override[1]:
+            self._override = None
+        for m in [m for m, e in self._effects.items() if e.until is not None and now >= e.until]:
+            if self._effects[m].kind == "fade" and self._effects[m].level_to >= 0.5:
+                self._base |= m          # a fade up leaves the LED on
+            elif self._effects[m].kind == "fade":
+                self._base &= ~m
+            del self._effects[m]
+
+        out = self._base
+        if self._override is not None:
+            out = self._override[0]
+            wake = self._override[1]
+
+        pwm = False
+        for mask, effect in self._effects.items():
+            level = effect.level(now)
+            if effect.pwm:
+                pwm = True
+                on = (self._tick % self.pwm_steps) < round(level * self.pwm_steps)
+            else:
+                on = level >= 0.5
+                # next blink edge
+                edge = now + (effect.period / 2 - ((now - effect.start) % (effect.period / 2)))
+                wake = edge if wake is None else min(wake, edge)
+            out = (out | mask) if on else (out & ~mask)
+            if effect.until is not None:
+                wake = effect.until if wake is None else min(wake, effect.until)
+        if pwm:
+            wake = now + self.pwm_frame
+        return out & 0xFF, wake
+
+    def _run(self):
+        while True:
+            with self._io_lock:
+                with self._cond:
+                    if not self._running:
+                        return
+                    now = time.monotonic()
+                    # Batch: requests inside one frame of the last write go out together
+                    hold = self._last_write + self.frame - now
+                    if self._dirty and hold > 0:
+                        self._cond.wait(hold)
+                        now = time.monotonic()
+                    self._dirty = False
+                    self._tick += 1
+                    value, wake = self._compose(now)
+
+                self._write(value)
+
+            with self._cond:
+                if not self._running:
+                    return
+                if not self._dirty:
+                    self._cond.wait(None if wake is None else max(0.0, wake - time.monotonic()))
+
+    def _write(self, value, force=False):
+        # caller holds _io_lock
+        if value == self.shadow and not force:
+            self.skipped += 1
+            return
+        if self.bus is None:
+            return
+        try:
+            self.bus.write_byte_data(self.address, self.register, value)
+            self.shadow = value
+            self.writes += 1
+            self._last_write = time.monotonic()
+            self.logger.debug(f"LED state => {bin(value)}")
+        except Exception as e:
+            self.shadow = None    # unknown; rewrite on the next change
+            self.logger.error(f"Error setting LEDs: {e}")
@@ -1,6 +1,9 @@
 #!/usr/bin/env python3
 # src/main.py
 
+# First import: the boot timeline starts here (see handlers/boot_profiler.py)
+from handlers.boot_profiler import boot
+
 import RPi.GPIO as GPIO
 GPIO.setwarnings(False)
 
@@ -8,32 +11,33 @@ import time
 import threading
 import logging
 import yaml
-import socket
 import subprocess
-import lirc
 import os
 import sys
+from contextlib import nullcontext
 from PIL import Image, ImageSequence
 
 # UI / Hardware Imports
 from display.screens.clock import Clock
 from hardware.buttonsleds import ButtonsLEDController
 from hardware.shutdown_system import shutdown_system
-from display.screens.original_screen import OriginalScreen
-from display.screens.modern_screen import ModernScreen
-from display.screens.minimal_screen import MinimalScreen
-from display.screens.vu_screen import VUScreen
-from display.screens.digitalvu_screen import DigitalVUScreen
-from display.screensavers.snake_screensaver import SnakeScreensaver
-from display.screensavers.geo_screensaver import GeoScreensaver
-from display.screensavers.bouncing_text_screensaver import BouncingTextScreensaver
+# Screens, screensavers and menu managers are imported by ManagerFactory on first use
 from display.display_manager import DisplayManager
-from managers.menu_manager import MenuManager
 from managers.mode_manager import ModeManager
 from managers.manager_factory import ManagerFactory
 from controls.rotary_control import RotaryControl
+from controls.rotary_acceleration import RotaryAccelerator
+from controls.input_trace import tracer
 from network.volumio_listener import VolumioListener
-from assets.images.convert2 import main as convert_icons_main
+from network.volumio_commands import VolumioCommandClient
+from network.async_core import start_network_core
+from handlers.album_art_cache import start_album_art_cache
+from network.event_bus import bus, QUEUED
+from network.command_server import start_command_server, CommandError
+from handlers.library_index import start_library_index
+from handlers.icon_store import get_icon_store
+
+boot.mark("imports")
 
 
 # --------------------------- config / util ---------------------------
@@ -91,34 +95,24 @@ def main():
     logger = logging.getLogger("QuadifyMain")
 
     # --- Config ---
+    boot.step("config")
     script_dir = os.path.dirname(os.path.abspath(__file__))
     config_path = os.path.join(script_dir, '..', 'config.yaml')
     config = load_config(config_path)
     display_config = config.get('display', {})
+    tracer.enabled = bool((config.get('input_trace', {}) or {}).get('enabled', True))
 
     # --- DisplayManager ---
+    boot.step("display_init")
     display_manager = DisplayManager(display_config)
 
     # --- LEDs controller ---
+    boot.step("leds_init")
     buttons_leds = ButtonsLEDController()
     buttons_leds.start()
 
-    # Convert / ensure menu icons exist
-    convert_icons_main()
-
-    # Turn off LED8 (if present on MCP23017)
-    try:
-        import smbus2
-        MCP23017_ADDRESS = 0x20
-        MCP23017_GPIOA = 0x12
-        bus = smbus2.SMBus(1)
-        current = bus.read_byte_data(MCP23017_ADDRESS, MCP23017_GPIOA)
-        bus.write_byte_data(MCP23017_ADDRESS, MCP23017_GPIOA, current & 0b11111110)
-        bus.close()
-    except Exception as e:
-        print(f"Error turning off LED8: {e}")
-
     # --- Startup Logo ---
+    boot.step("startup_logo")
     logger.info("Displaying startup logo...")
     display_manager.show_logo(duration=6)
     logger.info("Startup logo display complete.")
@@ -126,6 +120,7 @@ def main():
     logger.info("Screen cleared after logo display.")
 
     # --- Ready/loading orchestration ---
+    boot.step("services")
     volumio_ready_event = threading.Event()
     min_loading_event = threading.Event()
     ready_stop_event = threading.Event()
@@ -136,6 +131,9 @@ def main():
     volumio_host = volumio_cfg.get('host', 'localhost')
     volumio_port = volumio_cfg.get('port', 3000)
 
+    # Optional asyncio network core (socket.io + keep-alive HTTP on one loop thread)
+    network_core = start_network_core() if volumio_cfg.get('async_core', False) else None
+
     class DummyModeManager:
         def __init__(self):
             self.last_state = None
@@ -150,9 +148,34 @@ def main():
             self.last_state = state
 
     dummy_mode_manager = DummyModeManager()
-    volumio_listener = VolumioListener(host=volumio_host, port=volumio_port)
+    volumio_listener = VolumioListener(host=volumio_host, port=volumio_port, network_core=network_core)
     volumio_listener.mode_manager = dummy_mode_manager
 
+    # Republish listener signals on the event bus so slow handlers run off the socket thread
+    bus.bridge_listener(volumio_listener)
+
+    # Transport commands ride the listener's socket (HTTP fallback when disconnected)
+    volumio_commands = VolumioCommandClient(volumio_listener, host=volumio_host, port=volumio_port)
+    buttons_leds.command_client = volumio_commands
+    buttons_leds.attach_volumio_listener(volumio_listener)
+
+    # Album art cache: prefetch on pushTrack/pushState so screens never wait on HTTP
+    art_cache = start_album_art_cache(
+        base_url=f"http://{volumio_host}:{volumio_port}",
+        placeholder_path=display_config.get('default_album_art'),
+        **display_config.get('album_art_cache', {})
+    )
+    art_cache.attach_listener(volumio_listener)
+
+    # Offline library search index (fed by browsing; crawled once the UI is up)
+    index_cfg = dict(config.get('library_index', {}) or {})
+    library_index = None
+    if index_cfg.pop('enabled', True):
+        try:
+            library_index = start_library_index(base_url=f"http://{volumio_host}:{volumio_port}", **index_cfg)
+        except Exception as e:
+            logger.warning(f"Library search index unavailable: {e}")
+
     # --- Rotary (early) to exit ready loop ---
     def on_button_press_inner():
         if not ready_stop_event.is_set():
@@ -162,7 +185,8 @@ def main():
         rotation_callback=lambda d: None,
         button_callback=on_button_press_inner,
         long_press_callback=lambda: None,
-        long_press_threshold=2.5
+        long_press_threshold=2.5,
+        use_interrupts=(config.get('rotary', {}) or {}).get('interrupts', True),
     )
     threading.Thread(target=rotary_control.start, daemon=True).start()
 
@@ -172,6 +196,7 @@ def main():
         return result
 
     def handle_scroll(direction: int, mode_manager: ModeManager):
+        tracer.mark("dispatch")
         current_mode = mode_manager.get_mode()
         logger.debug(f"[IR] handle_scroll(direction={direction}) in mode '{current_mode}'")
         # Playback screens adjust volume by rotary only (IR arrows map to list scrolling)
@@ -193,6 +218,9 @@ def main():
         elif current_mode == 'radio':
             logger.debug("[IR] Scroll -> radio manager")
             mode_manager.radio_manager.scroll_selection(direction)
+        elif current_mode == 'search':
+            logger.debug("[IR] Scroll -> search manager")
+            mode_manager.search_manager.scroll_selection(direction)
         elif current_mode in (
             'library', 'albums', 'artists', 'genres',
             'last100', 'mediaservers', 'favourites', 'playlists'
@@ -209,6 +237,7 @@ def main():
             logger.debug("[IR] Scroll -> no action for this mode")
 
     def handle_select(mode_manager: ModeManager):
+        tracer.mark("dispatch")
         current_mode = mode_manager.get_mode()
         logger.debug(f"[IR] handle_select() in mode '{current_mode}'")
 
@@ -247,6 +276,10 @@ def main():
             logger.debug("[IR] Select -> radio manager")
             mode_manager.radio_manager.select_item()
             return
+        if current_mode == 'search':
+            logger.debug("[IR] Select -> search manager")
+            mode_manager.search_manager.select_item()
+            return
 
         playback_screen_mapping = {
             'original': 'original_screen',
@@ -272,91 +305,90 @@ def main():
 
     # --------------------- IR command socket server ---------------------
 
-    def make_command_server(mode_manager: ModeManager):
+    def make_command_handlers(mode_manager: ModeManager):
         """
-        Build a command server bound to /tmp/quadify.sock that uses the unified
-        handlers so streaming lists behave like library lists for IR.
+        Command registry for /tmp/quadify.sock (see network/command_server.py).
+        Uses the unified handlers so streaming lists behave like library lists
+        for IR. Handlers take their protocol-1 "args" as keyword arguments.
         """
 
-        def server():
-            sock_path = "/tmp/quadify.sock"
-            try:
-                os.remove(sock_path)
-            except OSError:
-                pass
-
-            server_socket = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
-            server_socket.bind(sock_path)
-            server_socket.listen(1)
-            print(f"Quadify command server listening on {sock_path}")
-
-            while True:
-                try:
-                    conn, _ = server_socket.accept()
-                    with conn:
-                        data = conn.recv(1024)
-                        if not data:
-                            continue
-                        command = data.decode("utf-8").strip()
-                        print(f"Command received: {command}")
-                        current_mode = mode_manager.get_mode()
-
-                        # Exit ready loop early on user commands
-                        if not ready_stop_event.is_set() and command in ("menu", "select", "ok", "toggle"):
-                            print("Exiting ready GIF due to remote control command.")
-                            ready_stop_event.set()
-                            continue
-
-                        if command == "home":
-                            mode_manager.trigger("to_clock")
-                        elif command == "shutdown":
-                            # Use the same path as the On/Off SHIM (systemd poweroff)
-                            subprocess.run(["sudo", "/bin/systemctl", "poweroff", "--no-wall"], check=False)
-
-                        elif command == "menu":
-                            if current_mode == "clock":
-                                mode_manager.trigger("to_menu")
-                        elif command == "toggle":
-                            # Toggle only makes sense on playback screens
-                            mode_manager.toggle_play_pause()
-                        elif command == "repeat":
-                            print("Repeat command received. (Implement as needed)")
-
-                        elif command == "select":
-                            handle_select(mode_manager)
-
-                        elif command in ("scroll_up", "scroll_left"):
-                            handle_scroll(-1, mode_manager)
-                        elif command in ("scroll_down", "scroll_right"):
-                            handle_scroll(+1, mode_manager)
-
-                        elif command == "seek_plus":
-                            subprocess.run(["volumio", "seek", "plus"], check=False)
-                        elif command == "seek_minus":
-                            subprocess.run(["volumio", "seek", "minus"], check=False)
-                        elif command == "skip_next":
-                            subprocess.run(["volumio", "next"], check=False)
-                        elif command == "skip_previous":
-                            subprocess.run(["volumio", "previous"], check=False)
-                        elif command == "volume_plus":
-                            volumio_listener.increase_volume()
-                        elif command == "volume_minus":
-                            volumio_listener.decrease_volume()
-                        elif command == "back":
-                            mode_manager.trigger("back")
-                        else:
-                            print(f"No mapping for command: {command}")
-
-                except Exception as e:
-                    print(f"Error in command server: {e}")
-
-        t = threading.Thread(target=server, daemon=True)
-        t.start()
-        return t
-
-    # Start early command server with dummy manager (for ready exit + basic commands)
-    make_command_server(dummy_mode_manager)
-    print("Quadify command server thread (early) started.")
+        def exits_ready_loop(fn):
+            # Exit ready loop early on user commands
+            def wrapped(**kwargs):
+                if not ready_stop_event.is_set():
+                    print("Exiting ready GIF due to remote control command.")
+                    ready_stop_event.set()
+                    return None
+                return fn(**kwargs)
+            return wrapped
+
+        def shutdown():
+            # Use the same path as the On/Off SHIM (systemd poweroff)
+            subprocess.run(["sudo", "/bin/systemctl", "poweroff", "--no-wall"], check=False)
+
+        def menu():
+            if mode_manager.get_mode() == "clock":
+                mode_manager.trigger("to_menu")
+
+        def repeat():
+            print("Repeat command received. (Implement as needed)")
+
+        def scroll(delta=1):
+            handle_scroll(int(delta), mode_manager)
+
+        def trace(action="dump", recent=0):
+            # Input latency histograms (controls/input_trace.py)
+            if action == "dump":
+                return tracer.dump()
+            if action == "snapshot":
+                return tracer.snapshot(recent=int(recent))
+            if action == "reset":
+                tracer.reset()
+            elif action in ("on", "off"):
+                tracer.enabled = action == "on"
+            else:
+                raise CommandError(f"unknown trace action: {action}")
+            return None
+
+        def boot_timeline(format="json"):
+            # Boot phases up to the first interactive frame (handlers/boot_profiler.py)
+            return boot.format() if format == "text" else boot.snapshot()
+
+        def query(what="mode"):
+            result = {"mode": mode_manager.get_mode()}
+            if what in ("state", "all"):
+                result["state"] = volumio_listener.get_current_state()
+            return result
+
+        return {
+            "home": lambda: mode_manager.trigger("to_clock"),
+            "shutdown": shutdown,
+            "menu": exits_ready_loop(menu),
+            "toggle": exits_ready_loop(lambda: mode_manager.toggle_play_pause()),
+            "ok": exits_ready_loop(lambda: None),
+            "repeat": repeat,
+            "select": exits_ready_loop(lambda: handle_select(mode_manager)),
+            "scroll": scroll,
+            "scroll_up": lambda: handle_scroll(-1, mode_manager),
+            "scroll_left": lambda: handle_scroll(-1, mode_manager),
+            "scroll_down": lambda: handle_scroll(+1, mode_manager),
+            "scroll_right": lambda: handle_scroll(+1, mode_manager),
+            "seek_plus": lambda: volumio_commands.seek_relative(+VolumioCommandClient.SEEK_STEP),
+            "seek_minus": lambda: volumio_commands.seek_relative(-VolumioCommandClient.SEEK_STEP),
+            "skip_next": volumio_commands.next,
+            "skip_previous": volumio_commands.previous,
+            "volume_plus": volumio_listener.increase_volume,
+            "volume_minus": volumio_listener.decrease_volume,
+            "back": lambda: mode_manager.trigger("back"),
+            "query": query,
+            "trace": trace,
+            "boot": boot_timeline,
+        }
+
+    # Start the command server early with the dummy manager (for ready exit + basic commands);
+    # the persistent IR connection is kept and the handler is swapped once the UI is built
+    start_command_server(make_command_handlers(dummy_mode_manager), event_bus=bus)
+    print("Quadify command server (early) started.")
 
     # --- Loading GIF during boot ---
     def show_loading():
@@ -404,11 +436,13 @@ def main():
         if status in ['play', 'stop', 'pause', 'unknown'] and not volumio_ready_event.is_set():
             volumio_ready_event.set()
 
-    volumio_listener.state_changed.connect(on_state_changed)
-    logger.info("Bound on_state_changed to volumio_listener.state_changed")
+    bus.subscribe("volumio.state", lambda state: on_state_changed(volumio_listener, state),
+                  mode=QUEUED, name="main.on_state_changed")
+    logger.info("Bound on_state_changed to the volumio.state topic")
 
     # Wait for readiness then show ready loop
     logger.info("Waiting for Volumio readiness & min load time.")
+    boot.step("wait_volumio")
     volumio_ready_event.wait()
     min_loading_event.wait()
     logger.info("Volumio is ready & min loading time passed, proceeding to ready GIF.")
@@ -429,6 +463,7 @@ def main():
         except Exception as e:
             logger.error(f"Failed to loop GIF {gif_path}: {e}")
 
+    boot.step("ready_gif")
     ready_loop_path = display_config.get('ready_loop_path', 'ready_loop.gif')
     threading.Thread(
         target=show_ready_gif_until_event,
@@ -439,6 +474,7 @@ def main():
     logger.info("Ready GIF exited, continuing to UI startup.")
 
     # --- Build full UI stack ---
+    boot.step("ui_build")
     clock_config = config.get('clock', {})
     clock = Clock(display_manager, clock_config, volumio_listener)
     clock.logger = logging.getLogger("Clock")
@@ -449,7 +485,8 @@ def main():
         clock=clock,
         volumio_listener=volumio_listener,
         preference_file_path="../preference.json",
-        config=config
+        config=config,
+        event_bus=bus
     )
 
     manager_factory = ManagerFactory(
@@ -460,9 +497,9 @@ def main():
     )
     manager_factory.setup_mode_manager()
     volumio_listener.mode_manager = mode_manager
-    volumio_listener.menu_manager = mode_manager.menu_manager
 
     # Handoff last early state if any
+    boot.step("first_mode")
     if getattr(dummy_mode_manager, 'last_state', None):
         logger.info("Handing off last Volumio state from DummyModeManager to real ModeManager")
         mode_manager.process_state_change(volumio_listener, dummy_mode_manager.last_state)
@@ -488,57 +525,110 @@ def main():
         else:
             mode_manager.trigger("to_menu")
 
-    # Start the real command server bound to the real mode_manager
-    make_command_server(mode_manager)
-    print("Quadify command server thread (UI) started.")
+    # Point the command server at the real mode_manager
+    start_command_server(make_command_handlers(mode_manager))
+    mode_manager.update_current_mode()
+    print("Quadify command server bound to the UI.")
+
+    # Screens are built on first use; pre-build the configured display mode off the UI path
+    if (config.get('screens', {}) or {}).get('warm_up', True):
+        manager_factory.warm_up()
+
+    if library_index is not None:
+        library_index.start_refresh()
+
+    # Service icons: refreshed incrementally off the boot path; the shipped/last PNGs draw until then
+    icons_cfg = config.get('icons', {}) or {}
+    if icons_cfg.get('refresh', True):
+        def refresh_icons():
+            time.sleep(icons_cfg.get('delay', 10))
+            # Imported here: requests/cairosvg load on this thread, not during boot
+            from assets.images.convert2 import main as convert_icons_main
+
+            def on_icons_changed(labels):
+                logger.info(f"Icons changed: {', '.join(labels)}")
+                menu_manager = mode_manager.screens.peek("menu_manager")
+                if menu_manager is not None:
+                    menu_manager.reload_icons()
+                else:
+                    get_icon_store().reload()
+
+            try:
+                convert_icons_main(workers=icons_cfg.get('workers', 4), on_changed=on_icons_changed)
+            except Exception as e:
+                logger.warning(f"Icon refresh failed: {e}")
+
+        threading.Thread(target=refresh_icons, name="IconRefresh", daemon=True).start()
 
     # --- Rotary handlers (use same unified handlers) ---
-    def on_rotate_ui(direction):
+    # Playback screens use rotary for volume: mode -> (screen attr, step up, step down)
+    volume_modes = {
+        'original': ('original_screen', 40, -40),
+        'modern': ('modern_screen', 10, -20),
+        'minimal': ('minimal_screen', 10, -20),
+        'vuscreen': ('vu_screen', 10, -20),
+        'digitalvuscreen': ('digitalvu_screen', 10, -20),
+        'webradio': ('webradio_screen', 10, -20),
+    }
+
+    def on_rotate_ui(delta, detents=None):
+        # delta is the (possibly accelerated) sum of rows since the last call,
+        # detents the knob movement it came from (None without the accelerator: 1:1)
+        tracer.mark("dispatch")
         current_mode = mode_manager.get_mode()
 
-        # Playback screens use rotary for volume
-        if current_mode == 'original':
-            volume_change = 40 if direction == 1 else -40
-            mode_manager.original_screen.adjust_volume(volume_change)
-            return
-        if current_mode == 'modern':
-            volume_change = 10 if direction == 1 else -20
-            mode_manager.modern_screen.adjust_volume(volume_change)
-            return
-        if current_mode == 'minimal':
-            volume_change = 10 if direction == 1 else -20
-            mode_manager.minimal_screen.adjust_volume(volume_change)
-            return
-        if current_mode == 'vuscreen':
-            volume_change = 10 if direction == 1 else -20
-            mode_manager.vu_screen.adjust_volume(volume_change)
-            return
-        if current_mode == 'digitalvuscreen':
-            volume_change = 10 if direction == 1 else -20
-            mode_manager.digitalvu_screen.adjust_volume(volume_change)
-            return
-        if current_mode == 'webradio':
-            volume_change = 10 if direction == 1 else -20
-            mode_manager.webradio_screen.adjust_volume(volume_change)
+        if current_mode in volume_modes:
+            screen, up, down = volume_modes[current_mode]
+            volume_change = (up if delta > 0 else down) * abs(delta)
+            getattr(mode_manager, screen).adjust_volume(volume_change)
             return
 
-        # All list-type modes (menu, library, streaming, etc.)
-        handle_scroll(direction, mode_manager)
+        # All list-type modes (menu, library, streaming, etc.); MenuManager's
+        # alphabet jump gesture is measured in detents, not accelerated rows
+        menu_manager = mode_manager.screens.peek("menu_manager")
+        with menu_manager.rotary_detents(detents or delta) if menu_manager else nullcontext():
+            handle_scroll(delta, mode_manager)
 
     def on_button_press_ui():
         handle_select(mode_manager)
 
     def on_long_press_ui():
+        tracer.mark("dispatch")
         current_mode = mode_manager.get_mode()
+        # Long press is always Back (alphabet jump mode is entered by spinning fast);
+        # leave jump mode on the way so the list isn't reopened in it
+        menu_manager = mode_manager.screens.peek("menu_manager")
+        if menu_manager is not None:
+            menu_manager.exit_jump_mode(render=False)
         if current_mode == "menu":
             mode_manager.trigger("to_clock")
         else:
             mode_manager.trigger("back")
 
-    rotary_control.rotation_callback = on_rotate_ui
+    # Fast spins become multi-row jumps in lists; volume stays 1:1 per detent
+    rotary_cfg = config.get('rotary', {}) or {}
+    if rotary_cfg.get('acceleration', True):
+        rotary_accelerator = RotaryAccelerator(
+            on_rotate_ui,
+            curve=rotary_cfg.get('curve'),
+            rate_window=rotary_cfg.get('rate_window', 0.25),
+            min_detents=rotary_cfg.get('min_detents', 3),
+            accelerate=lambda: mode_manager.get_mode() not in volume_modes,
+        )
+        rotary_control.rotation_callback = rotary_accelerator.feed
+    else:
+        rotary_control.rotation_callback = on_rotate_ui
     rotary_control.button_callback = on_button_press_ui
     rotary_control.long_press_callback = on_long_press_ui
 
+    boot_cfg = config.get('boot_profile', {}) or {}
+    boot.finish(
+        "first_interactive_frame",
+        report_path=boot_cfg.get('report_path', '/tmp/quadify_boot.json'),
+        history_path=boot_cfg.get('history_path'),
+        extra={"screens_built_ms": {k: round(v, 1) for k, v in mode_manager.screens.build_ms.items()}},
+    )
+
     # --- Main loop ---
     try:
         while True:
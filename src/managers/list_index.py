@@ -0,0 +1,83 @@
+# src/managers/list_index.py
+#
+# Letter-group and prefix index over a ListSource, used by MenuManager's
+# jump mode. Built once per list (off the UI thread for big lists); after
+# that moving to the next/previous letter is a table lookup, so crossing a
+# 3,000-artist list costs a couple of renders instead of hundreds.
+
+import unicodedata
+from bisect import bisect_left, bisect_right
+from typing import List, Optional, Tuple
+
+
+def group_key(title: str) -> str:
+    """'A'..'Z' for the first letter of title (accents folded), '#' otherwise."""
+    for ch in title:
+        if ch.isalpha():
+            base = unicodedata.normalize("NFKD", ch)[0].upper()
+            return base if "A" <= base <= "Z" else "#"
+        if ch.isdigit():
+            return "#"
+    return "#"
+
+
+class AlphaIndex:
+    """
+    Index of letter groups over the rows of a source.
+
+    Groups are runs of consecutive rows sharing a group key, so Volumio's
+    already sorted artist/album lists give one group per letter; an unsorted
+    list still jumps sensibly between runs. Rows after `source.raw_count`
+    (the Back row tail) are left out.
+    """
+
+    def __init__(self, source):
+        count = getattr(source, "raw_count", len(source))
+        self.count = count
+        self.group_starts: List[int] = []
+        self.group_keys: List[str] = []
+        prefixes = []
+
+        last = None
+        for i in range(count):
+            title = source.title_at(i).strip()
+            key = group_key(title)
+            if key != last:
+                self.group_starts.append(i)
+                self.group_keys.append(key)
+                last = key
+            prefixes.append((title.casefold(), i))
+        prefixes.sort()
+        self._prefix_titles = [t for t, _ in prefixes]
+        self._prefix_rows = [i for _, i in prefixes]
+
+    def __len__(self):
+        return len(self.group_starts)
+
+    def group_at(self, index: int) -> int:
+        return max(0, bisect_right(self.group_starts, index) - 1)
+
+    def key_at(self, index: int) -> str:
+        if not self.group_keys or index >= self.count:
+            return ""
+        return self.group_keys[self.group_at(index)]
+
+    def step(self, index: int, delta: int) -> Tuple[int, str]:
+        """Row index and key of the group `delta` groups away from index's group."""
+        if not self.group_starts:
+            return index, ""
+        g = self.group_at(min(index, self.count - 1))
+        if delta < 0 and index > self.group_starts[g]:
+            delta += 1  # first step back lands on the start of the current group
+        g = max(0, min(g + delta, len(self.group_starts) - 1))
+        return self.group_starts[g], self.group_keys[g]
+
+    def find_prefix(self, prefix: str) -> Optional[int]:
+        """Row index of the first title (in sort order) starting with prefix."""
+        p = (prefix or "").strip().casefold()
+        if not p:
+            return None
+        k = bisect_left(self._prefix_titles, p)
+        if k < len(self._prefix_titles) and self._prefix_titles[k].startswith(p):
+            return self._prefix_rows[k]
+        return None
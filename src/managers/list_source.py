@@ -0,0 +1,141 @@
+# src/managers/list_source.py
+#
+# Virtualised rows for MenuManager's list view.
+#
+# A ListSource is anything with len() and get_range(start, end) returning
+# display-ready row dicts. MenuManager only ever asks for the visible window,
+# so a browse response with tens of thousands of entries opens in constant
+# time: the raw rows stay in the decoded JSON lists they arrived in (no
+# per-row copies), and each row is normalised the first time it scrolls
+# into view (plus a small lookahead), then kept in a bounded LRU.
+
+import threading
+from abc import ABC, abstractmethod
+from bisect import bisect_right
+from collections import OrderedDict
+from typing import Callable, Dict, Iterable, List, Optional, Sequence
+
+
+class ListSource(ABC):
+    """Row source protocol used by MenuManager.show_list()."""
+
+    @abstractmethod
+    def __len__(self) -> int:
+        raise NotImplementedError
+
+    @abstractmethod
+    def get_range(self, start: int, end: int) -> List[Dict]:
+        """Display-ready rows [start, end), clipped to the list bounds."""
+        raise NotImplementedError
+
+    def __bool__(self):
+        return len(self) > 0
+
+    def title_at(self, index: int) -> str:
+        """Display title of one row, for indexing (may skip normalisation)."""
+        row = self[index]
+        return str(row.get("label") or row.get("title") or "")
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            start, stop, step = index.indices(len(self))
+            rows = self.get_range(start, stop)
+            return rows[::step] if step != 1 else rows
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("list source index out of range")
+        return self.get_range(index, index + 1)[0]
+
+    def __iter__(self):
+        # Mostly for small lists and debugging; big lists should be paged
+        for i in range(len(self)):
+            yield self[i]
+
+    def copy(self):
+        # Sources are immutable once built, so a "copy" for a back stack is free
+        return self
+
+
+class LazyListSource(ListSource):
+    """
+    Rows backed by one or more raw sequences (e.g. the items arrays of a
+    Volumio navigation response), normalised on demand.
+
+      chunks     - raw row sequences, concatenated logically (never copied)
+      normalise  - raw dict -> display row dict (must include "title"/"label")
+      tail       - already-normalised rows appended after the raw ones
+                   (typically the "Back" row)
+      lookahead  - extra rows normalised on each side of a requested window
+      cache_rows - normalised rows kept before the least recently used go
+    """
+
+    LOOKAHEAD = 8
+    CACHE_ROWS = 256
+
+    def __init__(self, chunks: Iterable[Sequence[Dict]], normalise: Optional[Callable[[Dict], Dict]] = None,
+                 tail: Iterable[Dict] = (), lookahead: int = LOOKAHEAD, cache_rows: int = CACHE_ROWS):
+        self._chunks = [c for c in chunks if c]
+        self._starts = []
+        total = 0
+        for c in self._chunks:
+            self._starts.append(total)
+            total += len(c)
+        self._raw_len = total
+        self._tail = list(tail)
+        self._normalise = normalise or (lambda row: row)
+        self.lookahead = lookahead
+        self.cache_rows = max(cache_rows, 2 * lookahead + 16)
+        self._rows: "OrderedDict[int, Dict]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_rows(cls, rows: Sequence[Dict], normalise: Optional[Callable[[Dict], Dict]] = None, **kwargs):
+        return cls([rows or []], normalise=normalise, **kwargs)
+
+    def __len__(self):
+        return self._raw_len + len(self._tail)
+
+    @property
+    def raw_count(self) -> int:
+        """Rows that came from the raw chunks (excludes the tail)."""
+        return self._raw_len
+
+    def raw(self, index: int) -> Dict:
+        """Un-normalised row at index (tail rows are returned as stored)."""
+        if index >= self._raw_len:
+            return self._tail[index - self._raw_len]
+        k = bisect_right(self._starts, index) - 1
+        return self._chunks[k][index - self._starts[k]]
+
+    def title_at(self, index: int) -> str:
+        # Straight from the raw row, so indexing a huge list normalises nothing
+        raw = self.raw(index)
+        return str(raw.get("title") or raw.get("label") or raw.get("album") or raw.get("name") or "")
+
+    def get_range(self, start: int, end: int) -> List[Dict]:
+        total = len(self)
+        start = max(0, start)
+        end = min(end, total)
+        if start >= end:
+            return []
+
+        with self._lock:
+            rows = [self._row(i) for i in range(start, end)]
+            # Warm the neighbourhood so the next scroll step is a cache hit
+            for i in range(max(0, start - self.lookahead), min(total, end + self.lookahead)):
+                if i not in self._rows:
+                    self._row(i)
+            while len(self._rows) > self.cache_rows:
+                self._rows.popitem(last=False)
+        return rows
+
+    def _row(self, index: int) -> Dict:
+        row = self._rows.get(index)
+        if row is None:
+            raw = self.raw(index)
+            row = raw if index >= self._raw_len else self._normalise(raw)
+            self._rows[index] = row
+        else:
+            self._rows.move_to_end(index)
+        return row
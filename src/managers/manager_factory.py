@@ -27,53 +27,62 @@ class ManagerFactory:
         self.logger.info("ManagerFactory initialized.")
 
 
+    # display_mode -> registry name of its playback screen
+    DISPLAY_MODE_SCREENS = {
+        "original": "original_screen",
+        "modern": "modern_screen",
+        "minimal": "minimal_screen",
+        "vuscreen": "vu_screen",
+        "digitalvuscreen": "digitalvu_screen",
+    }
+
+    @property
+    def menu_manager(self):
+        # Menus that take a menu_controller get the (lazily built) shared MenuManager
+        return self.mode_manager.menu_manager
+
     def setup_mode_manager(self):
         """
-        Create and configure all managers/screens, then assign them to ModeManager (or other places).
+        Register a factory for every manager/screen with ModeManager's screen
+        registry. Nothing is imported or built here: each one is created the
+        first time a mode uses it (see managers/screen_registry.py).
         """
-        # ----- Create each object -----
+        screens = self.mode_manager.screens
 
         # Quadify "menu" managers
-        self.menu_manager     = self.create_menu_manager()  # store as self.menu_manager
-        library_manager       = self.create_library_manager()
-        streaming_manager     = self.create_streaming_manager(service_name="tidal", root_uri="tidal://")
-        radio_manager         = self.create_radio_manager()
+        screens.register("menu_manager", self.create_menu_manager)
+        screens.register("library_manager", self.create_library_manager)
+        screens.register("streaming_manager",
+                         lambda: self.create_streaming_manager(service_name="tidal", root_uri="tidal://"))
+        screens.register("radio_manager", self.create_radio_manager)
+        screens.register("search_manager", self.create_search_manager)
 
         # Quoode/Quadify common screens
-        webradio_screen       = self.create_webradio_screen()
-        modern_screen         = self.create_modern_screen()
-        minimal_screen        = self.create_minimal_screen()
-        original_screen       = self.create_original_screen()
-        vu_screen             = self.create_vu_screen()
-        digitalvu_screen      = self.create_digitalvu_screen()
+        screens.register("webradio_screen", self.create_webradio_screen)
+        screens.register("modern_screen", self.create_modern_screen)
+        screens.register("minimal_screen", self.create_minimal_screen)
+        screens.register("original_screen", self.create_original_screen)
+        screens.register("vu_screen", self.create_vu_screen)
+        screens.register("digitalvu_screen", self.create_digitalvu_screen)
 
         # Additional items referenced by new ModeManager states
-        config_menu           = self.create_config_menu()
-        clock_menu            = self.create_clock_menu()
-        screensaver_menu      = self.create_screensaver_menu()
-        screensaver           = self.create_screensaver()
-        system_update_menu    = self.create_system_update_menu()
-
-        # ----- Assign them to ModeManager -----
-        self.mode_manager.set_menu_manager(self.menu_manager)
-        self.mode_manager.set_config_menu(config_menu)
-        self.mode_manager.set_library_manager(library_manager)
-        self.mode_manager.set_streaming_manager(streaming_manager)
-        self.mode_manager.set_radio_manager(radio_manager)
-
-        self.mode_manager.set_webradio_screen(webradio_screen)
-        self.mode_manager.set_modern_screen(modern_screen)
-        self.mode_manager.set_minimal_screen(minimal_screen)
-        self.mode_manager.set_original_screen(original_screen)
-        self.mode_manager.set_vu_screen(vu_screen)
-        self.mode_manager.set_digitalvu_screen(digitalvu_screen)
-
-        self.mode_manager.set_clock_menu(clock_menu)
-        self.mode_manager.set_screensaver_menu(screensaver_menu)
-        self.mode_manager.set_screensaver(screensaver)
-        self.mode_manager.set_system_update_menu(system_update_menu)
-
-        self.logger.info("ManagerFactory: ModeManager fully configured with managers & screens.")
+        screens.register("config_menu", self.create_config_menu)
+        screens.register("clock_menu", self.create_clock_menu)
+        screens.register("screensaver_menu", self.create_screensaver_menu)
+        screens.register("screensaver", self.create_screensaver)
+        screens.register("system_update_menu", self.create_system_update_menu)
+
+        self.logger.info("ManagerFactory: ModeManager configured (managers & screens built on first use).")
+
+    def warm_up(self, delay=2.0):
+        """
+        Build the main menu and the configured display mode's screen in the
+        background, so the first switch to them doesn't pay for construction.
+        """
+        display_mode = self.mode_manager.config.get("display_mode", "original")
+        self.mode_manager.screens.warm_up(
+            ["menu_manager", self.DISPLAY_MODE_SCREENS.get(display_mode)], delay=delay
+        )
 
     # ----------------------------------------------------------------
     #  Create Methods for each manager/screen
@@ -129,6 +138,15 @@ class ManagerFactory:
             loading_timeout_s= 6.0
         )
     
+    def create_search_manager(self):
+        from .menus.search_manager import SearchManager
+        return SearchManager(
+            display_manager  = self.display_manager,
+            volumio_listener = self.volumio_listener,
+            mode_manager     = self.mode_manager,
+            menu_controller  = self.menu_manager
+        )
+
     def create_webradio_screen(self):
         from display.screens.webradio_screen import WebRadioScreen
         return WebRadioScreen(
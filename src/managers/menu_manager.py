@@ -3,12 +3,28 @@
 import logging
 import threading
 import time
-import os
-import glob
+from collections import OrderedDict, deque
+from contextlib import contextmanager
 from PIL import Image, ImageDraw, ImageFont
-from network.service_listener import get_available_services
+from display.image_pipeline import prepare_for_panel
+from handlers.icon_store import get_icon_store
+from network.service_listener import get_available_services, load_services_snapshot
+from handlers.library_index import get_library_index
+from managers.list_source import ListSource, LazyListSource
+from managers.list_index import AlphaIndex
+from controls.input_trace import tracer
 
 class MenuManager:
+    # Alphabet jump mode (long lists only)
+    JUMP_MIN_ROWS = 40            # shorter lists scroll fine detent by detent
+    JUMP_INDEX_SYNC_ROWS = 500    # bigger lists are indexed on a background thread
+    JUMP_SPIN_DETENTS = 6         # this many detents ...
+    JUMP_SPIN_WINDOW = 0.35       # ... within this many seconds enters jump mode
+    JUMP_IDLE_EXIT = 1.5          # seconds without input before jump mode ends
+    JUMP_MAX_GROUPS = 3           # letter groups one merged burst of detents may move in jump mode
+
+    LIST_ROW_CACHE = 64           # rendered list rows kept (focused + unfocused)
+
     def __init__(self, display_manager, volumio_listener, mode_manager, window_size=5, menu_type="icon_row"):
         self.display_manager = display_manager
         self.volumio_listener = volumio_listener
@@ -34,16 +50,30 @@ class MenuManager:
         # label -> { name, plugin, uri, albumart, icon_url, label }
         self.services_by_label = {}
         self.discovered_order = []            # preserve order from discovery
+        self._known_services = None           # last discovery result (or on-disk snapshot)
+        self._reconcile_lock = threading.Lock()
+        self._reconcile_running = False
+        self._reconcile_again = False
 
         # --- centralised list view (for managers) ---
         self.active_view = "icon"             # "icon" | "list"
         self.list_title = ""
-        self.list_items = []                  # list[dict]: {"label","type","uri", ...}
+        self.list_items = LazyListSource([])  # ListSource of {"label","type","uri", ...} rows
         self.list_index = 0
         self.list_offset = 0
         self.list_page_size = 3               # tuned for small OLEDs
         self.on_list_select = None
         self.on_list_back = None
+        self.list_alpha_index = None          # AlphaIndex once built for the current list
+        self.list_jump_mode = False
+        self._list_generation = 0             # bumps on every show_list (stale index guard)
+        self._jump_timer = None
+        self._spin_times = deque(maxlen=self.JUMP_SPIN_DETENTS)   # (time, signed detents) per scroll
+        self._input = threading.local()       # .detents behind the scroll in progress
+        self._list_row_masks = OrderedDict()  # (index, focused, width) -> (label, "L" mask)
+        self._list_header_cache = None
+        self._list_render_lock = threading.Lock()
+        self._list_dirty = False
 
         # Display label mapping
         self.label_map = {
@@ -67,6 +97,7 @@ class MenuManager:
             "MEDIA_SERVERS": "Media\nServers",
             "SOUNDCLOUD": "Sound\nCloud",
             "UPNP": "UPnP",
+            "SEARCH": "Search",
         }
 
         # Static icon fallbacks (keys here are labels)
@@ -88,25 +119,9 @@ class MenuManager:
             "MEDIA_SERVERS": self.icon("mediaservers"),
         }
 
-        # Load cached PNG icons (produced by your icon fetcher)
-        self.icon_cache = {}
-        self.local_icon_dir = '/home/volumio/Quadify/src/assets/pngs'
-        for icon_path in glob.glob(os.path.join(self.local_icon_dir, '*.png')):
-            try:
-                key = os.path.splitext(os.path.basename(icon_path))[0].upper()
-                img = Image.open(icon_path).convert("RGBA")
-                self.icon_cache[key] = img
-                self.logger.info(f"Loaded local icon: {key} from {icon_path}")
-            except Exception as e:
-                self.logger.warning(f"Failed to load local icon {icon_path}: {e}")
-
-        # Remap fallbacks to friendly keys
-        if "LIBRARY" not in self.icon_cache and "MUSIC_LIBRARY" in self.icon_cache:
-            self.icon_cache["LIBRARY"] = self.icon_cache["MUSIC_LIBRARY"]
-        if "RADIO" not in self.icon_cache and "WEB_RADIO" in self.icon_cache:
-            self.icon_cache["RADIO"] = self.icon_cache["WEB_RADIO"]
-        if "RADIO-P" not in self.icon_cache and "RADIO_PARADISE" in self.icon_cache:
-            self.icon_cache["RADIO-P"] = self.icon_cache["RADIO_PARADISE"]
+        # PNG icons come from the shared store (loaded lazily, panel-ready per size/variant)
+        self.icon_store = get_icon_store()
+        self._item_tiles = {}                 # (label, selected, size) -> (tile, mask, pad)
 
         if hasattr(self.mode_manager, "add_on_mode_change_callback"):
             self.mode_manager.add_on_mode_change_callback(self.handle_mode_change)
@@ -115,6 +130,7 @@ class MenuManager:
 
     def handle_mode_change(self, current_mode):
         self.logger.info(f"MenuManager handling mode change to: {current_mode}")
+        self.exit_jump_mode(render=False)
         if current_mode == "menu":
             self.start_mode()
         elif self.is_active:
@@ -140,15 +156,63 @@ class MenuManager:
 
     def refresh_main_menu(self):
         """
-        Rebuilds the home (icon row) from discovered services.
+        Rebuilds the home (icon row) from the last known services straight away
+        (falling back to the on-disk snapshot at boot), then rediscovers services
+        in the background and redraws if Volumio reports something different.
         Fills self.services_by_label for dynamic routing on select.
         """
+        if self._known_services is None:
+            self._known_services = load_services_snapshot()
+            if self._known_services is not None:
+                self.logger.info(f"Home menu from snapshot ({len(self._known_services)} services).")
+        self._apply_services(self._known_services)
+        self._start_reconcile()
+
+    def _start_reconcile(self):
+        with self._reconcile_lock:
+            if self._reconcile_running:
+                # A refresh arrived mid-fetch (e.g. pushBrowseSources); fetch once more afterwards
+                self._reconcile_again = True
+                return
+            self._reconcile_running = True
+        threading.Thread(target=self._reconcile_worker, name="ServiceReconcile", daemon=True).start()
+
+    def _reconcile_worker(self):
+        while True:
+            t0 = time.monotonic()
+            try:
+                services = get_available_services()  # [{name, plugin, uri, icon_url, label, ...}]
+            except Exception as e:
+                self.logger.error(f"Error getting available services: {e}")
+                services = []
+
+            if services and services != self._known_services:
+                self.logger.info(f"Services changed; rebuilding home menu "
+                                 f"(discovery {(time.monotonic() - t0) * 1000:.0f} ms).")
+                self._known_services = services
+                self._apply_services(services, keep_selection=True)
+                if self.is_active and self.active_view == "icon":
+                    self.display_menu()
+
+            with self._reconcile_lock:
+                if not self._reconcile_again:
+                    self._reconcile_running = False
+                    return
+                self._reconcile_again = False
+
+    def _apply_services(self, raw_services, keep_selection=False):
+        """Build the home row labels from a service list (None = nothing known yet)."""
         services_labels = []
-        self.services_by_label = {}
-        self.discovered_order = []
-
-        try:
-            raw_services = get_available_services()  # [{name, plugin, uri, icon_url, label, ...}]
+        services_by_label = {}
+        discovered_order = []
+        previous = None
+        if keep_selection and self.current_menu_items:
+            idx = min(self.current_selection_index, len(self.current_menu_items) - 1)
+            previous = self.current_menu_items[idx]
+
+        if raw_services is None:
+            services_labels = ["WEB_RADIO", "PLAYLISTS"]
+        else:
             for svc in raw_services:
                 label = self._map_plugin_to_label(svc['name'], svc['plugin'])
                 # Keep a canonical label for lookup/drawing
@@ -156,26 +220,33 @@ class MenuManager:
                 # Skip pure library subentries on the home row
                 if can_label in ("INTERNAL", "NAS", "LIBRARY"):
                     continue
-                if can_label not in self.services_by_label:
-                    self.services_by_label[can_label] = svc
-                    self.discovered_order.append(can_label)
+                if can_label not in services_by_label:
+                    services_by_label[can_label] = svc
+                    discovered_order.append(can_label)
                     services_labels.append(can_label)
-        except Exception as e:
-            self.logger.error(f"Error getting available services: {e}")
-            services_labels = ["WEB_RADIO", "PLAYLISTS"]
 
         # Ensure special groups appear if present
         if any(lbl in ("MEDIA_SERVERS", "UPNP") for lbl in services_labels):
             if "MEDIA_SERVERS" not in services_labels:
                 services_labels.append("MEDIA_SERVERS")
 
+        # Search sits just before Config when the library index is running
+        if get_library_index() is not None and "SEARCH" not in services_labels:
+            services_labels.append("SEARCH")
+
         # Always include config
         if "CONFIG" not in services_labels:
             services_labels.append("CONFIG")
 
-        self.current_menu_items = services_labels
-        self.current_selection_index = 0
-        self.window_start_index = 0
+        with self.lock:
+            self.services_by_label = services_by_label
+            self.discovered_order = discovered_order
+            self.current_menu_items = services_labels
+            if previous in services_labels:
+                self.current_selection_index = services_labels.index(previous)
+            else:
+                self.current_selection_index = 0
+                self.window_start_index = 0
 
     def _map_plugin_to_label(self, name, plugin):
         """
@@ -217,8 +288,17 @@ class MenuManager:
     def display_menu(self):
         self.draw_menu(offset_x=0)
 
+    def reload_icons(self):
+        """Pick up icons rewritten on disk (background icon refresh) and redraw the home row."""
+        self.icon_store.reload()
+        with self.lock:
+            self._item_tiles.clear()
+        if self.is_active and self.active_view == "icon":
+            self.display_menu()
+
     def draw_menu(self, offset_x=0):
         with self.lock:
+            tracer.mark("render")
             visible_items = self.get_visible_window(self.current_menu_items, self.window_size)
             icon_size = 45
             spacing = -2
@@ -228,44 +308,78 @@ class MenuManager:
             x_offset = (total_width - total_icons_width) // 2 + offset_x
             y_position = (total_height - icon_size) // 2 - 10
 
-            base_image = Image.new("RGB", self.display_manager.oled.size, "black")
-            draw_obj = ImageDraw.Draw(base_image)
+            # One paste per visible item: icon + label are pre-composed tiles
+            base_image = Image.new("L", self.display_manager.oled.size, 0)
 
             for i, item in enumerate(visible_items):
                 actual_index = self.window_start_index + i
-                icon = self.icon_cache.get(item) or self.static_icons.get(item)
-                if not icon:
+                selected = actual_index == self.current_selection_index
+                tile = self._item_tile(item, selected, icon_size)
+                if not tile:
                     self.logger.warning(f"No icon cached for {item}, skipping.")
                     continue
-                if icon.mode == "RGBA":
-                    background = Image.new("RGB", icon.size, (0, 0, 0))
-                    background.paste(icon, mask=icon.split()[3])
-                    icon = background
-                icon = icon.resize((icon_size, icon_size), Image.LANCZOS)
+                img, mask, pad = tile
                 x = x_offset + i * (icon_size + spacing)
-                y_adjustment = -5 if actual_index == self.current_selection_index else 0
-                base_image.paste(icon, (x, y_position + y_adjustment))
-
-                label = self.label_map.get(item, item.title().replace('_', ' '))
-                font = self.display_manager.fonts.get(
-                    self.bold_font_key if actual_index == self.current_selection_index else self.font_key,
-                    ImageFont.load_default(),
-                )
-                text_color = "white" if actual_index == self.current_selection_index else "black"
-
-                lines = label.split('\n')
-                line_height = font.getsize('A')[1]
-                total_h = line_height * len(lines)
-                text_y = y_position + icon_size + 2 - total_h // 2
-
-                for j, line in enumerate(lines):
-                    tw, th = draw_obj.textsize(line, font=font)
-                    text_x = x + (icon_size - tw) // 2
-                    draw_obj.text((text_x, text_y + j * line_height), line, font=font, fill=text_color)
+                y_adjustment = -5 if selected else 0
+                base_image.paste(img, (x - pad, y_position + y_adjustment), mask)
 
             base_image = base_image.convert(self.display_manager.oled.mode)
             self.display_manager.oled.display(base_image)
 
+    def _icon_tile(self, label, size, variant="normal"):
+        """Panel-ready icon from the shared store (or a static Image fallback)."""
+        tile = self.icon_store.tile(label, size, variant)
+        if tile is None:
+            icon = self.static_icons.get(label)
+            if isinstance(icon, Image.Image):
+                tile = prepare_for_panel(icon, (size, size), dither="none", contrast=False)
+        return tile
+
+    def _item_tile(self, item, selected, icon_size):
+        """
+        Icon plus its label, composed once per (item, selected). Returns
+        (tile, mask, pad): the mask keeps the icon square opaque and the label
+        glyphs only, exactly as drawing them into the frame would.
+        """
+        key = (item, selected, icon_size)
+        cached = self._item_tiles.get(key)
+        if cached is not None:
+            return cached
+
+        icon = self._icon_tile(item, icon_size, "selected" if selected else "dimmed")
+        if icon is None:
+            return None
+
+        label = self.label_map.get(item, item.title().replace('_', ' '))
+        font = self.display_manager.fonts.get(
+            self.bold_font_key if selected else self.font_key,
+            ImageFont.load_default(),
+        )
+        measure = ImageDraw.Draw(Image.new("L", (1, 1)))
+        lines = label.split('\n')
+        line_height = font.getsize('A')[1]
+        total_h = line_height * len(lines)
+        text_top = icon_size + 2 - total_h // 2
+        widths = [measure.textsize(line, font=font)[0] for line in lines]
+
+        pad = max(0, (max(widths) - icon_size + 1) // 2)
+        size = (icon_size + 2 * pad, max(icon_size, text_top + total_h + line_height // 2))
+        tile = Image.new("L", size, 0)
+        mask = Image.new("L", size, 0)
+        tile.paste(icon, (pad, 0))
+        mask.paste(255, (pad, 0, pad + icon_size, icon_size))
+
+        tile_draw, mask_draw = ImageDraw.Draw(tile), ImageDraw.Draw(mask)
+        for j, (line, tw) in enumerate(zip(lines, widths)):
+            pos = (pad + (icon_size - tw) // 2, text_top + j * line_height)
+            tile_draw.text(pos, line, font=font, fill=255 if selected else 0)
+            mask_draw.text(pos, line, font=font, fill=255)
+
+        if len(self._item_tiles) >= 64:
+            self._item_tiles.clear()
+        self._item_tiles[key] = (tile, mask, pad)
+        return self._item_tiles[key]
+
     def get_visible_window(self, items, window_size):
         half = window_size // 2
         self.window_start_index = self.current_selection_index - half
@@ -277,21 +391,157 @@ class MenuManager:
 
     # ---------------- central list view (used by feature managers) ----------------
 
-    def show_list(self, title, items, on_select=None, on_back=None):
-        self.active_view = "list"
-        self.list_title = title or ""
-        self.list_items = [{
+    @staticmethod
+    def _list_row(it):
+        return {
             "label": it.get("title") or it.get("label") or "Untitled",
             "type": (it.get("type") or "").lower(),
             "uri": it.get("uri"),
             **it
-        } for it in (items or [])]
-        self.list_index = 0
+        }
+
+    def show_list(self, title, items, on_select=None, on_back=None, index=0):
+        """
+        Show a list view. `items` is a plain list of dicts or a ListSource;
+        either way only the rows on screen (plus a small lookahead) are
+        normalised, so opening a huge list costs the same as a short one.
+        """
+        self.active_view = "list"
+        self.list_title = title or ""
+        if isinstance(items, ListSource):
+            self.list_items = items
+        else:
+            self.list_items = LazyListSource.from_rows(items or [], normalise=self._list_row)
+        self.list_index = index
         self.list_offset = 0
         self.on_list_select = on_select
         self.on_list_back = on_back
+        self._cancel_jump_timer()
+        self.list_jump_mode = False
+        self._spin_times.clear()
+        self._list_row_masks.clear()
+        self._list_header_cache = None
+        self._build_list_index()
         self._render_list()
 
+    # ---------------- alphabet jump / type-ahead ----------------
+
+    def _build_list_index(self):
+        self._list_generation += 1
+        self.list_alpha_index = None
+        source = self.list_items
+        if len(source) < self.JUMP_MIN_ROWS:
+            return
+        generation = self._list_generation
+
+        def _build():
+            t0 = time.monotonic()
+            try:
+                index = AlphaIndex(source)
+            except Exception as e:
+                self.logger.warning(f"List index build failed: {e}")
+                return
+            if generation == self._list_generation:
+                self.list_alpha_index = index
+                self.logger.debug(f"Indexed {index.count} rows into {len(index)} groups "
+                                  f"in {(time.monotonic() - t0) * 1000:.0f} ms")
+
+        if len(source) <= self.JUMP_INDEX_SYNC_ROWS:
+            _build()
+        else:
+            threading.Thread(target=_build, daemon=True).start()
+
+    def enter_jump_mode(self):
+        if self.active_view != "list" or self.list_alpha_index is None or len(self.list_alpha_index) < 2:
+            return False
+        self.list_jump_mode = True
+        self._arm_jump_timer()
+        self._render_list()
+        return True
+
+    def exit_jump_mode(self, render=True):
+        self._cancel_jump_timer()
+        if not self.list_jump_mode:
+            return
+        self.list_jump_mode = False
+        self._spin_times.clear()
+        if render and self.active_view == "list":
+            self._render_list()
+
+    def jump_to_prefix(self, prefix):
+        """Type-ahead: move the focus to the first row starting with prefix."""
+        index = self.list_alpha_index
+        if self.active_view != "list" or index is None:
+            return False
+        row = index.find_prefix(prefix)
+        if row is None:
+            return False
+        self.list_index = row
+        self._render_list()
+        return True
+
+    def _jump(self, delta):
+        self.list_index, _ = self.list_alpha_index.step(self.list_index, delta)
+        self._arm_jump_timer()
+        self._render_list()
+
+    @contextmanager
+    def rotary_detents(self, detents):
+        """
+        Knob detents behind the scrolls made inside (RotaryAccelerator merges a
+        burst into one accelerated row delta). Scrolls made without it (IR,
+        control socket) count as a single detent whatever their delta.
+        """
+        self._input.detents = detents
+        try:
+            yield
+        finally:
+            self._input.detents = None
+
+    def _scroll_detents(self, delta):
+        detents = getattr(self._input, "detents", None)
+        return detents if detents else (1 if delta > 0 else -1)
+
+    def _is_fast_spin(self, detents):
+        # Same-direction detents within the window; a reversal starts over
+        now = time.monotonic()
+        if self._spin_times and (self._spin_times[-1][1] > 0) != (detents > 0):
+            self._spin_times.clear()
+        self._spin_times.append((now, detents))
+        spun = sum(abs(n) for t, n in self._spin_times if now - t <= self.JUMP_SPIN_WINDOW)
+        return spun >= self.JUMP_SPIN_DETENTS
+
+    def _arm_jump_timer(self):
+        self._cancel_jump_timer()
+        generation = self._list_generation
+
+        def _expire():
+            if generation == self._list_generation:
+                self.exit_jump_mode()
+
+        self._jump_timer = threading.Timer(self.JUMP_IDLE_EXIT, _expire)
+        self._jump_timer.daemon = True
+        self._jump_timer.start()
+
+    def _cancel_jump_timer(self):
+        if self._jump_timer is not None:
+            self._jump_timer.cancel()
+            self._jump_timer = None
+
+    def _draw_jump_overlay(self, draw, w, h, th):
+        key = self.list_alpha_index.key_at(self.list_index) if self.list_alpha_index else ""
+        if not key:
+            return
+        font = self.display_manager.fonts.get("menu_jump_font") or \
+            self.display_manager.fonts.get(self.bold_font_key, ImageFont.load_default())
+        left, top, right, bottom = draw.textbbox((0, 0), key, font=font)
+        tw, tht = right - left, bottom - top
+        box = min(h - 4, max(tw, tht) + 12)
+        x0 = w - box - 4
+        y0 = (h - box) // 2
+        draw.rectangle((x0, y0, x0 + box, y0 + box), fill="black", outline=th["text"])
+        draw.text((x0 + (box - tw) // 2 - left, y0 + (box - tht) // 2 - top), key, font=font, fill=th["text"])
+
     def _list_set_bounds(self):
         total = len(self.list_items)
         if total <= 0:
@@ -310,39 +560,45 @@ class MenuManager:
             self.list_offset = self.list_index - 1
 
     def _render_list(self):
+        """
+        Draw the list view. Calls from the encoder never queue up behind a
+        slow frame: if a render is already running it is simply marked dirty
+        and redraws once more with the latest index when it finishes.
+        """
+        self._list_dirty = True
+        while self._list_dirty:
+            if not self._list_render_lock.acquire(blocking=False):
+                return
+            try:
+                while self._list_dirty:
+                    self._list_dirty = False
+                    self._draw_list_frame()
+            finally:
+                self._list_render_lock.release()
+
+    def _draw_list_frame(self):
         with self.lock:
+            tracer.mark("render")
             w, h = self.display_manager.oled.size
             img = Image.new("RGB", (w, h), "black")
             draw = ImageDraw.Draw(img)
-            font = self.display_manager.fonts.get(self.font_key, ImageFont.load_default())
-            font_bold = self.display_manager.fonts.get(self.bold_font_key, font)
             th = self._list_theme()
-
             margin = th["margin"]
-            y_offset = th.get("y_offset", 0)
 
-            # Title
-            title_y = max(0, margin + th.get("title_offset", 0) + y_offset)
-            title_h = 0
-            if self.list_title:
-                draw.text((margin, title_y), self.list_title, font=font_bold, fill=th["text"])
-                try:
-                    ascent, descent = font_bold.getmetrics()
-                    title_h = ascent + descent
-                except Exception:
-                    _, title_h = self._text_wh(draw, self.list_title, font_bold)
-                div_y = title_y + title_h
+            header = self._list_header(w)
+            if header["mask"] is not None:
+                img.paste(th["text"], (0, 0), header["mask"])
+                div_y = header["div_y"]
                 draw.line((margin, div_y, w - margin, div_y), fill=th["divider_colour"], width=1)
-                rows_y = div_y + th.get("header_gap", 0)
-            else:
-                rows_y = title_y
+            rows_y = header["rows_y"]
+            line_h = header["line_h"]
 
             # Rows
             total = len(self.list_items)
             self._list_set_bounds()
             start = self.list_offset
             end = min(start + self.list_page_size, total)
-            visible = self.list_items[start:end]
+            visible = self.list_items.get_range(start, end)
 
             if total <= self.list_page_size:
                 focus_row = self.list_index
@@ -353,49 +609,127 @@ class MenuManager:
             else:
                 focus_row = 1
 
-            base_line_h = self._text_wh(draw, "A", font)[1]
-            line_h = base_line_h + th["row_gap"]
-            text_x = margin + 12
-
             for i, row in enumerate(visible):
                 row_y = rows_y + i * line_h
                 is_focus = (i == focus_row)
                 if is_focus:
                     draw.rectangle((margin - 2, row_y - 1, w - margin + 2, row_y + line_h - 2),
                                    fill=th["focus_bg"])
-                chev = th["chevron_focus"] if is_focus else th["chevron_dim"]
-                draw.text((margin, row_y), chev,
-                          font=font_bold if is_focus else font,
-                          fill=th["text"] if is_focus else th["text_dim"])
-
-                label = row.get("label") or row.get("title") or "Untitled"
-                max_w = (w - margin) - text_x
-                label_draw = self._truncate_to_width(draw, label,
-                                                     font_bold if is_focus else font, max_w)
-                draw.text((text_x, row_y), label_draw,
-                          font=font_bold if is_focus else font,
-                          fill=th["text"] if is_focus else th["text_dim"])
+                mask = self._list_row_mask(start + i, row, is_focus, w, line_h)
+                img.paste(th["text"] if is_focus else th["text_dim"], (0, row_y), mask)
 
                 if i < len(visible) - 1:
                     dy = row_y + line_h - 1
                     draw.line((margin, dy, w - margin, dy), fill=th["divider_colour"])
 
             if self.list_offset > 0:
-                draw.text((w - margin - 8, rows_y - 12), "^", font=font, fill=th["text_dim"])
+                img.paste(th["text_dim"], (w - margin - 8, rows_y - 12), header["up"])
             if self.list_offset + self.list_page_size < total:
-                draw.text((w - margin - 8, h - margin - 12), "v", font=font, fill=th["text_dim"])
+                img.paste(th["text_dim"], (w - margin - 8, h - margin - 12), header["down"])
+
+            if self.list_jump_mode:
+                self._draw_jump_overlay(draw, w, h, th)
 
             self.display_manager.oled.display(img)
 
+    # ---- list bitmap caches (cleared by show_list) ----
+
+    def _list_fonts(self):
+        font = self.display_manager.fonts.get(self.font_key, ImageFont.load_default())
+        return font, self.display_manager.fonts.get(self.bold_font_key, font)
+
+    def _list_header(self, w):
+        """Title mask and row geometry for the current list, measured once."""
+        key = (self.list_title, w)
+        if self._list_header_cache is not None and self._list_header_cache["key"] == key:
+            return self._list_header_cache
+
+        font, font_bold = self._list_fonts()
+        th = self._list_theme()
+        margin = th["margin"]
+        y_offset = th.get("y_offset", 0)
+        scratch = ImageDraw.Draw(Image.new("L", (1, 1)))
+
+        title_y = max(0, margin + th.get("title_offset", 0) + y_offset)
+        mask, div_y, rows_y = None, None, title_y
+        if self.list_title:
+            try:
+                ascent, descent = font_bold.getmetrics()
+                title_h = ascent + descent
+            except Exception:
+                _, title_h = self._text_wh(scratch, self.list_title, font_bold)
+            mask = Image.new("L", (w, title_y + title_h + 1))
+            ImageDraw.Draw(mask).text((margin, title_y), self.list_title, font=font_bold, fill=255)
+            div_y = title_y + title_h
+            rows_y = div_y + th.get("header_gap", 0)
+
+        line_h = self._text_wh(scratch, "A", font)[1] + th["row_gap"]
+        self._list_header_cache = {
+            "key": key, "mask": mask, "div_y": div_y, "rows_y": rows_y, "line_h": line_h,
+            "up": self._glyph_mask("^", font, line_h), "down": self._glyph_mask("v", font, line_h),
+        }
+        return self._list_header_cache
+
+    @staticmethod
+    def _glyph_mask(text, font, height):
+        mask = Image.new("L", (12, height))
+        ImageDraw.Draw(mask).text((0, 0), text, font=font, fill=255)
+        return mask
+
+    def _list_row_mask(self, index, row, is_focus, w, line_h):
+        """
+        Chevron + truncated label of one row as an "L" mask, keyed by
+        (row index, focus, width). Rows of a list never change once shown,
+        so scrolling only pastes masks; the label is re-measured only when a
+        row first appears in a given focus state.
+        """
+        label = row.get("label") or row.get("title") or "Untitled"
+        key = (index, is_focus, w)
+        hit = self._list_row_masks.get(key)
+        if hit is not None and hit[0] == label:
+            self._list_row_masks.move_to_end(key)
+            return hit[1]
+
+        font, font_bold = self._list_fonts()
+        th = self._list_theme()
+        margin = th["margin"]
+        text_x = margin + 12
+        f = font_bold if is_focus else font
+
+        mask = Image.new("L", (w, line_h))
+        draw = ImageDraw.Draw(mask)
+        draw.text((margin, 0), th["chevron_focus"] if is_focus else th["chevron_dim"], font=f, fill=255)
+        draw.text((text_x, 0), self._truncate_to_width(draw, label, f, (w - margin) - text_x), font=f, fill=255)
+
+        self._list_row_masks[key] = (label, mask)
+        while len(self._list_row_masks) > self.LIST_ROW_CACHE:
+            self._list_row_masks.popitem(last=False)
+        return mask
+
     def _scroll_list(self, delta):
         if not self.list_items:
             return
+        # Letter steps follow the knob detents (not accelerated rows), capped so a burst can't skip the alphabet
+        detents = self._scroll_detents(delta)
+        groups = max(-self.JUMP_MAX_GROUPS, min(detents, self.JUMP_MAX_GROUPS))
+        if self.list_jump_mode and self.list_alpha_index is not None:
+            self._jump(groups)
+            return
+        if self.list_alpha_index is not None and self._is_fast_spin(detents):
+            # Spinning hard through a long list: switch to letter steps
+            self.list_jump_mode = True
+            self._jump(1 if delta > 0 else -1)
+            return
         self.list_index = max(0, min(self.list_index + delta, len(self.list_items) - 1))
         self._render_list()
 
     def _select_list_item(self):
         if not self.list_items:
             return
+        if self.list_jump_mode:
+            # Select confirms the letter; the next press picks the row
+            self.exit_jump_mode()
+            return
         item = self.list_items[self.list_index]
 
         if (item.get("type") == "back") or (str(item.get("label", "")).strip().lower() == "back"):
@@ -459,6 +793,8 @@ class MenuManager:
             self.mode_manager.to_playlists(); return
         if key == "CONFIG":
             self.mode_manager.to_configmenu(); return
+        if key == "SEARCH":
+            self.mode_manager.to_search(); return
         if key == "TIDAL":
             self.mode_manager.trigger("to_streaming", service_name="tidal", start_uri="tidal://"); return
         if key == "QOBUZ":
@@ -1,5 +1,6 @@
 import logging
 import threading
+import time
 from typing import Optional, List, Dict
 from threading import Thread
 from requests.adapters import HTTPAdapter
@@ -8,6 +9,9 @@ from urllib3.util.retry import Retry
 import requests
 
 from managers.base_manager import BaseManager
+from managers.list_source import ListSource, LazyListSource
+from network.async_core import get_network_core
+from handlers.library_index import get_library_index
 
 FRIENDLY_LABELS = {
     "music-library": "Music Library",
@@ -38,6 +42,11 @@ class LibraryManager(BaseManager):
     (same approach as StreamingManager). All drawing goes through MenuManager.show_list().
     """
 
+    # URIs Volumio's mpd plugin can expand itself (folders, incl. multi-disc subfolders)
+    DIRECT_PLAY_PREFIXES = ("music-library/", "albums://")
+    # Tracks per addToQueue request when a track list has to be queued by hand
+    QUEUE_BATCH_SIZE = 100
+
     def __init__(
         self,
         display_manager,
@@ -60,6 +69,13 @@ class LibraryManager(BaseManager):
         retries = Retry(total=3, backoff_factor=0.3, status_forcelist=[500, 502, 503, 504])
         self.session.mount("http://", HTTPAdapter(max_retries=retries))
 
+        # Optional asyncio core: browses become cancellable futures instead of one thread each
+        self.network_core = get_network_core()
+        self._pending_fetch = None
+
+        # Last album probe from _is_album_folder_fast: {"uri": ..., "items": [...]}
+        self._album_probe: Optional[Dict] = None
+
         self.logger = logging.getLogger(self.__class__.__name__)
         self.logger.setLevel(logging.INFO)
 
@@ -108,6 +124,7 @@ class LibraryManager(BaseManager):
             return
         self.is_active = False
         self._cancel_timeout()
+        self._cancel_pending_fetch()
         try:
             self.display_manager.clear_screen()
         except Exception:
@@ -119,50 +136,100 @@ class LibraryManager(BaseManager):
         """Fetch a folder/list from Volumio HTTP API, then show it via MenuManager."""
         self.logger.info(f"[{self.service_type}] Fetching navigation for URI: {uri}")
 
+        core = self.network_core
+        if core is not None:
+            # Only the latest browse matters; drop any request still in flight
+            self._cancel_pending_fetch()
+            fut = core.get_json(f"{self.base_url}/api/v1/browse", params={"uri": uri}, timeout=6)
+            self._pending_fetch = fut
+            core.when_done(fut, self._on_fetch_done)
+            return
+
         def _worker():
             try:
                 resp = self.session.get(f"{self.base_url}/api/v1/browse?uri={quote(uri)}", timeout=6)
                 if resp.status_code != 200:
                     self._show_error_list("Fetch Error", f"Status {resp.status_code}")
                     return
+                self._apply_navigation(resp.json())
+            except Exception as e:
+                self._show_error_list("Fetch Error", str(e))
 
-                nav = resp.json().get("navigation", {})
-                lists = nav.get("lists") or []
-                items: List[Dict] = []
-                for lst in lists:
-                    items.extend(lst.get("items") or [])
+        threading.Thread(target=_worker, daemon=True).start()
 
-                if not items:
-                    self._show_empty_list()
-                    return
+    def _on_fetch_done(self, fut):
+        if fut.cancelled() or fut is not self._pending_fetch:
+            return
+        self._pending_fetch = None
+        try:
+            data = fut.result()
+        except Exception as e:
+            self._show_error_list("Fetch Error", str(e))
+            return
+        self._apply_navigation(data)
 
-                # Normalise rows and add Back
-                self.current_menu_items = self._normalise_items(items)
-                self.current_menu_items.append({"title": "Back", "type": "back", "uri": None})
+    def _cancel_pending_fetch(self):
+        if self._pending_fetch is not None:
+            self._pending_fetch.cancel()
+            self._pending_fetch = None
 
-                self._show_list(self.current_menu_items)
-            except Exception as e:
-                self._show_error_list("Fetch Error", str(e))
+    def _apply_navigation(self, data: Dict):
+        index = get_library_index()
+        if index is not None:
+            # Every list browsed also feeds the search index (queued, off this thread)
+            index.ingest(self.current_path, data)
 
-        threading.Thread(target=_worker, daemon=True).start()
+        nav = (data or {}).get("navigation", {})
+        lists = nav.get("lists") or []
+        chunks = [lst.get("items") or [] for lst in lists]
+
+        if not any(chunks):
+            self._show_empty_list()
+            return
 
-    def _normalise_items(self, items: List[Dict]) -> List[Dict]:
-        norm: List[Dict] = []
-        for it in items:
-            title = it.get("title") or it.get("album") or it.get("name") or "Untitled"
-            uri = it.get("uri")
-            typ = (it.get("type") or "").lower()
-            # Heuristic: sometimes missing types
-            if not typ and uri and uri.endswith("/play"):
-                typ = "song"
-            norm.append({
-                "title": title,
-                "uri": uri,
-                "type": typ,
-                "service": (it.get("service") or "").lower(),
-                **it,
-            })
-        return norm
+        # Rows are normalised lazily as they scroll into view; Back goes last
+        self.current_menu_items = LazyListSource(
+            chunks,
+            normalise=self._normalise_item,
+            tail=[{"title": "Back", "type": "back", "uri": None}],
+        )
+        self.logger.debug(f"Browse list ready: {len(self.current_menu_items)} rows")
+
+        self._show_list(self.current_menu_items)
+
+    def _browse_json(self, uri: str, timeout: float = 6) -> Dict:
+        """Blocking browse, over the network core's keep-alive pool when enabled."""
+        if self.network_core is not None:
+            return self.network_core.get_json(f"{self.base_url}/api/v1/browse",
+                                              params={"uri": uri}, timeout=timeout).result(timeout + 1)
+        resp = self.session.get(f"{self.base_url}/api/v1/browse?uri={quote(uri)}", timeout=timeout)
+        resp.raise_for_status()
+        return resp.json()
+
+    def _post_json(self, path: str, payload, timeout: float = 8):
+        """Blocking POST to the Volumio REST API; raises on HTTP errors."""
+        if self.network_core is not None:
+            return self.network_core.post_json(f"{self.base_url}{path}", payload,
+                                               timeout=timeout).result(timeout + 1)
+        resp = self.session.post(f"{self.base_url}{path}", json=payload, timeout=timeout)
+        resp.raise_for_status()
+        return resp
+
+    @staticmethod
+    def _normalise_item(it: Dict) -> Dict:
+        title = it.get("title") or it.get("album") or it.get("name") or "Untitled"
+        uri = it.get("uri")
+        typ = (it.get("type") or "").lower()
+        # Heuristic: sometimes missing types
+        if not typ and uri and uri.endswith("/play"):
+            typ = "song"
+        return {
+            "title": title,
+            "uri": uri,
+            "type": typ,
+            "service": (it.get("service") or "").lower(),
+            **it,
+        }
 
     # ---------------- timeout ----------------
 
@@ -198,11 +265,14 @@ class LibraryManager(BaseManager):
                 return FRIENDLY_LABELS[c.lower()]
         return (self.current_path or self.service_type or "Library").replace("_", " ").title()
 
-    def _show_list(self, items: List[Dict]):
+    def _show_list(self, items):
         if not self.menu_controller:
             self.logger.warning("Menu controller not available; cannot render list.")
             return
-        normalised = [{"title": it.get("title") or it.get("label") or "Untitled", **it} for it in items]
+        if isinstance(items, ListSource):
+            normalised = items
+        else:
+            normalised = [{"title": it.get("title") or it.get("label") or "Untitled", **it} for it in items]
         self.menu_controller.show_list(
             title=self._title_for_current_path(),
             items=normalised,
@@ -324,8 +394,8 @@ class LibraryManager(BaseManager):
         if not folder_uri:
             return False
         try:
-            resp = self.session.get(f"{self.base_url}/api/v1/browse?uri={quote(folder_uri)}", timeout=6)
-            items = resp.json().get("navigation", {}).get("lists", [{}])[0].get("items", [])
+            items = self._browse_json(folder_uri).get("navigation", {}).get("lists", [{}])[0].get("items", [])
+            self._album_probe = {"uri": folder_uri, "items": items}
             has_songs = any((i.get("type") or "").lower() == "song" for i in items)
             has_folders = any((i.get("type") or "").lower() in ["folder", "album"] for i in items)
             return has_songs and not has_folders
@@ -340,36 +410,15 @@ class LibraryManager(BaseManager):
         Thread(target=self._play_album_thread, args=(folder_uri, folder_item.get("title", "")), daemon=True).start()
 
     def _play_album_thread(self, album_uri: str, album_title: str):
+        t0 = time.monotonic()
         try:
-            # Resolve custom albums:// scheme if present
-            if album_uri.startswith("albums://"):
-                parts = unquote(album_uri[9:]).split("/", 1)
-                if len(parts) == 2:
-                    artist, album = parts
-                    album_uri = f"music-library/INTERNAL/Music/{artist}/{album}"
-                else:
-                    self._show_error_list("Playback Error", f"Could not resolve album index URI: {album_uri}")
-                    return
-
-            resp = self.session.get(f"{self.base_url}/api/v1/browse?uri={quote(album_uri)}", timeout=8)
-            if resp.status_code != 200:
-                self._show_error_list("Playback Error", f"Fetch album failed: {resp.status_code}")
-                return
-
-            items = resp.json().get("navigation", {}).get("lists", [{}])[0].get("items", [])
-            playable = [it for it in items if (it.get("type") in ("song", "track", "audio", "file")) and it.get("uri")]
-            if not playable:
-                self._show_error_list("Playback Error", f"No tracks in: {album_title}")
+            round_trips = self._queue_album(album_uri, album_title)
+            if not round_trips:
                 return
-
-            first = playable[0]
-            self.session.post(f"{self.base_url}/api/v1/replaceAndPlay",
-                              json={"name": album_title, "service": "mpd", "uri": first.get("uri")})
-            for it in playable[1:]:
-                self.session.post(f"{self.base_url}/api/v1/addToQueue",
-                                  json={"name": album_title, "service": "mpd", "uri": it.get("uri")})
-            self.session.post(f"{self.base_url}/api/v1/commands", json={"cmd": "play"})
-
+            self.logger.info(
+                f"Started '{album_title}' in {(time.monotonic() - t0) * 1000:.0f} ms "
+                f"({round_trips} request{'s' if round_trips != 1 else ''})"
+            )
             self._show_list([
                 {"title": f"Playing: {album_title}", "type": "info"},
                 {"title": "Back", "type": "back"}
@@ -377,6 +426,86 @@ class LibraryManager(BaseManager):
         except Exception as e:
             self._show_error_list("Playback Error", str(e))
 
+    def _queue_album(self, album_uri: str, album_title: str) -> int:
+        """
+        Replace the queue with an album/folder and start playback.
+        Returns the number of HTTP round trips used, or 0 after showing an error.
+        """
+        try:
+            return self._queue_album_quiet(album_uri, album_title)
+        except LookupError as e:
+            self._show_error_list("Playback Error", str(e))
+            return 0
+
+    def queue_and_play(self, item: Dict, folder: bool = False) -> int:
+        """
+        Replace the queue with a track (or, with folder=True, an album/folder) and
+        start playback without drawing anything, for callers that own the list view
+        (search). Blocking; raises on failure. Returns the HTTP round trips used.
+        """
+        uri = item.get("uri")
+        if not uri:
+            raise LookupError("No URI")
+        title = item.get("title", "")
+        if folder:
+            return self._queue_album_quiet(uri, title)
+        self._post_json("/api/v1/replaceAndPlay",
+                        {"name": title, "service": item.get("service", self.service_type), "uri": uri})
+        return 1
+
+    def _queue_album_quiet(self, album_uri: str, album_title: str) -> int:
+        """_queue_album without the UI: raises LookupError when nothing is playable."""
+        # Fast path: Volumio expands the folder server-side, one request for the whole album
+        if album_uri.startswith(self.DIRECT_PLAY_PREFIXES):
+            try:
+                self._post_json("/api/v1/replaceAndPlay",
+                                {"name": album_title, "service": "mpd", "type": "folder", "uri": album_uri})
+                return 1
+            except Exception as e:
+                self.logger.warning(f"Folder replaceAndPlay failed for {album_uri}, queueing tracks: {e}")
+
+        round_trips = 0
+        probe = self._album_probe or {}
+        if probe.get("uri") == album_uri:
+            items = probe.get("items") or []
+        else:
+            items = self._fetch_album_items(album_uri)
+            round_trips += 1
+        playable = [it for it in items if (it.get("type") in ("song", "track", "audio", "file")) and it.get("uri")]
+
+        # Older index URIs: fall back to the folder path under INTERNAL
+        if not playable and album_uri.startswith("albums://"):
+            parts = unquote(album_uri[9:]).split("/", 1)
+            if len(parts) != 2:
+                raise LookupError(f"Could not resolve album index URI: {album_uri}")
+            artist, album = parts
+            items = self._fetch_album_items(f"music-library/INTERNAL/Music/{artist}/{album}")
+            round_trips += 1
+            playable = [it for it in items if (it.get("type") in ("song", "track", "audio", "file")) and it.get("uri")]
+
+        if not playable:
+            raise LookupError(f"No tracks in: {album_title}")
+
+        def _entry(it):
+            return {"name": album_title, "service": it.get("service") or "mpd", "uri": it.get("uri")}
+
+        # replaceAndPlay starts playback on the first track; the rest go in bounded batches
+        self._post_json("/api/v1/replaceAndPlay", _entry(playable[0]))
+        round_trips += 1
+        rest = playable[1:]
+        for i in range(0, len(rest), self.QUEUE_BATCH_SIZE):
+            self._post_json("/api/v1/addToQueue", [_entry(it) for it in rest[i:i + self.QUEUE_BATCH_SIZE]])
+            round_trips += 1
+        return round_trips
+
+    def _fetch_album_items(self, uri: str) -> List[Dict]:
+        try:
+            data = self._browse_json(uri, timeout=8)
+        except Exception as e:
+            self.logger.warning(f"Fetch album failed for {uri}: {e}")
+            return []
+        return data.get("navigation", {}).get("lists", [{}])[0].get("items", [])
+
     def replace_and_play(self, item: Dict):
         uri = item.get("uri")
         if not uri:
@@ -0,0 +1,236 @@
+# src/managers/menus/search_manager.py
+
+import logging
+import string
+import threading
+from typing import Dict, List, Optional
+
+from managers.base_manager import BaseManager
+from handlers.library_index import get_library_index
+
+KEYS = list(string.ascii_uppercase) + [" "] + list(string.digits)
+KIND_LABELS = {"artist": "Artist", "album": "Album", "track": "Track"}
+
+
+class SearchManager(BaseManager):
+    """
+    Library search against the local index (handlers/library_index.py).
+    - A rotary "keyboard" list builds the query one character at a time;
+      every key press re-runs the (millisecond) index query
+    - Results are shown via MenuManager.show_list(); playback is queued by
+      LibraryManager.queue_and_play() and confirmed in this manager's own
+      list, so Back returns to the results
+    """
+
+    RESULT_LIMIT = 40
+
+    def __init__(self, display_manager, volumio_listener, mode_manager, menu_controller=None):
+        super().__init__(display_manager, volumio_listener, mode_manager)
+
+        self.logger = logging.getLogger(self.__class__.__name__)
+        self.logger.setLevel(logging.INFO)
+
+        self.is_active = False
+        self.query = ""
+        self.results: List[Dict] = []
+        self.view = "keys"                   # "keys" | "results" | "artist" | "playing"
+        self.artist: Optional[str] = None
+        self._play_return = "results"        # view Back goes to from "playing"
+
+        self.menu_controller = menu_controller or \
+                               getattr(self.mode_manager, "menu_manager", None) or \
+                               getattr(self.mode_manager, "menu_controller", None)
+
+    # ---------------- lifecycle ----------------
+
+    def start_mode(self):
+        if self.is_active:
+            return
+        self.is_active = True
+        self.query = ""
+        self.results = []
+        self.artist = None
+        self._show_keys()
+
+    def stop_mode(self):
+        if not self.is_active:
+            return
+        self.is_active = False
+        try:
+            self.display_manager.clear_screen()
+        except Exception:
+            pass
+
+    # ---------------- query ----------------
+
+    def set_query(self, text: str):
+        """Replace the query (e.g. typed from a remote) and refresh results."""
+        self.query = (text or "")[:40]
+        self._run_query()
+        if self.is_active:
+            self._show_keys()
+
+    def _run_query(self):
+        index = get_library_index()
+        if index is None or not self.query.strip():
+            self.results = []
+            return
+        try:
+            self.results = index.search(self.query, limit=self.RESULT_LIMIT)
+        except Exception as e:
+            self.logger.warning(f"Search failed for '{self.query}': {e}")
+            self.results = []
+
+    # ---------------- lists ----------------
+
+    def _key_rows(self) -> List[Dict]:
+        rows = []
+        if self.query:
+            n = len(self.results)
+            label = f"Show {n}{'+' if n >= self.RESULT_LIMIT else ''} result{'s' if n != 1 else ''}"
+            rows.append({"title": label if n else "No matches", "type": "results" if n else "info"})
+            rows.append({"title": "Delete", "type": "delete"})
+        rows.extend({"title": "Space" if k == " " else k, "type": "key", "char": k} for k in KEYS)
+        rows.append({"title": "Back", "type": "back"})
+        return rows
+
+    def _show_keys(self, focus_char: Optional[str] = None):
+        self.view = "keys"
+        rows = self._key_rows()
+        index = 0
+        if focus_char is not None:
+            index = next((i for i, r in enumerate(rows) if r.get("char") == focus_char), 0)
+        if get_library_index() is None:
+            rows = [{"title": "Search index disabled", "type": "info"}, {"title": "Back", "type": "back"}]
+            index = 0
+        self._show_list(f"Search: {self.query}_", rows, index=index)
+
+    def _result_row(self, r: Dict) -> Dict:
+        kind = r.get("kind")
+        title = r.get("title") or "Untitled"
+        if kind == "album" and r.get("artist"):
+            title = f"{title} - {r['artist']}"
+        elif kind == "track" and r.get("artist"):
+            title = f"{title} - {r['artist']}"
+        return {**r, "title": f"{KIND_LABELS.get(kind, '')}: {title}", "name": r.get("title"),
+                "type": kind or "info"}
+
+    def _show_results(self):
+        self.view = "results"
+        rows = [self._result_row(r) for r in self.results]
+        rows.append({"title": "Back", "type": "back"})
+        self._show_list(f"'{self.query.strip()}'", rows)
+
+    def _show_artist(self, artist: str):
+        self.view = "artist"
+        self.artist = artist
+        index = get_library_index()
+        albums = index.albums_by(artist) if index else []
+        rows = [{**a, "name": a.get("title"), "type": "album"} for a in albums]
+        if not rows:
+            rows.append({"title": "No albums indexed yet", "type": "info"})
+        rows.append({"title": "Back", "type": "back"})
+        self._show_list(artist, rows)
+
+    def _show_list(self, title: str, rows: List[Dict], index: int = 0):
+        if not self.menu_controller:
+            self.logger.warning("Menu controller not available; cannot render list.")
+            return
+        self.menu_controller.show_list(
+            title=title,
+            items=rows,
+            on_select=self._on_list_select,
+            on_back=self.back,
+            index=index,
+        )
+
+    # ---------------- selection/back from MenuManager ----------------
+
+    def _on_list_select(self, item: Dict):
+        typ = (item.get("type") or "").lower()
+
+        if typ == "key":
+            self.query += item.get("char", "")
+            self._run_query()
+            self._show_keys(focus_char=item.get("char"))
+            return
+        if typ == "delete":
+            self.query = self.query[:-1]
+            self._run_query()
+            self._show_keys()
+            return
+        if typ == "results":
+            self._show_results()
+            return
+        if typ == "artist":
+            self._show_artist(item.get("name") or item.get("artist") or "")
+            return
+        if typ in ("album", "track"):
+            self._play(item)
+            return
+
+    def _play(self, item: Dict):
+        library = getattr(self.mode_manager, "library_manager", None)
+        if library is None:
+            self.logger.warning("No LibraryManager; cannot play search result.")
+            return
+        row = {**item, "title": item.get("name") or item.get("title")}
+        self.logger.info(f"Search: playing {item.get('type')} '{row['title']}' ({row.get('uri')})")
+        if self.view != "playing":
+            self._play_return = self.view
+        self._show_playing(f"Starting: {row['title']}")
+        threading.Thread(target=self._play_worker, args=(library, row), daemon=True).start()
+
+    def _play_worker(self, library, row: Dict):
+        try:
+            library.queue_and_play(row, folder=row.get("type") != "track")
+            status = f"Playing: {row['title']}"
+        except Exception as e:
+            self.logger.warning(f"Search: playback failed for {row.get('uri')}: {e}")
+            status = f"Playback failed: {e}"
+        # Only if the user is still looking at the confirmation
+        if self.is_active and self.view == "playing":
+            self._show_playing(status)
+
+    def _show_playing(self, status: str):
+        self.view = "playing"
+        self._show_list(f"'{self.query.strip()}'", [
+            {"title": status, "type": "info"},
+            {"title": "Back", "type": "back"},
+        ])
+
+    def back(self):
+        if self.view == "playing":
+            if self._play_return == "artist" and self.artist:
+                self._show_artist(self.artist)
+            else:
+                self._show_results()
+        elif self.view == "artist":
+            self._show_results()
+        elif self.view == "results":
+            self._show_keys()
+        else:
+            self.stop_mode()
+            self.mode_manager.back()
+
+    # --- Legacy input adapters (match LibraryManager) ---
+
+    def scroll_selection(self, direction: int):
+        if not self.is_active or not self.menu_controller:
+            return
+        try:
+            self.menu_controller.scroll_list(direction)
+        except Exception:
+            self.logger.exception("scroll_list failed")
+
+    def select_item(self):
+        if not self.is_active or not self.menu_controller:
+            return
+        try:
+            self.menu_controller.select_current_in_list()
+        except Exception:
+            self.logger.exception("select_current_in_list failed")
+
+    def display_menu(self):
+        """Legacy no-op: all drawing is centralised in MenuManager now."""
+        pass
@@ -2,9 +2,10 @@
 
 import logging
 import threading
-from typing import Optional, List, Dict, Any
+from typing import Optional
 
 from managers.base_manager import BaseManager
+from managers.list_source import ListSource, LazyListSource
 
 class StreamingManager(BaseManager):
     """
@@ -139,39 +140,38 @@ class StreamingManager(BaseManager):
 
     def _update_menu_from_navigation(self, navigation):
         lists = (navigation or {}).get("lists") or []
-        combined = []
-        for lst in lists:
-            combined.extend(lst.get("items") or [])
+        chunks = [lst.get("items") or [] for lst in lists]
 
-        if not combined:
+        if not any(chunks):
             self._show_empty_list()
             return
 
-        # Normalise rows and add a Back row
-        self.current_menu_items = self._normalise_items(combined)
-        self.current_menu_items.append({"title": "Back", "uri": None, "type": "back"})
+        # Rows are normalised lazily as they scroll into view; Back goes last
+        self.current_menu_items = LazyListSource(
+            chunks,
+            normalise=self._normalise_item,
+            tail=[{"title": "Back", "uri": None, "type": "back"}],
+        )
 
         self._show_list(self.current_menu_items)
 
-    def _normalise_items(self, items):
-        norm = []
-        for it in items:
-            title = it.get("title") or it.get("album") or it.get("name") or "Untitled"
-            uri = it.get("uri")
-            typ = (it.get("type") or "").lower()
-
-            # Heuristic: Volumio sometimes uses /play or track URIs without type
-            if not typ and uri:
-                if uri.endswith("/play") or "/song/" in uri:
-                    typ = "song"
-
-            norm.append({
-                "title": title,
-                "uri": uri,
-                "type": typ,
-                **it,
-            })
-        return norm
+    @staticmethod
+    def _normalise_item(it):
+        title = it.get("title") or it.get("album") or it.get("name") or "Untitled"
+        uri = it.get("uri")
+        typ = (it.get("type") or "").lower()
+
+        # Heuristic: Volumio sometimes uses /play or track URIs without type
+        if not typ and uri:
+            if uri.endswith("/play") or "/song/" in uri:
+                typ = "song"
+
+        return {
+            "title": title,
+            "uri": uri,
+            "type": typ,
+            **it,
+        }
 
     # ---------------- selection/back from MenuManager ----------------
 
@@ -276,13 +276,16 @@ class StreamingManager(BaseManager):
 
     # ---------------- MenuManager integration (all UI goes here) ----------------
 
-    def _show_list(self, items: List[Dict[str, Any]]):
-        """Render a list via the central MenuManager."""
+    def _show_list(self, items):
+        """Render a list (plain rows or a ListSource) via the central MenuManager."""
         if not self.menu_controller:
             self.logger.warning("Menu controller not available; cannot render list.")
             return
-        # Ensure each item has a display label
-        normalised = [{"title": it.get("title") or it.get("label") or "Untitled", **it} for it in items]
+        if isinstance(items, ListSource):
+            normalised = items
+        else:
+            # Ensure each item has a display label
+            normalised = [{"title": it.get("title") or it.get("label") or "Untitled", **it} for it in items]
         self.menu_controller.show_list(
             title=self.service_name.title(),
             items=normalised,
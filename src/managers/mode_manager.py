@@ -5,7 +5,22 @@ import threading
 import time
 import subprocess
 from transitions import Machine
+from network.event_bus import QUEUED
 from .menus.streaming_manager import StreamingManager
+from .screen_registry import ScreenRegistry
+
+
+# Registry names stop_all_screens() checks, in order
+MENU_MANAGERS = ("screensaver_menu", "menu_manager", "config_menu", "clock_menu",
+                 "library_manager", "streaming_manager", "radio_manager", "search_manager")
+PLAYBACK_SCREENS = ("original_screen", "modern_screen", "minimal_screen", "vu_screen",
+                    "digitalvu_screen", "webradio_screen", "airplay_screen")
+
+
+def _registered(name):
+    """ModeManager attribute backed by the screen registry (built on first read)."""
+    return property(lambda self: self.screens.get(name),
+                    lambda self, value: self.screens.set(name, value))
 
 
 class ModeManager:
@@ -17,6 +32,25 @@ class ModeManager:
       - Possibly a 'boot' or 'systeminfo' state if desired
     """
 
+    # Managers and screens, built on first use (see ScreenRegistry)
+    menu_manager = _registered("menu_manager")
+    config_menu = _registered("config_menu")
+    clock_menu = _registered("clock_menu")
+    screensaver_menu = _registered("screensaver_menu")
+    system_update_menu = _registered("system_update_menu")
+    library_manager = _registered("library_manager")
+    streaming_manager = _registered("streaming_manager")
+    radio_manager = _registered("radio_manager")
+    search_manager = _registered("search_manager")
+    original_screen = _registered("original_screen")
+    modern_screen = _registered("modern_screen")
+    minimal_screen = _registered("minimal_screen")
+    vu_screen = _registered("vu_screen")
+    digitalvu_screen = _registered("digitalvu_screen")
+    webradio_screen = _registered("webradio_screen")
+    airplay_screen = _registered("airplay_screen")
+    screensaver = _registered("screensaver")
+
     states = [
         {'name': 'boot',            'on_enter': 'enter_boot'},
         {'name': 'clock',           'on_enter': 'enter_clock'},
@@ -50,16 +84,19 @@ class ModeManager:
         {'name': 'favourites',      'on_enter': 'enter_favourites'},
         {'name': 'last100',         'on_enter': 'enter_last100'},
         {'name': 'mediaservers',    'on_enter': 'enter_mediaservers'},
+        {'name': 'search',          'on_enter': 'enter_search'},
     ]
 
     def __init__(self, display_manager, clock, volumio_listener,
-                 preference_file_path="../preference.json", config=None):
+                 preference_file_path="../preference.json", config=None, event_bus=None):
         """
         :param display_manager:   Manages the OLED display
         :param clock:             Clock instance
         :param volumio_listener:  Object that fires state_changed signals from Volumio
         :param preference_file_path: JSON file to store user preferences
         :param config:            Combined config loaded from YAML, etc.
+        :param event_bus:         Optional EventBus bridged to the listener; state changes
+                                  are then handled off the socket thread, in order
         """
         self.logger = logging.getLogger(self.__class__.__name__)
         self.logger.setLevel(logging.DEBUG)
@@ -69,6 +106,7 @@ class ModeManager:
         self.clock = clock
         self.volumio_listener = volumio_listener
         self.config = config or {}
+        self.event_bus = event_bus
 
         # Navigation history stack
         self.mode_stack = []
@@ -87,23 +125,9 @@ class ModeManager:
         ):
             self.config[key] = preferences[key]
 
-        # References to other managers/screens (set via ManagerFactory or manually)
-        self.menu_manager = None
-        self.config_menu = None
-        self.library_manager = None
-        self.streaming_manager = None
-        self.original_screen = None
-        self.modern_screen = None
-        self.minimal_screen = None
-        self.webradio_screen = None
-        self.airplay_screen = None
-        self.vu_screen = None
-        self.digitalvu_screen = None
-        self.screensaver = None
-        self.screensaver_menu = None
-        self.clock_menu = None
-        self.system_update_menu = None
-        self.radio_manager = None
+        # Managers/screens: ManagerFactory registers factories and they are built
+        # on first use (the attributes below read through the registry)
+        self.screens = ScreenRegistry()
 
         # Idle/Screensaver logic
         self.idle_timer = None
@@ -121,16 +145,29 @@ class ModeManager:
 
         self.logger.debug(f"ModeManager: idle_timeout={self.idle_timeout}, display_mode={self.config.get('display_mode')}")
 
+        # Mode transition timing (before/after_state_change hooks)
+        self._transition_started_at = None
+        self.last_transition_ms = None
+
         # Set up the state machine
         self.machine = Machine(
             model=self,
             states=ModeManager.states,
             initial='clock',
-            send_event=True
+            send_event=True,
+            before_state_change='_transition_started',
+            after_state_change='_transition_finished',
         )
         self._define_transitions()
 
-        if self.volumio_listener is not None:
+        if event_bus is not None:
+            event_bus.subscribe(
+                "volumio.state",
+                lambda state: self.process_state_change(self.volumio_listener, state),
+                mode=QUEUED, name="ModeManager.process_state_change"
+            )
+            self.logger.debug("ModeManager: Subscribed to volumio.state on the event bus.")
+        elif self.volumio_listener is not None:
             self.volumio_listener.state_changed.connect(self.process_state_change)
             self.logger.debug("ModeManager: Connected to volumio_listener.state_changed signal.")
         else:
@@ -234,6 +271,9 @@ class ModeManager:
     def set_library_manager(self, library_manager):
         self.library_manager = library_manager
 
+    def set_search_manager(self, search_manager):
+        self.search_manager = search_manager
+
     def set_streaming_manager(self, streaming_manager):
         self.streaming_manager = streaming_manager
 
@@ -351,6 +391,7 @@ class ModeManager:
         self.machine.add_transition('to_last100',       source='*', dest='last100', before='push_current_state')
         self.machine.add_transition('to_mediaservers',  source='*', dest='mediaservers', before='push_current_state')
         self.machine.add_transition('to_playlists',    source='*', dest='playlists', before='push_current_state')
+        self.machine.add_transition('to_search',       source='*', dest='search', before='push_current_state')
 
     # --- Custom trigger() Method ---
     def trigger(self, event_name, **kwargs):
@@ -369,43 +410,40 @@ class ModeManager:
     def get_mode(self):
         return self.state
 
+    def _transition_started(self, event):
+        self._transition_started_at = time.perf_counter()
+
+    def _transition_finished(self, event):
+        # Covers stop/suspend of the old screen and the new screen's first frame
+        if self._transition_started_at is None:
+            return
+        self.last_transition_ms = (time.perf_counter() - self._transition_started_at) * 1000
+        self._transition_started_at = None
+        self.logger.info(f"ModeManager: {event.transition.source} -> {event.transition.dest} "
+                         f"in {self.last_transition_ms:.1f} ms")
+
     def stop_all_screens(self):
         self.logger.debug("ModeManager: stop_all_screens called.")
         if self.clock:
-            self.clock.stop()
-        if self.screensaver:
-            self.screensaver.stop_screensaver()
-        if self.screensaver_menu and self.screensaver_menu.is_active:
-            self.screensaver_menu.stop_mode()
-        if self.menu_manager and self.menu_manager.is_active:
-            self.menu_manager.stop_mode()
-        if self.config_menu and self.config_menu.is_active:
-            self.config_menu.stop_mode()
-        if self.clock_menu and self.clock_menu.is_active:
-            self.clock_menu.stop_mode()
-        if self.library_manager and self.library_manager.is_active:
-            self.library_manager.stop_mode()
-        if self.streaming_manager and self.streaming_manager.is_active:
-            self.streaming_manager.stop_mode()
-        if self.radio_manager and self.radio_manager.is_active:
-            self.radio_manager.stop_mode()
-
-        if self.original_screen and self.original_screen.is_active:
-            self.original_screen.stop_mode()
-        if self.modern_screen and self.modern_screen.is_active:
-            self.modern_screen.stop_mode()
-        if self.minimal_screen and self.minimal_screen.is_active:
-            self.minimal_screen.stop_mode()
-        if self.vu_screen and self.vu_screen.is_active:
-            self.vu_screen.stop_mode()
-        if self.digitalvu_screen and self.digitalvu_screen.is_active:
-            self.digitalvu_screen.stop_mode()
-        if self.webradio_screen and self.webradio_screen.is_active:
-            self.webradio_screen.stop_mode()
-        if self.airplay_screen and self.airplay_screen.is_active:
-            self.airplay_screen.stop_mode()
-        if self.system_update_menu and self.system_update_menu.is_active:
-            self.system_update_menu.stop_mode()
+            self.clock.stop(clear=False)  # playback/menu screens draw over it; see enter_screensaver
+        # Only screens that have been built can be showing anything (peek, don't build)
+        screensaver = self.screens.peek("screensaver")
+        if screensaver:
+            screensaver.stop_screensaver()
+        for name in MENU_MANAGERS:
+            manager = self.screens.peek(name)
+            if manager and manager.is_active:
+                manager.stop_mode()
+
+        # Playback screens are suspended, not stopped: threads park and state
+        # stays warm, so coming back is a single frame (see screens/suspendable.py)
+        for name in PLAYBACK_SCREENS:
+            screen = self.screens.peek(name)
+            if screen and screen.is_active:
+                getattr(screen, "suspend_mode", screen.stop_mode)()
+        system_update_menu = self.screens.peek("system_update_menu")
+        if system_update_menu and system_update_menu.is_active:
+            system_update_menu.stop_mode()
             
     def start_menu_inactivity_timer(self):
         if self.get_mode() in ["library", "tidal", "qobuz", "spotify"]:
@@ -458,7 +496,7 @@ class ModeManager:
         self.logger.info("ModeManager: Entering 'modern' playback mode.")
         self.stop_all_screens()
         if self.modern_screen:
-            self.modern_screen.start_mode()
+            self.modern_screen.resume_mode()
             self.logger.info("ModeManager: Modern screen started.")
         else:
             self.logger.warning("ModeManager: No modern_screen set.")
@@ -469,7 +507,7 @@ class ModeManager:
         self.logger.info("ModeManager: Entering 'minimal' playback mode.")
         self.stop_all_screens()
         if self.minimal_screen:
-            self.minimal_screen.start_mode()
+            self.minimal_screen.resume_mode()
             self.logger.info("ModeManager: Minimal screen started.")
         else:
             self.logger.warning("ModeManager: No minimal_screen set.")
@@ -480,7 +518,7 @@ class ModeManager:
         self.logger.info("ModeManager: Entering 'original' playback mode.")
         self.stop_all_screens()
         if self.original_screen:
-            self.original_screen.start_mode()
+            self.original_screen.resume_mode()
             self.logger.info("ModeManager: Original screen started.")
         else:
             self.logger.warning("ModeManager: No original_screen set.")
@@ -491,7 +529,7 @@ class ModeManager:
         self.logger.info("ModeManager: Entering 'vuscreen' playback mode.")
         self.stop_all_screens()
         if self.vu_screen:
-            self.vu_screen.start_mode()
+            self.vu_screen.resume_mode()
             self.logger.info("ModeManager: VU screen started.")
         else:
             self.logger.warning("ModeManager: No vu_screen set.")
@@ -502,7 +540,7 @@ class ModeManager:
         self.logger.info("ModeManager: Entering 'digitalvuscreen' playback mode.")
         self.stop_all_screens()
         if self.digitalvu_screen:
-            self.digitalvu_screen.start_mode()
+            self.digitalvu_screen.resume_mode()
             self.logger.info("ModeManager: DigitalVU screen started.")
         else:
             self.logger.warning("ModeManager: No digitalvu_screen set.")
@@ -532,6 +570,9 @@ class ModeManager:
     def enter_screensaver(self, event):
         self.logger.info("ModeManager: Entering 'screensaver' state.")
         self.stop_all_screens()
+        # The generic saver ("none") draws nothing: blank the panel rather than
+        # leave the last clock frame burning in
+        self.display_manager.clear_screen()
         if self.screensaver:
             self.screensaver.start_screensaver()
             self.logger.info("ModeManager: Screensaver started.")
@@ -601,7 +642,7 @@ class ModeManager:
 
         # If we’re re-entering streaming, clean up the old instance
         try:
-            if getattr(self, "streaming_manager", None):
+            if self.screens.peek("streaming_manager"):
                 self.streaming_manager.stop_mode()
         except Exception:
             self.logger.exception("Stopping previous StreamingManager failed (safe to ignore)")
@@ -633,6 +674,17 @@ class ModeManager:
         self.reset_idle_timer()
         self.update_current_mode()
 
+    def enter_search(self, event):
+        self.logger.info("ModeManager: Entering 'search' state.")
+        self.stop_all_screens()
+        if self.search_manager:
+            self.search_manager.start_mode()
+            self.logger.info("ModeManager: SearchManager started.")
+        else:
+            self.logger.warning("ModeManager: No search_manager set.")
+        self.reset_idle_timer()
+        self.update_current_mode()
+
     def enter_radio(self, event):
         self.logger.info("ModeManager: Entering 'radio' state.")
         self.stop_all_screens()
@@ -648,7 +700,7 @@ class ModeManager:
         self.logger.info("ModeManager: Entering 'webradio' state.")
         self.stop_all_screens()
         if self.webradio_screen:
-            self.webradio_screen.start_mode()
+            self.webradio_screen.resume_mode()
             self.logger.info("ModeManager: WebRadioScreen started.")
         else:
             self.logger.warning("ModeManager: No webradio_screen set.")
@@ -754,7 +806,7 @@ class ModeManager:
 
         # Clean up any previous streaming manager
         try:
-            if getattr(self, "streaming_manager", None):
+            if self.screens.peek("streaming_manager"):
                 self.streaming_manager.stop_mode()
         except Exception:
             self.logger.exception("Stopping previous StreamingManager failed (safe to ignore)")
@@ -915,6 +967,9 @@ class ModeManager:
             self.pause_stop_timer = None
 
     def update_current_mode(self):
+        # Pushed to the IR listener over the command socket; the file stays for other readers
+        if self.event_bus is not None:
+            self.event_bus.publish("ui.mode", self.get_mode())
         try:
             with open("/tmp/quadify_mode", "w") as f:
                 f.write(self.get_mode())
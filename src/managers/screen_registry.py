@@ -0,0 +1,105 @@
+# src/managers/screen_registry.py
+#
+# Lazily built screens, screensavers and menu managers.
+#
+# ManagerFactory registers a factory per name instead of constructing
+# everything at boot; ModeManager's screen attributes read through get(), so
+# the first mode that needs a screen imports and builds it (fonts, PNGs,
+# threads) and later uses get the same instance. peek() looks without
+# building, for code that only cares about screens that already exist
+# (stop_all_screens). warm_up() builds a few names in the background once
+# the UI is up, so the configured default display mode is ready before the
+# first track plays. A factory that raises is remembered: get() returns None
+# without retrying until RETRY_FAILED_AFTER has passed, so a broken screen
+# costs one build attempt (and one traceback) rather than one per access.
+
+import logging
+import threading
+import time
+from typing import Callable, Dict, Iterable
+
+
+class ScreenRegistry:
+    RETRY_FAILED_AFTER = 60.0   # seconds before a failed factory is tried again
+
+    def __init__(self):
+        self.logger = logging.getLogger(self.__class__.__name__)
+        self.logger.setLevel(logging.INFO)
+
+        self._factories: Dict[str, Callable[[], object]] = {}
+        self._instances: Dict[str, object] = {}
+        self._locks: Dict[str, threading.Lock] = {}
+        self._lock = threading.Lock()
+        self.build_ms: Dict[str, float] = {}
+        self._failed: Dict[str, float] = {}      # name -> time.monotonic() of the failed build
+
+    def register(self, name: str, factory: Callable[[], object]):
+        with self._lock:
+            self._factories[name] = factory
+            self._failed.pop(name, None)
+            self._locks.setdefault(name, threading.Lock())
+
+    def set(self, name: str, instance):
+        """Replace (or with None, forget) the instance; the factory stays."""
+        with self._lock:
+            if instance is None:
+                self._instances.pop(name, None)
+            else:
+                self._instances[name] = instance
+                self._failed.pop(name, None)
+            self._locks.setdefault(name, threading.Lock())
+
+    def peek(self, name: str):
+        return self._instances.get(name)
+
+    def get(self, name: str):
+        instance = self._instances.get(name)
+        if instance is not None:
+            return instance
+        with self._lock:
+            factory = self._factories.get(name)
+            build_lock = self._locks.setdefault(name, threading.Lock())
+        if factory is None:
+            return None
+        failed_at = self._failed.get(name)
+        if failed_at is not None and time.monotonic() - failed_at < self.RETRY_FAILED_AFTER:
+            return None
+        # Per-name lock: a slow build never holds up a different screen
+        with build_lock:
+            instance = self._instances.get(name)
+            if instance is None:
+                if self._failed.get(name, failed_at) != failed_at:
+                    return None   # another thread just failed it
+                started = time.perf_counter()
+                try:
+                    instance = factory()
+                except Exception:
+                    self.logger.exception(f"ScreenRegistry: building '{name}' failed; "
+                                          f"not retrying for {self.RETRY_FAILED_AFTER:.0f} s")
+                    with self._lock:
+                        self._failed[name] = time.monotonic()
+                    return None
+                with self._lock:
+                    self._failed.pop(name, None)
+                self.build_ms[name] = (time.perf_counter() - started) * 1000
+                self.logger.info(f"ScreenRegistry: built '{name}' in {self.build_ms[name]:.0f} ms")
+                with self._lock:
+                    self._instances[name] = instance
+        return instance
+
+    def built(self) -> Dict[str, object]:
+        with self._lock:
+            return dict(self._instances)
+
+    def warm_up(self, names: Iterable[str], delay: float = 0.0):
+        """Build `names` on a background thread (after `delay` seconds)."""
+        names = [n for n in names if n]
+
+        def run():
+            if delay > 0:
+                time.sleep(delay)
+            for name in names:
+                self.get(name)
+
+        if names:
+            threading.Thread(target=run, name="ScreenWarmUp", daemon=True).start()
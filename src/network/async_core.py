@@ -0,0 +1,262 @@
+# src/network/async_core.py
+#
+# Optional asyncio network core for Volumio I/O.
+#
+# One event-loop thread owns an aiohttp session (keep-alive, bounded
+# connection pool) and, optionally, an async socket.io client. UI code never
+# touches the loop directly: every call returns a concurrent.futures.Future
+# that can be waited on with a timeout, cancelled, or chained with when_done().
+#
+# Enabled with `volumio: async_core: true` in config.yaml. Needs aiohttp;
+# when it is missing get_network_core() returns None and callers keep using
+# their threaded/requests code paths.
+
+import asyncio
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Optional
+
+try:
+    import aiohttp
+except ImportError:  # optional dependency
+    aiohttp = None
+
+try:
+    import socketio
+except ImportError:
+    socketio = None
+
+logger = logging.getLogger(__name__)
+
+_core = None
+_core_lock = threading.Lock()
+
+
+def is_available() -> bool:
+    return aiohttp is not None
+
+
+def get_network_core():
+    """Return the running AsyncNetworkCore, or None when it is not enabled."""
+    return _core
+
+
+def start_network_core(**kwargs):
+    """Create and start the process-wide core (idempotent). Returns None if aiohttp is missing."""
+    global _core
+    with _core_lock:
+        if _core is not None:
+            return _core
+        if not is_available():
+            logger.warning("aiohttp not installed; asyncio network core disabled.")
+            return None
+        core = AsyncNetworkCore(**kwargs)
+        core.start()
+        _core = core
+        return _core
+
+
+def stop_network_core():
+    global _core
+    with _core_lock:
+        if _core is not None:
+            _core.stop()
+            _core = None
+
+
+class AsyncNetworkCore:
+    """
+    Event loop + aiohttp session in a single daemon thread.
+
+    Blocking callbacks (signal handlers, UI updates, reconnect attempts) are
+    run on a small bounded worker pool so they can never stall the loop.
+    """
+
+    def __init__(self, max_connections=8, workers=2, name="NetworkCore"):
+        self.max_connections = max_connections
+        self.name = name
+        self.loop = asyncio.new_event_loop()
+        self.workers = ThreadPoolExecutor(max_workers=workers, thread_name_prefix=f"{name}Worker")
+        self._session = None
+        self._thread = None
+        self._ready = threading.Event()
+
+    # ------------------------------------------------------------------
+    #   Lifecycle
+    # ------------------------------------------------------------------
+    def start(self, timeout=5.0):
+        if self._thread and self._thread.is_alive():
+            return
+        self._thread = threading.Thread(target=self._run, name=self.name, daemon=True)
+        self._thread.start()
+        if not self._ready.wait(timeout):
+            raise RuntimeError("AsyncNetworkCore did not start in time")
+        logger.info("AsyncNetworkCore started.")
+
+    def _run(self):
+        asyncio.set_event_loop(self.loop)
+        self.loop.run_until_complete(self._open_session())
+        self._ready.set()
+        try:
+            self.loop.run_forever()
+        finally:
+            self.loop.run_until_complete(self._close_session())
+            self.loop.close()
+
+    async def _open_session(self):
+        connector = aiohttp.TCPConnector(limit=self.max_connections, keepalive_timeout=30)
+        self._session = aiohttp.ClientSession(connector=connector)
+
+    async def _close_session(self):
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+
+    def stop(self):
+        if not self._thread:
+            return
+        self.loop.call_soon_threadsafe(self.loop.stop)
+        self._thread.join(timeout=2)
+        self.workers.shutdown(wait=False)
+        self._thread = None
+        logger.info("AsyncNetworkCore stopped.")
+
+    def is_loop_thread(self) -> bool:
+        return threading.current_thread() is self._thread
+
+    # ------------------------------------------------------------------
+    #   Scheduling helpers (thread-safe)
+    # ------------------------------------------------------------------
+    def submit(self, coro):
+        """Schedule a coroutine on the loop; returns a concurrent.futures.Future."""
+        return asyncio.run_coroutine_threadsafe(coro, self.loop)
+
+    def run_blocking(self, fn: Callable, *args):
+        """Run a blocking callable on the worker pool."""
+        return self.workers.submit(fn, *args)
+
+    def call_later(self, delay: float, fn: Callable, *args):
+        """Run fn(*args) on the worker pool after `delay` seconds. Returns a cancellable handle."""
+        holder = {}
+
+        def _schedule():
+            holder["handle"] = self.loop.call_later(delay, self.workers.submit, fn, *args)
+
+        self.loop.call_soon_threadsafe(_schedule)
+        return _CallLaterHandle(self, holder)
+
+    def when_done(self, future, fn: Callable):
+        """Call fn(future) on the worker pool once `future` completes (never on the loop thread)."""
+        future.add_done_callback(lambda fut: self.workers.submit(fn, fut))
+        return future
+
+    # ------------------------------------------------------------------
+    #   HTTP (keep-alive, explicit timeouts)
+    # ------------------------------------------------------------------
+    async def _request_json(self, method, url, params=None, payload=None, timeout=6.0, retries=1, retry_delay=0.8):
+        last_err = None
+        for attempt in range(max(1, retries)):
+            try:
+                async with self._session.request(
+                    method, url, params=params, json=payload,
+                    timeout=aiohttp.ClientTimeout(total=timeout)
+                ) as resp:
+                    resp.raise_for_status()
+                    if resp.content_type == "application/json":
+                        return await resp.json()
+                    text = await resp.text()
+                    return {"status": resp.status, "text": text}
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                last_err = e
+                if attempt < retries - 1:
+                    await asyncio.sleep(retry_delay)
+        raise last_err
+
+    async def _request_bytes(self, url, headers=None, timeout=6.0):
+        async with self._session.get(url, headers=headers or {},
+                                     timeout=aiohttp.ClientTimeout(total=timeout)) as resp:
+            body = await resp.read() if resp.status != 304 else b""
+            return resp.status, dict(resp.headers), body
+
+    def get_json(self, url, params: Optional[Dict[str, Any]] = None, timeout=6.0, retries=1, retry_delay=0.8):
+        return self.submit(self._request_json("GET", url, params=params, timeout=timeout,
+                                              retries=retries, retry_delay=retry_delay))
+
+    def post_json(self, url, payload: Any, timeout=6.0):
+        return self.submit(self._request_json("POST", url, payload=payload, timeout=timeout))
+
+    def get_bytes(self, url, headers: Optional[Dict[str, str]] = None, timeout=6.0):
+        """Future resolving to (status, headers, body); status 304 yields an empty body."""
+        return self.submit(self._request_bytes(url, headers=headers, timeout=timeout))
+
+    # ------------------------------------------------------------------
+    #   socket.io
+    # ------------------------------------------------------------------
+    def socketio_client(self, **kwargs):
+        if socketio is None:
+            raise RuntimeError("python-socketio is not installed")
+        return ThreadSafeSocketIO(self, **kwargs)
+
+
+class _CallLaterHandle:
+    def __init__(self, core, holder):
+        self._core = core
+        self._holder = holder
+
+    def cancel(self):
+        def _cancel():
+            handle = self._holder.get("handle")
+            if handle:
+                handle.cancel()
+        self._core.loop.call_soon_threadsafe(_cancel)
+
+
+class ThreadSafeSocketIO:
+    """
+    socketio.AsyncClient running on the core's loop, with the subset of the
+    threaded socketio.Client API VolumioListener uses (on, emit, connect,
+    disconnect, connected). Event handlers are delivered, in order, on one
+    dispatch thread so slow handlers cannot block the loop.
+    """
+
+    def __init__(self, core: AsyncNetworkCore, **kwargs):
+        self.core = core
+        kwargs.setdefault("logger", False)
+        kwargs.setdefault("engineio_logger", False)
+        self._client = core.submit(self._create(kwargs)).result(timeout=5)
+        self._dispatch = ThreadPoolExecutor(max_workers=1, thread_name_prefix="SocketIODispatch")
+
+    @staticmethod
+    async def _create(kwargs):
+        # AsyncClient must be created on the loop that will drive it
+        return socketio.AsyncClient(**kwargs)
+
+    @property
+    def connected(self) -> bool:
+        return bool(self._client.connected)
+
+    def on(self, event, handler):
+        dispatch = self._dispatch
+
+        async def _deliver(*args):
+            dispatch.submit(handler, *args)
+
+        self._client.on(event, _deliver)
+
+    def emit(self, event, data=None):
+        """Fire-and-forget emit; returns a Future the caller may wait on."""
+        if data is None:
+            return self.core.submit(self._client.emit(event))
+        return self.core.submit(self._client.emit(event, data))
+
+    def connect(self, url, timeout=10.0):
+        self.core.submit(self._client.connect(url)).result(timeout=timeout)
+
+    def disconnect(self, timeout=5.0):
+        try:
+            self.core.submit(self._client.disconnect()).result(timeout=timeout)
+        finally:
+            self._dispatch.shutdown(wait=False)
@@ -0,0 +1,342 @@
+# src/network/command_server.py
+#
+# Local command socket (/tmp/quadify.sock) used by the IR listener, helper
+# processes and scripts/quadify_ctl.py.
+#
+# Every message is one newline-terminated UTF-8 line on a persistent
+# AF_UNIX stream; a connection carries any number of commands. Two framings
+# are accepted per line:
+#
+# Protocol 1 (NDJSON, preferred):
+#   -> {"v": 1, "id": 7, "cmd": "scroll", "args": {"delta": -3}}
+#   <- {"v": 1, "id": 7, "ok": true, "ms": 0.41, "result": null}
+#   <- {"v": 1, "id": 8, "ok": false, "ms": 0.02, "error": "unknown command: foo"}
+#   -> {"v": 1, "id": 9, "batch": [{"cmd": "scroll_down"}, {"cmd": "select"}]}
+#   <- {"v": 1, "id": 9, "ok": true, "ms": 1.3, "results": [{...}, {...}]}
+#   -> {"v": 1, "cmd": "subscribe", "args": {"topic": "mode"}}
+#   <- {"v": 1, "event": "mode", "mode": "library"}            (pushed)
+#
+#   Built in: hello (protocol version + command list), ping, subscribe.
+#   Everything else comes from the handler registry (set_handlers), e.g.
+#   "query" for the current mode / player state.
+#
+# Protocol 0 (plain text, kept for old clients):
+#   -> scroll_down            <- ok scroll_down | err scroll_down <why>
+#   -> subscribe mode         <- mode <name>                    (pushed)
+#   A command written without a newline followed by close also works.
+#
+# Commands from one connection are handled in order (and commands from all
+# connections one at a time), so a client can pipeline without waiting for
+# each reply.
+
+import inspect
+import json
+import logging
+import os
+import socket
+import threading
+import time
+from typing import Callable, Dict, List, Optional
+
+from controls.input_trace import tracer
+from network.event_bus import LATEST
+
+PROTOCOL_VERSION = 1
+SOCK_PATH = "/tmp/quadify.sock"
+MAX_LINE = 64 * 1024
+MAX_BATCH = 64
+
+_server = None
+
+
+def start_command_server(handlers, sock_path=SOCK_PATH, event_bus=None):
+    """
+    Start (once) and return the process-wide command server. Later calls
+    swap in a new handler registry; connected clients stay connected.
+    """
+    global _server
+    if _server is None:
+        _server = CommandServer(handlers, sock_path=sock_path, event_bus=event_bus)
+        _server.start()
+    else:
+        _server.set_handlers(handlers)
+    return _server
+
+
+def get_command_server():
+    return _server
+
+
+class CommandError(Exception):
+    """Raised by handlers to fail a command with a plain message."""
+
+
+class _Client:
+    def __init__(self, conn):
+        self.conn = conn
+        self.send_lock = threading.Lock()
+        self.subscribed = False
+        self.protocol = 0            # framing of the subscribe request (pushes match it)
+        self.push_pending = False    # send the current mode right after the subscribe reply
+
+    def send_line(self, line):
+        with self.send_lock:
+            self.conn.sendall((line + "\n").encode("utf-8"))
+
+    def send_json(self, obj):
+        self.send_line(json.dumps(obj, separators=(",", ":"), default=str))
+
+
+class CommandServer:
+    def __init__(self, handlers: Dict[str, Callable], sock_path=SOCK_PATH, event_bus=None, backlog=8):
+        """
+        handlers  - command name -> callable(**args); the return value (if
+                    JSON-serialisable) is the reply's "result"
+        event_bus - if given, "ui.mode" publications are pushed to subscribers
+        """
+        self.logger = logging.getLogger(self.__class__.__name__)
+        self.logger.setLevel(logging.INFO)
+
+        self.handlers: Dict[str, Callable] = dict(handlers or {})
+        self.sock_path = sock_path
+        self.backlog = backlog
+        self.event_bus = event_bus
+        self.mode: Optional[str] = None
+
+        self._clients: List[_Client] = []
+        self._clients_lock = threading.Lock()
+        self._handle_lock = threading.Lock()
+        self._sock = None
+        self._running = False
+
+    # ------------------------------------------------------------------
+    #   Registry
+    # ------------------------------------------------------------------
+    def set_handlers(self, handlers: Dict[str, Callable]):
+        self.handlers = dict(handlers or {})
+
+    def register(self, name: str, fn: Callable):
+        handlers = dict(self.handlers)
+        handlers[name] = fn
+        self.handlers = handlers
+
+    # ------------------------------------------------------------------
+    #   Lifecycle
+    # ------------------------------------------------------------------
+    def start(self):
+        try:
+            os.remove(self.sock_path)
+        except OSError:
+            pass
+        self._sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        self._sock.bind(self.sock_path)
+        self._sock.listen(self.backlog)
+        self._running = True
+        if self.event_bus is not None:
+            self.event_bus.subscribe("ui.mode", self.push_mode, mode=LATEST, name="CommandServer.push_mode")
+        threading.Thread(target=self._accept_loop, name="CommandServer", daemon=True).start()
+        self.logger.info(f"Quadify command server listening on {self.sock_path}")
+
+    def stop(self):
+        self._running = False
+        if self.event_bus is not None:
+            self.event_bus.unsubscribe("ui.mode", self.push_mode)
+        try:
+            self._sock.close()
+        except Exception:
+            pass
+        with self._clients_lock:
+            clients, self._clients = self._clients, []
+        for c in clients:
+            try:
+                c.conn.close()
+            except Exception:
+                pass
+
+    # ------------------------------------------------------------------
+    #   Mode push
+    # ------------------------------------------------------------------
+    def push_mode(self, mode):
+        if not mode or mode == self.mode:
+            return
+        self.mode = mode
+        with self._clients_lock:
+            subscribers = [c for c in self._clients if c.subscribed]
+        for c in subscribers:
+            self._send_mode(c)
+
+    def _send_mode(self, client: _Client):
+        try:
+            if client.protocol >= 1:
+                client.send_json({"v": PROTOCOL_VERSION, "event": "mode", "mode": self.mode})
+            else:
+                client.send_line(f"mode {self.mode}")
+        except OSError:
+            self._drop(client)
+
+    # ------------------------------------------------------------------
+    #   Connections
+    # ------------------------------------------------------------------
+    def _accept_loop(self):
+        while self._running:
+            try:
+                conn, _ = self._sock.accept()
+            except OSError:
+                if self._running:
+                    self.logger.exception("Command server accept failed")
+                return
+            client = _Client(conn)
+            with self._clients_lock:
+                self._clients.append(client)
+            threading.Thread(target=self._client_loop, args=(client,), name="CommandClient", daemon=True).start()
+
+    def _client_loop(self, client: _Client):
+        buf = b""
+        try:
+            while self._running:
+                data = client.conn.recv(4096)
+                if not data:
+                    break
+                buf += data
+                while b"\n" in buf:
+                    line, buf = buf.split(b"\n", 1)
+                    self._on_line(client, line)
+                if len(buf) > MAX_LINE:
+                    self.logger.warning("Command line too long; dropping client")
+                    buf = b""
+                    break
+            # Legacy one-shot clients: command without a newline, then close
+            if buf.strip():
+                self._on_line(client, buf, reply=False)
+        except OSError:
+            pass
+        finally:
+            self._drop(client)
+
+    def _drop(self, client: _Client):
+        with self._clients_lock:
+            if client in self._clients:
+                self._clients.remove(client)
+        try:
+            client.conn.close()
+        except Exception:
+            pass
+
+    def _on_line(self, client: _Client, raw: bytes, reply=True):
+        text = raw.decode("utf-8", errors="replace").strip()
+        if not text:
+            return
+        if text.startswith("{"):
+            response = self._handle_json(client, text)
+            if reply and response is not None:
+                self._reply(client, client.send_json, response)
+        else:
+            response = self._handle_text(client, text)
+            if reply and response is not None:
+                self._reply(client, client.send_line, response)
+        if client.push_pending:
+            client.push_pending = False
+            self._send_mode(client)
+
+    def _reply(self, client, send, response):
+        try:
+            send(response)
+        except OSError:
+            self._drop(client)
+
+    # ------------------------------------------------------------------
+    #   Protocol 1 (NDJSON)
+    # ------------------------------------------------------------------
+    def _handle_json(self, client: _Client, text: str):
+        try:
+            msg = json.loads(text)
+            if not isinstance(msg, dict):
+                raise ValueError("message must be an object")
+        except ValueError as e:
+            return {"v": PROTOCOL_VERSION, "id": None, "ok": False, "ms": 0.0, "error": f"bad message: {e}"}
+
+        req_id = msg.get("id")
+        version = msg.get("v", PROTOCOL_VERSION)
+        if version != PROTOCOL_VERSION:
+            return {"v": PROTOCOL_VERSION, "id": req_id, "ok": False, "ms": 0.0,
+                    "error": f"unsupported protocol version {version}"}
+
+        if "batch" in msg:
+            started = time.perf_counter()
+            batch = msg.get("batch") or []
+            if not isinstance(batch, list) or len(batch) > MAX_BATCH:
+                return {"v": PROTOCOL_VERSION, "id": req_id, "ok": False, "ms": 0.0,
+                        "error": f"batch must be a list of at most {MAX_BATCH} commands"}
+            results = [self._run(client, item.get("cmd"), item.get("args")) if isinstance(item, dict)
+                       else {"ok": False, "error": "batch items must be objects"} for item in batch]
+            return {"v": PROTOCOL_VERSION, "id": req_id, "ok": all(r["ok"] for r in results),
+                    "ms": round((time.perf_counter() - started) * 1000, 3), "results": results}
+
+        response = self._run(client, msg.get("cmd"), msg.get("args"), protocol=1)
+        return {"v": PROTOCOL_VERSION, "id": req_id, **response}
+
+    def _run(self, client: _Client, cmd, args, protocol=1):
+        """Run one command; returns {"ok", "ms", "result"|"error"}."""
+        started = time.perf_counter()
+        args = args or {}
+        try:
+            if not isinstance(cmd, str) or not cmd:
+                raise CommandError("missing cmd")
+            if not isinstance(args, dict):
+                raise CommandError("args must be an object")
+            result = self._dispatch(client, cmd, args, protocol)
+            out = {"ok": True, "result": result}
+        except CommandError as e:
+            out = {"ok": False, "error": str(e)}
+        except Exception as e:
+            self.logger.exception(f"Command '{cmd}' failed")
+            out = {"ok": False, "error": f"{e.__class__.__name__}: {e}"}
+        out["ms"] = round((time.perf_counter() - started) * 1000, 3)
+        return out
+
+    def _dispatch(self, client: _Client, cmd: str, args: Dict, protocol: int):
+        if cmd == "ping":
+            return "pong"
+        if cmd == "hello":
+            return {"protocol": PROTOCOL_VERSION,
+                    "commands": sorted(set(self.handlers) | {"hello", "ping", "subscribe"})}
+        if cmd == "subscribe":
+            if args.get("topic", "mode") != "mode":
+                raise CommandError(f"unknown topic: {args.get('topic')}")
+            client.subscribed = True
+            client.protocol = protocol
+            client.push_pending = bool(self.mode)
+            return None
+
+        fn = self.handlers.get(cmd)
+        if fn is None:
+            raise CommandError(f"unknown command: {cmd}")
+        # Bad arguments are the client's error; a TypeError from inside the handler is a bug
+        try:
+            inspect.signature(fn).bind(**args)
+        except TypeError as e:
+            raise CommandError(f"bad arguments for {cmd}: {e}")
+        except ValueError:
+            pass  # no introspectable signature (builtins): let the call decide
+        self.logger.debug(f"Command received: {cmd} {args or ''}")
+        # Traced from arrival, so waiting for _handle_lock counts as queueing
+        trace_id = tracer.begin("command", cmd)
+        try:
+            with tracer.activate(trace_id), self._handle_lock:
+                return fn(**args)
+        finally:
+            tracer.drop_undispatched(trace_id)
+
+    # ------------------------------------------------------------------
+    #   Protocol 0 (plain text lines)
+    # ------------------------------------------------------------------
+    def _handle_text(self, client: _Client, text: str):
+        if text == "ping":
+            return "pong"
+        if text == "subscribe mode":
+            response = self._run(client, "subscribe", {"topic": "mode"}, protocol=0)
+        else:
+            response = self._run(client, text, {}, protocol=0)
+        if response["ok"]:
+            return f"ok {text}"
+        return f"err {text} {response['error']}"
@@ -1,17 +1,267 @@
 # event_bus.py
-from collections import defaultdict
+#
+# Topic-based publish/subscribe with per-subscriber delivery modes:
+#
+#   INLINE  - called on the publisher's thread (cheap handlers only)
+#   QUEUED  - FIFO per subscriber, drained on the bus worker pool; order is
+#             kept per subscriber, slow subscribers never block others
+#   LATEST  - coalescing: only the newest value is delivered, intermediate
+#             values are dropped while the handler is busy (UI refreshes)
+#
+# Handler exceptions are logged and counted, never propagated to the
+# publisher. Per-topic metrics (publish rate, handler latency, queue depth,
+# drops, errors) are available from stats(). Blinker signals (e.g. the
+# VolumioListener ones) can be bridged onto topics with bridge_signal().
+import logging
+import threading
+import time
+from collections import defaultdict, deque
+from concurrent.futures import ThreadPoolExecutor
+
+INLINE = "inline"
+QUEUED = "queued"
+LATEST = "latest"
+
+logger = logging.getLogger("EventBus")
+
+
+class TopicMetrics:
+    """Counters for one topic. Updated under the bus metrics lock."""
 
-class EventBus:
     def __init__(self):
-        self.listeners = defaultdict(list)
+        self.published = 0
+        self.delivered = 0
+        self.errors = 0
+        self.dropped = 0
+        self.queue_depth = 0
+        self.max_queue_depth = 0
+        self.handler_ms_total = 0.0
+        self.handler_ms_max = 0.0
+        self.rate = 0.0                 # publishes/s over the last full window
+        self._window_start = time.monotonic()
+        self._window_count = 0
+
+    def on_publish(self):
+        self.published += 1
+        self._window_count += 1
+        now = time.monotonic()
+        elapsed = now - self._window_start
+        if elapsed >= 1.0:
+            self.rate = self._window_count / elapsed
+            self._window_start = now
+            self._window_count = 0
+
+    def on_handled(self, ms, ok):
+        self.delivered += 1
+        if not ok:
+            self.errors += 1
+        self.handler_ms_total += ms
+        if ms > self.handler_ms_max:
+            self.handler_ms_max = ms
+
+    def snapshot(self):
+        return {
+            "published": self.published,
+            "rate": round(self.rate, 2),
+            "delivered": self.delivered,
+            "errors": self.errors,
+            "dropped": self.dropped,
+            "queue_depth": self.queue_depth,
+            "max_queue_depth": self.max_queue_depth,
+            "handler_ms_avg": round(self.handler_ms_total / self.delivered, 3) if self.delivered else 0.0,
+            "handler_ms_max": round(self.handler_ms_max, 3),
+        }
+
+
+class Subscription:
+    def __init__(self, bus, topic, callback, mode, priority, name, max_queue):
+        self.bus = bus
+        self.topic = topic
+        self.callback = callback
+        self.mode = mode
+        self.priority = priority
+        self.name = name or getattr(callback, "__qualname__", repr(callback))
+        self.max_queue = max_queue
+        self.active = True
+        self._lock = threading.Lock()
+        self._queue = deque()
+        self._latest = None
+        self._has_latest = False
+        self._draining = False
+
+    def unsubscribe(self):
+        self.bus.unsubscribe(self.topic, self)
+
+    # ---------------- delivery ----------------
+
+    def deliver(self, data):
+        if self.mode == INLINE:
+            self._run(data)
+            return
+
+        with self._lock:
+            if self.mode == LATEST:
+                if self._has_latest:
+                    self.bus._count_drop(self.topic)
+                else:
+                    self.bus._adjust_depth(self.topic, +1)
+                self._latest = data
+                self._has_latest = True
+            else:
+                if len(self._queue) >= self.max_queue:
+                    self._queue.popleft()
+                    self.bus._count_drop(self.topic)
+                    self.bus._adjust_depth(self.topic, -1)
+                self._queue.append(data)
+                self.bus._adjust_depth(self.topic, +1)
+            if self._draining:
+                return
+            self._draining = True
+        self.bus._submit(self._drain)
+
+    def _drain(self):
+        while self.active:
+            with self._lock:
+                if self.mode == LATEST:
+                    if not self._has_latest:
+                        self._draining = False
+                        return
+                    data, self._latest, self._has_latest = self._latest, None, False
+                else:
+                    if not self._queue:
+                        self._draining = False
+                        return
+                    data = self._queue.popleft()
+                self.bus._adjust_depth(self.topic, -1)
+            self._run(data)
+        with self._lock:
+            self._draining = False
+
+    def _run(self, data):
+        t0 = time.perf_counter()
+        ok = True
+        try:
+            self.callback(data)
+        except Exception:
+            ok = False
+            logger.exception(f"Handler '{self.name}' failed on topic '{self.topic}'")
+        self.bus._record(self.topic, (time.perf_counter() - t0) * 1000.0, ok)
+
 
-    def subscribe(self, event_type, callback):
-        self.listeners[event_type].append(callback)
+class EventBus:
+    def __init__(self, workers=4, max_queue=256):
+        self.listeners = defaultdict(list)      # topic -> [Subscription], highest priority first
+        self.metrics = defaultdict(TopicMetrics)
+        self.max_queue = max_queue
+        self._workers = workers
+        self._pool = None
+        self._lock = threading.Lock()
+        self._metrics_lock = threading.Lock()
+        self._bridges = []
+
+    # ---------------- subscribe / publish ----------------
+
+    def subscribe(self, event_type, callback, mode=INLINE, priority=0, name=None, max_queue=None):
+        """
+        Register callback(data) for event_type. Higher priority subscribers are
+        dispatched first. Returns a Subscription (use .unsubscribe()).
+        """
+        if mode not in (INLINE, QUEUED, LATEST):
+            raise ValueError(f"Unknown delivery mode: {mode}")
+        sub = Subscription(self, event_type, callback, mode, priority, name, max_queue or self.max_queue)
+        with self._lock:
+            subs = list(self.listeners[event_type])
+            subs.append(sub)
+            subs.sort(key=lambda s: -s.priority)  # stable: equal priorities keep subscribe order
+            self.listeners[event_type] = subs
+        return sub
+
+    def unsubscribe(self, event_type, callback_or_subscription):
+        with self._lock:
+            kept = []
+            for sub in self.listeners.get(event_type, []):
+                if sub is callback_or_subscription or sub.callback == callback_or_subscription:
+                    sub.active = False
+                else:
+                    kept.append(sub)
+            self.listeners[event_type] = kept
 
     def publish(self, event_type, data=None):
-        for callback in self.listeners[event_type]:
-            callback(data)
+        """Dispatch data to every subscriber of event_type. Never raises."""
+        subs = self.listeners.get(event_type, ())
+        with self._metrics_lock:
+            self.metrics[event_type].on_publish()
+        for sub in subs:
+            sub.deliver(data)
+
+    # ---------------- blinker bridges ----------------
+
+    def bridge_signal(self, signal, event_type, extract=None):
+        """
+        Republish a blinker Signal on event_type. By default the payload is the
+        single keyword argument sent with the signal (or a dict of all of them,
+        or None if there are none); pass extract(sender, **kwargs) to override.
+        """
+        def _receiver(sender, **kwargs):
+            if extract is not None:
+                data = extract(sender, **kwargs)
+            elif len(kwargs) == 1:
+                data = next(iter(kwargs.values()))
+            else:
+                data = kwargs or None
+            self.publish(event_type, data)
+
+        signal.connect(_receiver, weak=False)
+        self._bridges.append((signal, _receiver))
+        return _receiver
+
+    def bridge_listener(self, volumio_listener, prefix="volumio"):
+        """Bridge the VolumioListener signals onto '<prefix>.<name>' topics."""
+        self.bridge_signal(volumio_listener.state_changed, f"{prefix}.state")
+        self.bridge_signal(volumio_listener.track_changed, f"{prefix}.track")
+        self.bridge_signal(volumio_listener.connected, f"{prefix}.connected")
+        self.bridge_signal(volumio_listener.disconnected, f"{prefix}.disconnected")
+        self.bridge_signal(volumio_listener.navigation_received, f"{prefix}.navigation")
+        self.bridge_signal(volumio_listener.toast_message_received, f"{prefix}.toast")
+
+    # ---------------- metrics ----------------
+
+    def stats(self):
+        """{topic: metrics dict} snapshot."""
+        with self._metrics_lock:
+            return {topic: m.snapshot() for topic, m in self.metrics.items()}
+
+    def _record(self, topic, ms, ok):
+        with self._metrics_lock:
+            self.metrics[topic].on_handled(ms, ok)
+
+    def _adjust_depth(self, topic, delta):
+        with self._metrics_lock:
+            m = self.metrics[topic]
+            m.queue_depth += delta
+            if m.queue_depth > m.max_queue_depth:
+                m.max_queue_depth = m.queue_depth
+
+    def _count_drop(self, topic):
+        with self._metrics_lock:
+            self.metrics[topic].dropped += 1
+
+    # ---------------- worker pool ----------------
+
+    def _submit(self, fn):
+        if self._pool is None:
+            with self._lock:
+                if self._pool is None:
+                    self._pool = ThreadPoolExecutor(max_workers=self._workers, thread_name_prefix="EventBus")
+        self._pool.submit(fn)
+
+    def shutdown(self):
+        for signal, receiver in self._bridges:
+            signal.disconnect(receiver)
+        self._bridges.clear()
+        if self._pool is not None:
+            self._pool.shutdown(wait=False)
+            self._pool = None
 
 # Instantiate a global event bus
 bus = EventBus()
-
@@ -1,17 +1,28 @@
 # src/network/service_listener.py
 
 import os
+import json
 import time
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from typing import Optional, Dict, Any, List, Iterable
 
 import requests
 
+from network.async_core import get_network_core
+
 logger = logging.getLogger(__name__)
 
 # Overrideable via env
 VOLUMIO_HOST = os.environ.get("VOLUMIO_HOST", "http://localhost:3000")
 
+# Last good discovery result, used to draw the home menu before Volumio answers
+SNAPSHOT_PATH = os.environ.get(
+    "QUADIFY_SERVICES_SNAPSHOT",
+    os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "cache", "services_snapshot.json"),
+)
+SNAPSHOT_VERSION = 1
+
 
 def _to_icon_url(albumart: Optional[str]) -> Optional[str]:
     """
@@ -72,7 +83,13 @@ def _normalise_entry(item: Dict[str, Any]) -> Dict[str, Any]:
 def _get_json(url: str, retries: int = 3, delay: float = 0.8) -> Dict[str, Any]:
     """
     GET url with a small warm-up retry loop. Raises on final failure.
+    Uses the asyncio network core (non-blocking retries) when it is running.
     """
+    core = get_network_core()
+    if core is not None:
+        fut = core.get_json(url, timeout=6, retries=retries, retry_delay=delay)
+        return fut.result(timeout=max(1, retries) * (6 + delay) + 1)
+
     last_err = None
     for i in range(max(1, retries)):
         try:
@@ -109,10 +126,16 @@ def get_available_services() -> List[Dict[str, Any]]:
     dedup: Dict[str, Dict[str, Any]] = {}
     ordered_labels: List[str] = []
 
-    # ---- Top-level services
+    # Root and Music Library are fetched concurrently; the latter is only used
+    # if the root actually lists a music-library entry.
     logger.info("Requesting Volumio root music services from: %s", root_url)
+    with ThreadPoolExecutor(max_workers=2, thread_name_prefix="ServiceDiscovery") as pool:
+        root_fut = pool.submit(_get_json, root_url, 3, 0.8)
+        musiclib_fut = pool.submit(_get_json, musiclib_url, 3, 0.8)
+
+    # ---- Top-level services
     try:
-        data = _get_json(root_url, retries=3, delay=0.8)
+        data = root_fut.result()
         for item in _iter_services(data.get("navigation", {})):
             entry = _normalise_entry(item)
             lbl = entry["label"]
@@ -131,7 +154,7 @@ def get_available_services() -> List[Dict[str, Any]]:
     if has_musiclib:
         logger.info("Querying inside Music Library for subfolders/services.")
         try:
-            ml_data = _get_json(musiclib_url, retries=3, delay=0.8)
+            ml_data = musiclib_fut.result()
             for item in _iter_services(ml_data.get("navigation", {})):
                 entry = _normalise_entry(item)
                 lbl = entry["label"]
@@ -142,7 +165,54 @@ def get_available_services() -> List[Dict[str, Any]]:
             logger.error("Failed to query Music Library: %s", e)
 
     logger.info("Found %d music services (including subfolders).", len(ordered_labels))
-    return [dedup[lbl] for lbl in ordered_labels]
+    services = [dedup[lbl] for lbl in ordered_labels]
+    if services:
+        save_services_snapshot(services)
+    return services
+
+
+# ----------------------------------------------------------------------
+#   Snapshot (warm start)
+# ----------------------------------------------------------------------
+def load_services_snapshot(path: str = SNAPSHOT_PATH) -> Optional[List[Dict[str, Any]]]:
+    """
+    Return the services saved by the last successful discovery, or None if
+    there is no usable snapshot (missing, corrupt, or taken from another host).
+    """
+    try:
+        with open(path, "r") as f:
+            snap = json.load(f)
+    except FileNotFoundError:
+        return None
+    except Exception as e:
+        logger.warning("Ignoring unreadable services snapshot %s: %s", path, e)
+        return None
+
+    if not isinstance(snap, dict):
+        logger.warning("Ignoring malformed services snapshot %s", path)
+        return None
+    if snap.get("version") != SNAPSHOT_VERSION or snap.get("host") != VOLUMIO_HOST:
+        return None
+    services = snap.get("services")
+    return services if isinstance(services, list) else None
+
+
+def save_services_snapshot(services: List[Dict[str, Any]], path: str = SNAPSHOT_PATH) -> bool:
+    """Atomically write the snapshot; skipped when the service list is unchanged."""
+    if load_services_snapshot(path) == services:
+        return False
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp = path + ".tmp"
+        with open(tmp, "w") as f:
+            json.dump({"version": SNAPSHOT_VERSION, "host": VOLUMIO_HOST,
+                       "saved_at": time.time(), "services": services}, f, indent=2)
+        os.replace(tmp, path)
+        logger.info("Saved services snapshot (%d entries) to %s", len(services), path)
+        return True
+    except Exception as e:
+        logger.warning("Could not write services snapshot %s: %s", path, e)
+        return False
 
 
 if __name__ == "__main__":
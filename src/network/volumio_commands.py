@@ -0,0 +1,143 @@
+# src/network/volumio_commands.py
+
+import logging
+import time
+from typing import Optional, Dict, Any
+
+import requests
+
+
+class VolumioCommandClient:
+    """
+    Transport commands (play, pause, next, seek, ...) for Volumio.
+
+    Commands are emitted over the live socket.io connection held by
+    VolumioListener, which costs a single websocket frame. When the socket
+    is down (or no listener is attached yet) the REST API is used instead,
+    through a keep-alive requests.Session.
+
+    This replaces spawning the `volumio` Node.js CLI for every button press.
+    """
+
+    SEEK_STEP = 10  # seconds, same step as `volumio seek plus|minus`
+
+    def __init__(self, volumio_listener=None, host='localhost', port=3000, http_timeout=2.0):
+        self.logger = logging.getLogger(self.__class__.__name__)
+        self.logger.setLevel(logging.INFO)
+
+        self.volumio_listener = volumio_listener
+        self.base_url = f"http://{host}:{port}"
+        self.http_timeout = http_timeout
+        self.session = requests.Session()
+
+    def attach_listener(self, volumio_listener):
+        """Use this listener's socket for commands from now on."""
+        self.volumio_listener = volumio_listener
+
+    # ------------------------------------------------------------------
+    #   Transport
+    # ------------------------------------------------------------------
+    def _socket_ready(self) -> bool:
+        listener = self.volumio_listener
+        try:
+            return bool(listener and listener.is_connected())
+        except Exception:
+            return False
+
+    def _send(self, event: str, data: Any, cmd: str, params: Optional[Dict[str, Any]] = None) -> bool:
+        """
+        Emit `event` on the socket if connected, else call the REST command `cmd`.
+        Returns True if the command was handed to Volumio.
+        """
+        t0 = time.monotonic()
+        if self._socket_ready():
+            try:
+                if data is None:
+                    self.volumio_listener.socketIO.emit(event)
+                else:
+                    self.volumio_listener.socketIO.emit(event, data)
+                self.logger.debug(f"[socket] {event} {data!r} in {(time.monotonic() - t0) * 1000:.1f} ms")
+                return True
+            except Exception as e:
+                self.logger.warning(f"Socket emit '{event}' failed, falling back to HTTP: {e}")
+
+        query = {"cmd": cmd}
+        if params:
+            query.update(params)
+        try:
+            resp = self.session.get(f"{self.base_url}/api/v1/commands/", params=query, timeout=self.http_timeout)
+            resp.raise_for_status()
+            self.logger.debug(f"[http] {query} in {(time.monotonic() - t0) * 1000:.1f} ms")
+            return True
+        except Exception as e:
+            self.logger.error(f"Command '{cmd}' failed: {e}")
+            return False
+
+    def _current_state(self) -> Dict[str, Any]:
+        if self.volumio_listener:
+            try:
+                return self.volumio_listener.get_current_state() or {}
+            except Exception:
+                pass
+        return self.get_state()
+
+    def get_state(self) -> Dict[str, Any]:
+        """Fetch the player state over HTTP (used when the socket is unavailable)."""
+        try:
+            resp = self.session.get(f"{self.base_url}/api/v1/getState", timeout=self.http_timeout)
+            resp.raise_for_status()
+            return resp.json() or {}
+        except Exception as e:
+            self.logger.debug(f"getState over HTTP failed: {e}")
+            return {}
+
+    # ------------------------------------------------------------------
+    #   Commands
+    # ------------------------------------------------------------------
+    def play(self):
+        return self._send("play", None, "play")
+
+    def pause(self):
+        return self._send("pause", None, "pause")
+
+    def toggle(self):
+        return self._send("toggle", None, "toggle")
+
+    def stop(self):
+        return self._send("stop", None, "stop")
+
+    def next(self):
+        return self._send("next", None, "next")
+
+    def previous(self):
+        return self._send("prev", None, "prev")
+
+    def seek(self, position):
+        """Seek to an absolute position in seconds."""
+        position = max(0, int(position))
+        return self._send("seek", position, "seek", {"position": position})
+
+    def seek_relative(self, delta=SEEK_STEP):
+        """Seek forwards (positive) or backwards (negative) from the current position."""
+        state = self._current_state()
+        position = (state.get("seek") or 0) / 1000.0
+        received_at = getattr(self.volumio_listener, "state_received_at", None)
+        if received_at and str(state.get("status", "")).lower() == "play":
+            position += time.monotonic() - received_at
+        duration = state.get("duration") or 0
+        target = position + delta
+        if duration:
+            target = min(target, duration)
+        return self.seek(target)
+
+    def random(self, value=None):
+        """Set shuffle on/off; toggles the current setting when value is None."""
+        if value is None:
+            value = not bool(self._current_state().get("random"))
+        return self._send("setRandom", {"value": bool(value)}, "random", {"value": str(bool(value)).lower()})
+
+    def repeat(self, value=None):
+        """Set repeat on/off; toggles the current setting when value is None."""
+        if value is None:
+            value = not bool(self._current_state().get("repeat"))
+        return self._send("setRepeat", {"value": bool(value)}, "repeat", {"value": str(bool(value)).lower()})
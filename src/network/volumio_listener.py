@@ -7,9 +7,11 @@ import threading
 from blinker import Signal
 
 class VolumioListener:
-    def __init__(self, host='localhost', port=3000, reconnect_delay=5):
+    def __init__(self, host='localhost', port=3000, reconnect_delay=5, network_core=None):
         """
         Initialize the VolumioListener.
+        If an AsyncNetworkCore is given, the socket.io client runs on its event
+        loop and reconnects are scheduled there instead of on sleeper threads.
         """
         self.logger = logging.getLogger("VolumioListener")
 
@@ -19,7 +21,11 @@ class VolumioListener:
         self.host = host
         self.port = port
         self.reconnect_delay = reconnect_delay
-        self.socketIO = socketio.Client(logger=False, engineio_logger=False, reconnection=True)
+        self.network_core = network_core
+        if network_core is not None:
+            self.socketIO = network_core.socketio_client(reconnection=True)
+        else:
+            self.socketIO = socketio.Client(logger=False, engineio_logger=False, reconnection=True)
 
         # Define Blinker signals
         self.connected = Signal('connected')
@@ -45,6 +51,7 @@ class VolumioListener:
         self.current_state = {}
         self.state_lock = threading.Lock()
         self.current_volume = None 
+        self.state_received_at = None  # time.monotonic() of the last pushState
         self._running = True
         self._reconnect_attempt = 1
 
@@ -146,7 +153,7 @@ class VolumioListener:
         self._reconnect_attempt = 1  # Reset reconnect attempts
         self.socketIO.emit('getState')
         # Explicitly browse root after connect (wait a fraction of a second for socket to settle)
-        threading.Timer(0.2, lambda: self.fetch_browse_library("")).start()
+        self._call_later(0.2, self.fetch_browse_library, "")
 
 
     def is_connected(self):
@@ -163,11 +170,13 @@ class VolumioListener:
         self.logger.info("[VolumioListener] Received pushBrowseSources event.")
         # Optionally: log the new sources for debug
         self.logger.debug(f"[VolumioListener] Sources: {data}")
-        # Now trigger your menu to refresh.
-        # This could be via a direct reference, signal, or callback—see below!
-        if hasattr(self, "menu_manager"):
-            self.menu_manager.refresh_main_menu()
-            self.menu_manager.display_menu()
+        # Now trigger your menu to refresh. MenuManager is built on first use: only
+        # refresh one that already exists (a later build discovers services itself)
+        screens = getattr(getattr(self, "mode_manager", None), "screens", None)
+        menu_manager = screens.peek("menu_manager") if screens is not None else getattr(self, "menu_manager", None)
+        if menu_manager is not None:
+            menu_manager.refresh_main_menu()
+            menu_manager.display_menu()
         else:
             # Or use a signal if you wire it that way
             if hasattr(self, "sources_changed"):
@@ -177,19 +186,28 @@ class VolumioListener:
         """Schedule a reconnection attempt."""
         delay = min(self.reconnect_delay * self._reconnect_attempt, 60)
         self.logger.info(f"[VolumioListener] Reconnecting in {delay} seconds...")
-        threading.Thread(target=self._reconnect_after_delay, args=(delay,), daemon=True).start()
+        self._call_later(delay, self._reconnect)
 
-    def _reconnect_after_delay(self, delay):
-        """Reconnect after a specified delay."""
-        time.sleep(delay)
+    def _reconnect(self):
+        """Reconnect attempt (runs after the scheduled delay)."""
         if not self.socketIO.connected and self._running:
             self._reconnect_attempt += 1
             self.connect()
 
+    def _call_later(self, delay, fn, *args):
+        """Run fn(*args) after `delay` seconds, on the network core when there is one."""
+        if self.network_core is not None:
+            return self.network_core.call_later(delay, fn, *args)
+        timer = threading.Timer(delay, fn, args=args)
+        timer.daemon = True
+        timer.start()
+        return timer
+
     def on_push_state(self, data):
         self.logger.info("[VolumioListener] Received pushState event.")
         with self.state_lock:
             self.current_state = data  # Store the current state
+            self.state_received_at = time.monotonic()
             if "volume" in data:
                 self.current_volume = data["volume"]
         self.state_changed.send(self, state=data)